@@ -1,44 +1,91 @@
-"""Hardware-specific layout definitions."""
+"""Hardware-specific layout definitions.
 
-from calypso.hardware.atlas3 import (
-    BoardProfile,
-    CONNECTOR_MAP,
-    ConnectorInfo,
-    PROFILE_80,
-    PROFILE_144,
-    STATION_MAP,
-    StationInfo,
-    connector_for_port,
-    get_board_profile,
-    port_register_base,
-    station_for_port,
-    station_register_base,
-)
-from calypso.hardware.atlas3_phy import (
-    PhyCmdStatusBits,
-    PhyCmdStatusRegister,
-    PortControlRegister,
-    SerDesDiagnosticRegister,
-    TestPatternRate,
-    UTP_PRESET_NAMES,
-    UTPTestResult,
-    UserTestPattern,
-    VendorPhyRegs,
-    get_quad_diag_offset,
-    get_utp_preset,
-)
-from calypso.hardware.pcie_registers import (
-    AERCapability,
-    CorrErrBits,
-    ExtCapabilityID,
-    PCIeCapability,
-    PCIeCapabilityID,
-    PCIeConfigSpace,
-    PCIeLinkSpeed,
-    PCIeLinkWidth,
-    PhysLayer64GT,
-    UncorrErrBits,
-)
+Submodules are imported on first attribute access (PEP 562), so importing
+one of them -- e.g. ``calypso.hardware.atlas3`` -- does not also pay for
+the register definitions in the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from calypso.hardware.atlas3 import (
+        BoardProfile,
+        CONNECTOR_MAP,
+        ConnectorInfo,
+        PROFILE_80,
+        PROFILE_144,
+        STATION_MAP,
+        StationInfo,
+        connector_for_port,
+        get_board_profile,
+        port_register_base,
+        station_for_port,
+        station_register_base,
+    )
+    from calypso.hardware.atlas3_phy import (
+        PhyCmdStatusBits,
+        PhyCmdStatusRegister,
+        PortControlRegister,
+        SerDesDiagnosticRegister,
+        TestPatternRate,
+        UTP_PRESET_NAMES,
+        UTPTestResult,
+        UserTestPattern,
+        VendorPhyRegs,
+        get_quad_diag_offset,
+        get_utp_preset,
+    )
+    from calypso.hardware.pcie_registers import (
+        AERCapability,
+        CorrErrBits,
+        ExtCapabilityID,
+        PCIeCapability,
+        PCIeCapabilityID,
+        PCIeConfigSpace,
+        PCIeLinkSpeed,
+        PCIeLinkWidth,
+        PhysLayer64GT,
+        UncorrErrBits,
+    )
+
+_LAZY_ATTRS: dict[str, str] = {
+    "BoardProfile": "calypso.hardware.atlas3",
+    "CONNECTOR_MAP": "calypso.hardware.atlas3",
+    "ConnectorInfo": "calypso.hardware.atlas3",
+    "PROFILE_144": "calypso.hardware.atlas3",
+    "PROFILE_80": "calypso.hardware.atlas3",
+    "STATION_MAP": "calypso.hardware.atlas3",
+    "StationInfo": "calypso.hardware.atlas3",
+    "connector_for_port": "calypso.hardware.atlas3",
+    "get_board_profile": "calypso.hardware.atlas3",
+    "port_register_base": "calypso.hardware.atlas3",
+    "station_for_port": "calypso.hardware.atlas3",
+    "station_register_base": "calypso.hardware.atlas3",
+    "PhyCmdStatusBits": "calypso.hardware.atlas3_phy",
+    "PhyCmdStatusRegister": "calypso.hardware.atlas3_phy",
+    "PortControlRegister": "calypso.hardware.atlas3_phy",
+    "SerDesDiagnosticRegister": "calypso.hardware.atlas3_phy",
+    "TestPatternRate": "calypso.hardware.atlas3_phy",
+    "UTPTestResult": "calypso.hardware.atlas3_phy",
+    "UTP_PRESET_NAMES": "calypso.hardware.atlas3_phy",
+    "UserTestPattern": "calypso.hardware.atlas3_phy",
+    "VendorPhyRegs": "calypso.hardware.atlas3_phy",
+    "get_quad_diag_offset": "calypso.hardware.atlas3_phy",
+    "get_utp_preset": "calypso.hardware.atlas3_phy",
+    "AERCapability": "calypso.hardware.pcie_registers",
+    "CorrErrBits": "calypso.hardware.pcie_registers",
+    "ExtCapabilityID": "calypso.hardware.pcie_registers",
+    "PCIeCapability": "calypso.hardware.pcie_registers",
+    "PCIeCapabilityID": "calypso.hardware.pcie_registers",
+    "PCIeConfigSpace": "calypso.hardware.pcie_registers",
+    "PCIeLinkSpeed": "calypso.hardware.pcie_registers",
+    "PCIeLinkWidth": "calypso.hardware.pcie_registers",
+    "PhysLayer64GT": "calypso.hardware.pcie_registers",
+    "UncorrErrBits": "calypso.hardware.pcie_registers",
+}
 
 __all__ = [
     "AERCapability",
@@ -75,3 +122,16 @@ __all__ = [
     "station_for_port",
     "station_register_base",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -11,13 +11,17 @@ station/port topology only.
 
 from __future__ import annotations
 
+import functools
 import logging
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Mapping
+from typing import Any, TypeVar
 
+_T = TypeVar("_T")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StationInfo:
     """Static station definition from the Atlas3 User Manual."""
 
@@ -28,7 +32,7 @@ class StationInfo:
     connector_type: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectorInfo:
     """Physical connector to lane/station mapping."""
 
@@ -38,7 +42,7 @@ class ConnectorInfo:
     connector_type: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BoardProfile:
     """Hardware profile for an Atlas3 board variant."""
 
@@ -46,6 +50,46 @@ class BoardProfile:
     chip_name: str
     station_map: Mapping[int, StationInfo]
     connector_map: Mapping[str, ConnectorInfo]
+    # Stations ordered by first port, computed once per profile
+    _ordered_stations: tuple[StationInfo, ...] = field(init=False, repr=False, compare=False)
+    # Dense port-indexed tables for station_for_port()/connector_for_port().
+    # Ports top out at 143, so a tuple subscript beats any search; unmapped
+    # ports (gaps between stations) hold None.
+    _port_to_stn: tuple[StationInfo | None, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _port_to_conn: tuple[ConnectorInfo | None, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        ordered = tuple(sorted(self.station_map.values(), key=lambda s: s.port_range[0]))
+        object.__setattr__(self, "_ordered_stations", ordered)
+        object.__setattr__(
+            self,
+            "_port_to_stn",
+            _dense_port_table((s.port_range, s) for s in ordered),
+        )
+        object.__setattr__(
+            self,
+            "_port_to_conn",
+            _dense_port_table((c.lanes, c) for c in self.connector_map.values()),
+        )
+
+
+def _dense_port_table(entries: Iterable[tuple[tuple[int, int], _T]]) -> tuple[_T | None, ...]:
+    """Expand ``((low, high), value)`` pairs into a tuple indexed by port.
+
+    Where ranges overlap, the first entry wins (matching a linear scan).
+    """
+    table: list[_T | None] = []
+    for (low, high), value in entries:
+        if high >= len(table):
+            table.extend([None] * (high + 1 - len(table)))
+        for port in range(low, high + 1):
+            if table[port] is None:
+                table[port] = value
+    return tuple(table)
 
 logger = logging.getLogger(__name__)
 
@@ -88,12 +132,15 @@ _CONNECTOR_MAP_144: dict[str, ConnectorInfo] = {
     "CN4": ConnectorInfo(lanes=(80, 95), station=5, con_id=4, connector_type="Straddle"),
 }
 
-PROFILE_144 = BoardProfile(
-    name="PCI6-AD-X16HI-BG6-144",
-    chip_name="PEX90144",
-    station_map=MappingProxyType(_STATION_MAP_144),
-    connector_map=MappingProxyType(_CONNECTOR_MAP_144),
-)
+
+def _build_profile_144() -> BoardProfile:
+    return BoardProfile(
+        name="PCI6-AD-X16HI-BG6-144",
+        chip_name="PEX90144",
+        station_map=MappingProxyType(_STATION_MAP_144),
+        connector_map=MappingProxyType(_CONNECTOR_MAP_144),
+    )
+
 
 # ---------------------------------------------------------------------------
 # PEX90080 profile -- PCI6-AD-X16HI-BG6-80 (80 lanes, 4 stations)
@@ -125,12 +172,15 @@ _CONNECTOR_MAP_80: dict[str, ConnectorInfo] = {
     "CN4": ConnectorInfo(lanes=(96, 111), station=6, con_id=4, connector_type="Straddle"),
 }
 
-PROFILE_80 = BoardProfile(
-    name="PCI6-AD-X16HI-BG6-80",
-    chip_name="PEX90080",
-    station_map=MappingProxyType(_STATION_MAP_80),
-    connector_map=MappingProxyType(_CONNECTOR_MAP_80),
-)
+
+def _build_profile_80() -> BoardProfile:
+    return BoardProfile(
+        name="PCI6-AD-X16HI-BG6-80",
+        chip_name="PEX90080",
+        station_map=MappingProxyType(_STATION_MAP_80),
+        connector_map=MappingProxyType(_CONNECTOR_MAP_80),
+    )
+
 
 # ---------------------------------------------------------------------------
 # B0 silicon profiles -- derived from SDK PlxChipGetPortMask() port masks.
@@ -150,12 +200,15 @@ _STATION_MAP_A024: dict[int, StationInfo] = {
     1: StationInfo(id=1, port_range=(24, 31), connector=None, label="Station 1 (partial)"),
 }
 
-PROFILE_A024 = BoardProfile(
-    name="PEX90024",
-    chip_name="PEX90024",
-    station_map=MappingProxyType(_STATION_MAP_A024),
-    connector_map=_EMPTY_CONNECTOR_MAP,
-)
+
+def _build_profile_a024() -> BoardProfile:
+    return BoardProfile(
+        name="PEX90024",
+        chip_name="PEX90024",
+        station_map=MappingProxyType(_STATION_MAP_A024),
+        connector_map=_EMPTY_CONNECTOR_MAP,
+    )
+
 
 # PEX90032 (ChipID 0xA032) -- 2 data stations, ports 0-31
 _STATION_MAP_A032: dict[int, StationInfo] = {
@@ -163,12 +216,15 @@ _STATION_MAP_A032: dict[int, StationInfo] = {
     1: StationInfo(id=1, port_range=(16, 31), connector=None, label="Station 1"),
 }
 
-PROFILE_A032 = BoardProfile(
-    name="PEX90032",
-    chip_name="PEX90032",
-    station_map=MappingProxyType(_STATION_MAP_A032),
-    connector_map=_EMPTY_CONNECTOR_MAP,
-)
+
+def _build_profile_a032() -> BoardProfile:
+    return BoardProfile(
+        name="PEX90032",
+        chip_name="PEX90032",
+        station_map=MappingProxyType(_STATION_MAP_A032),
+        connector_map=_EMPTY_CONNECTOR_MAP,
+    )
+
 
 # PEX90048 (ChipID 0xA048) -- 3 data stations, ports 0-47
 _STATION_MAP_A048: dict[int, StationInfo] = {
@@ -177,12 +233,15 @@ _STATION_MAP_A048: dict[int, StationInfo] = {
     2: StationInfo(id=2, port_range=(32, 47), connector=None, label="Station 2"),
 }
 
-PROFILE_A048 = BoardProfile(
-    name="PEX90048",
-    chip_name="PEX90048",
-    station_map=MappingProxyType(_STATION_MAP_A048),
-    connector_map=_EMPTY_CONNECTOR_MAP,
-)
+
+def _build_profile_a048() -> BoardProfile:
+    return BoardProfile(
+        name="PEX90048",
+        chip_name="PEX90048",
+        station_map=MappingProxyType(_STATION_MAP_A048),
+        connector_map=_EMPTY_CONNECTOR_MAP,
+    )
+
 
 # PEX90064 (ChipID 0xA064) -- 4 data stations, ports 0-31 + 48-79 (skips stn 2)
 _STATION_MAP_A064: dict[int, StationInfo] = {
@@ -192,12 +251,15 @@ _STATION_MAP_A064: dict[int, StationInfo] = {
     4: StationInfo(id=4, port_range=(64, 79), connector=None, label="Station 4"),
 }
 
-PROFILE_A064 = BoardProfile(
-    name="PEX90064",
-    chip_name="PEX90064",
-    station_map=MappingProxyType(_STATION_MAP_A064),
-    connector_map=_EMPTY_CONNECTOR_MAP,
-)
+
+def _build_profile_a064() -> BoardProfile:
+    return BoardProfile(
+        name="PEX90064",
+        chip_name="PEX90064",
+        station_map=MappingProxyType(_STATION_MAP_A064),
+        connector_map=_EMPTY_CONNECTOR_MAP,
+    )
+
 
 # PEX90080-B0 (ChipID 0xA080) -- 5 data stations, ports 0-79
 _STATION_MAP_A080: dict[int, StationInfo] = {
@@ -208,12 +270,15 @@ _STATION_MAP_A080: dict[int, StationInfo] = {
     4: StationInfo(id=4, port_range=(64, 79), connector=None, label="Station 4"),
 }
 
-PROFILE_A080 = BoardProfile(
-    name="PEX90080-B0",
-    chip_name="PEX90080-B0",
-    station_map=MappingProxyType(_STATION_MAP_A080),
-    connector_map=_EMPTY_CONNECTOR_MAP,
-)
+
+def _build_profile_a080() -> BoardProfile:
+    return BoardProfile(
+        name="PEX90080-B0",
+        chip_name="PEX90080-B0",
+        station_map=MappingProxyType(_STATION_MAP_A080),
+        connector_map=_EMPTY_CONNECTOR_MAP,
+    )
+
 
 # PEX90096 (ChipID 0xA096) -- 6 data stations, ports 0-95
 _STATION_MAP_A096: dict[int, StationInfo] = {
@@ -225,12 +290,48 @@ _STATION_MAP_A096: dict[int, StationInfo] = {
     5: StationInfo(id=5, port_range=(80, 95), connector=None, label="Station 5"),
 }
 
-PROFILE_A096 = BoardProfile(
-    name="PEX90096",
-    chip_name="PEX90096",
-    station_map=MappingProxyType(_STATION_MAP_A096),
-    connector_map=_EMPTY_CONNECTOR_MAP,
-)
+
+def _build_profile_a096() -> BoardProfile:
+    return BoardProfile(
+        name="PEX90096",
+        chip_name="PEX90096",
+        station_map=MappingProxyType(_STATION_MAP_A096),
+        connector_map=_EMPTY_CONNECTOR_MAP,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Lazy profile construction
+# ---------------------------------------------------------------------------
+# Profiles (and their dense port tables) are built on first use -- by
+# get_board_profile() or by importing a PROFILE_* name, which goes through the
+# module __getattr__ below -- so importing this module for, say,
+# station_register_base() doesn't build all eight.
+_PROFILE_BUILDERS: dict[str, Callable[[], BoardProfile]] = {
+    "PROFILE_144": _build_profile_144,
+    "PROFILE_80": _build_profile_80,
+    "PROFILE_A024": _build_profile_a024,
+    "PROFILE_A032": _build_profile_a032,
+    "PROFILE_A048": _build_profile_a048,
+    "PROFILE_A064": _build_profile_a064,
+    "PROFILE_A080": _build_profile_a080,
+    "PROFILE_A096": _build_profile_a096,
+}
+
+PROFILE_144: BoardProfile
+PROFILE_80: BoardProfile
+PROFILE_A024: BoardProfile
+PROFILE_A032: BoardProfile
+PROFILE_A048: BoardProfile
+PROFILE_A064: BoardProfile
+PROFILE_A080: BoardProfile
+PROFILE_A096: BoardProfile
+
+
+@functools.cache
+def _profile(name: str) -> BoardProfile:
+    return _PROFILE_BUILDERS[name]()
+
 
 # ---------------------------------------------------------------------------
 # Profile lookup
@@ -238,24 +339,24 @@ PROFILE_A096 = BoardProfile(
 # Broadcom chip-type IDs (from PLX SDK headers).  The SDK returns these as
 # 16-bit values from PlxPci_ChipTypeGet.  We map both the exact ID and common
 # alias values.
-_CHIP_TYPE_TO_PROFILE: dict[int, BoardProfile] = {
-    0x9080: PROFILE_80,
-    0x90A0: PROFILE_80,   # engineering sample alias
-    0xC040: PROFILE_144,  # PLX_FAMILY_ATLAS_3
-    0xC044: PROFILE_144,  # PLX_FAMILY_ATLAS3_LLC
+_CHIP_TYPE_TO_PROFILE: dict[int, str] = {
+    0x9080: "PROFILE_80",
+    0x90A0: "PROFILE_80",   # engineering sample alias
+    0xC040: "PROFILE_144",  # PLX_FAMILY_ATLAS_3
+    0xC044: "PROFILE_144",  # PLX_FAMILY_ATLAS3_LLC
 }
 
 # B0 silicon: keyed by real ChipID (from PLX_DEVICE_KEY.ChipID).
-_CHIP_ID_TO_PROFILE: dict[int, BoardProfile] = {
-    0xA024: PROFILE_A024,
-    0xA032: PROFILE_A032,
-    0xA048: PROFILE_A048,
-    0xA064: PROFILE_A064,
-    0xA080: PROFILE_A080,
-    0xA096: PROFILE_A096,
+_CHIP_ID_TO_PROFILE: dict[int, str] = {
+    0xA024: "PROFILE_A024",
+    0xA032: "PROFILE_A032",
+    0xA048: "PROFILE_A048",
+    0xA064: "PROFILE_A064",
+    0xA080: "PROFILE_A080",
+    0xA096: "PROFILE_A096",
 }
 
-_DEFAULT_PROFILE = PROFILE_144
+_DEFAULT_PROFILE = "PROFILE_144"
 
 
 def get_board_profile(chip_type: int, *, chip_id: int = 0) -> BoardProfile:
@@ -270,28 +371,39 @@ def get_board_profile(chip_type: int, *, chip_id: int = 0) -> BoardProfile:
         chip_type: PlxChip value from ``PlxPci_ChipTypeGet``.
         chip_id: Real ChipID from ``PLX_DEVICE_KEY.ChipID`` (B0 silicon).
     """
-    if chip_id:
-        profile = _CHIP_ID_TO_PROFILE.get(chip_id)
-        if profile is not None:
-            return profile
-
-    profile = _CHIP_TYPE_TO_PROFILE.get(chip_type)
-    if profile is not None:
-        return profile
+    # chip_id 0 ("not reported") is never a key, so it falls through naturally
+    name = _CHIP_ID_TO_PROFILE.get(chip_id) or _CHIP_TYPE_TO_PROFILE.get(chip_type)
+    if name is not None:
+        return _profile(name)
 
+    default = _profile(_DEFAULT_PROFILE)
     if chip_type != 0:
         logger.warning(
             "unknown chip_type 0x%04X (chip_id=0x%04X), defaulting to %s",
-            chip_type, chip_id, _DEFAULT_PROFILE.chip_name,
+            chip_type, chip_id, default.chip_name,
         )
-    return _DEFAULT_PROFILE
+    return default
 
 
 # ---------------------------------------------------------------------------
 # Deprecated aliases (always PEX90144 — use get_board_profile() instead)
 # ---------------------------------------------------------------------------
-STATION_MAP: Mapping[int, StationInfo] = PROFILE_144.station_map  # deprecated
-CONNECTOR_MAP: Mapping[str, ConnectorInfo] = PROFILE_144.connector_map  # deprecated
+# Resolved lazily by __getattr__, like the PROFILE_* constants.
+STATION_MAP: Mapping[int, StationInfo]  # deprecated
+CONNECTOR_MAP: Mapping[str, ConnectorInfo]  # deprecated
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PROFILE_BUILDERS:
+        value: Any = _profile(name)
+    elif name == "STATION_MAP":
+        value = _profile(_DEFAULT_PROFILE).station_map
+    elif name == "CONNECTOR_MAP":
+        value = _profile(_DEFAULT_PROFILE).connector_map
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
 
 # Per-port PEX register base within BAR 0 (see DrvDefs.h ATLAS_PEX_REGS_BASE_OFFSET)
 # Note: 0x60800000 is the AXI address; BAR 0 offset is 0x800000 (8MB).
@@ -354,12 +466,8 @@ def station_for_port(
     Returns:
         StationInfo if port falls within a known station, else None.
     """
-    stn_map = (profile or _DEFAULT_PROFILE).station_map
-    for stn in stn_map.values():
-        low, high = stn.port_range
-        if low <= port_number <= high:
-            return stn
-    return None
+    table = (profile or _profile(_DEFAULT_PROFILE))._port_to_stn
+    return table[port_number] if 0 <= port_number < len(table) else None
 
 
 def connector_for_port(
@@ -375,9 +483,5 @@ def connector_for_port(
     Returns:
         ConnectorInfo if port maps to a physical connector, else None.
     """
-    conn_map = (profile or _DEFAULT_PROFILE).connector_map
-    for conn in conn_map.values():
-        low, high = conn.lanes
-        if low <= port_number <= high:
-            return conn
-    return None
+    table = (profile or _profile(_DEFAULT_PROFILE))._port_to_conn
+    return table[port_number] if 0 <= port_number < len(table) else None
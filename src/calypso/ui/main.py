@@ -9,6 +9,8 @@ from pathlib import Path
 from fastapi import FastAPI
 from nicegui import app, ui
 
+from calypso.ui.services import api
+
 _STATIC_DIR = Path(__file__).parent / "static"
 
 
@@ -17,6 +19,10 @@ def setup_ui(fastapi_app: FastAPI) -> None:
 
     app.add_static_files("/static", str(_STATIC_DIR))
 
+    # Pages call the REST API in-process rather than via browser fetch()
+    api.bind_app(fastapi_app)
+    app.on_shutdown(api.close)
+
     @ui.page("/")
     def index():
         from calypso.ui.pages.auto_discovery import auto_discovery_page
@@ -7,13 +7,16 @@ applies dark mode and global CSS directly.
 
 from __future__ import annotations
 
-import asyncio
 import sys
 
 from nicegui import ui
 
 from calypso.hardware.atlas3 import get_board_profile
-from calypso.ui.services.pcie import DriverSetupError, connect_pcie_device, scan_pcie_devices
+from calypso.ui.services.pcie import (
+    DriverSetupError,
+    connect_pcie_device_async,
+    scan_pcie_devices_async,
+)
 from calypso.ui.theme import COLORS, GLOBAL_CSS
 from calypso.utils.logging import get_logger
 
@@ -65,7 +68,7 @@ async def _run_auto_discovery(status_area: ui.column) -> None:
         return
 
     try:
-        devices = await asyncio.to_thread(scan_pcie_devices)
+        devices = await scan_pcie_devices_async()
     except DriverSetupError as exc:
         _show_driver_error(status_area, str(exc))
         return
@@ -81,7 +84,7 @@ async def _run_auto_discovery(status_area: ui.column) -> None:
     if len(devices) == 1:
         _show_connecting(status_area)
         try:
-            device_id = await asyncio.to_thread(connect_pcie_device, 0)
+            device_id = await connect_pcie_device_async(0)
             ui.navigate.to(f"/switch/{device_id}")
         except Exception as exc:
             logger.error("auto_connect_failed", error=str(exc))
@@ -235,7 +238,7 @@ async def _on_connect_click(area: ui.column, device_index: int) -> None:
     """Handle connect button click for multi-device selector."""
     _show_connecting(area)
     try:
-        device_id = await asyncio.to_thread(connect_pcie_device, device_index)
+        device_id = await connect_pcie_device_async(device_index)
         ui.navigate.to(f"/switch/{device_id}")
     except Exception as exc:
         logger.error("connect_failed", error=str(exc), index=device_index)
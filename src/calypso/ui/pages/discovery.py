@@ -11,7 +11,7 @@ from calypso.hardware.atlas3 import get_board_profile
 from calypso.mcu import pool
 from calypso.mcu.client import McuClient
 from calypso.ui.layout import page_layout
-from calypso.ui.services.pcie import connect_pcie_device, scan_pcie_devices
+from calypso.ui.services.pcie import connect_pcie_device_async, scan_pcie_devices_async
 from calypso.ui.theme import COLORS
 from calypso.utils.logging import get_logger
 
@@ -99,9 +99,7 @@ def _discovery_content() -> None:
 
                         async def _connect_click(_e, device_index=idx):
                             try:
-                                device_id = await asyncio.to_thread(
-                                    connect_pcie_device, device_index
-                                )
+                                device_id = await connect_pcie_device_async(device_index)
                                 ui.navigate.to(f"/switch/{device_id}")
                             except Exception as exc:
                                 logger.error(
@@ -125,7 +123,7 @@ def _discovery_content() -> None:
         if sys.platform not in ("win32", "linux"):
             return
         try:
-            devices = await asyncio.to_thread(scan_pcie_devices)
+            devices = await scan_pcie_devices_async()
             if devices:
                 _show_pcie_results(devices)
         except Exception:
@@ -9,6 +9,12 @@ from nicegui import ui
 from calypso.ui.layout import page_layout
 from calypso.ui.theme import COLORS
 
+# is_link_up -> (status color, icon, status text)
+_PORT_STATUS: dict[bool, tuple[str, str, str]] = {
+    True: (COLORS.green, "link", "Link Up"),
+    False: (COLORS.text_muted, "link_off", "Link Down"),
+}
+
 
 def ports_page(device_id: str) -> None:
     """Render the port status page."""
@@ -122,15 +128,7 @@ def ports_page(device_id: str) -> None:
 
         def _render_port_card(port):
             """Render a single port status card."""
-            # Determine status color
-            if port.is_link_up:
-                status_color = COLORS.green
-                status_icon = "link"
-                status_text = "Link Up"
-            else:
-                status_color = COLORS.text_muted
-                status_icon = "link_off"
-                status_text = "Link Down"
+            status_color, status_icon, status_text = _PORT_STATUS[bool(port.is_link_up)]
 
             with ui.card().classes("p-3").style(
                 f"background: {COLORS.bg_card}; border: 1px solid {COLORS.border}"
@@ -2,70 +2,289 @@
 
 from __future__ import annotations
 
+import json
+from collections import defaultdict
+from html import escape
+from typing import NamedTuple
+
 from nicegui import ui
 
 from calypso.hardware.atlas3 import (
     BoardProfile,
+    ConnectorInfo,
     PROFILE_144,
+    connector_for_port,
     get_board_profile,
 )
 from calypso.ui.layout import page_layout
-from calypso.ui.theme import COLORS
+from calypso.ui.theme import (
+    COLORS,
+    STYLE_BLUE,
+    STYLE_GREEN,
+    STYLE_RED,
+    STYLE_TEXT_MUTED,
+    STYLE_TEXT_PRIMARY,
+)
+from calypso.utils.logging import get_logger
 
+logger = get_logger(__name__)
 
-def _build_connector_ref(profile: BoardProfile) -> list[dict]:
-    """Build connector reference table rows from a board profile."""
-    return [
-        {
-            "name": cn_name,
-            "type": info.connector_type or "Unknown",
-            "station": info.station,
-            "lanes": f"{info.lanes[0]}-{info.lanes[1]}",
-            "width": f"x{info.lanes[1] - info.lanes[0] + 1}",
-            "con_id": info.con_id,
-        }
+# Port tiles rendered per grid before the rest are collapsed behind "+N more"
+_PORT_GRID_VISIBLE_CAP = 16
+
+# Max age of a sessionStorage topology snapshot used to hydrate the page on mount
+_TOPOLOGY_CACHE_TTL_MS = 5 * 60 * 1000
+
+# Static styles, built once from the theme instead of per element per render
+_STYLE_CARD = f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}"
+_STYLE_TITLE = f"color: {COLORS.text_primary}"
+_STYLE_BOLD = f"color: {COLORS.text_primary}; font-weight: bold"
+_STYLE_MUTED = f"color: {COLORS.text_muted}"
+_STYLE_MUTED_ITALIC = f"color: {COLORS.text_muted}; font-style: italic;"
+_STYLE_MUTED_12 = f"color: {COLORS.text_muted}; font-size: 12px"
+_STYLE_SECONDARY_12 = f"color: {COLORS.text_secondary}; font-size: 12px"
+_STYLE_SPEED = f"color: {COLORS.blue}; font-size: 12px"
+_STYLE_STN_ID = f"color: {COLORS.blue}"
+_STYLE_STN_BADGE = f"color: {COLORS.purple}"
+_STYLE_GROUP_NAME = f"color: {COLORS.orange}; font-weight: bold; font-size: 13px"
+_STYLE_PORT_ROLE = f"color: {COLORS.text_secondary}; font-size: 11px"
+_STYLE_DEVICE_BADGE = f"color: {COLORS.cyan}; border-color: {COLORS.cyan}; font-size: 9px"
+_STYLE_DEVICE_ID = f"color: {COLORS.text_muted}; font-size: 9px"
+_STYLE_UP_COUNT = {
+    True: f"color: {COLORS.green}; font-size: 12px",
+    False: f"color: {COLORS.text_muted}; font-size: 12px",
+}
+
+
+def _chip_style(border: str) -> str:
+    """Connector health chip style for a given border color."""
+    return f"background: {COLORS.bg_card}; border: 2px solid {border}; min-width: 140px"
+
+
+def _tile_style(border: str) -> str:
+    """Port tile style for a given border color."""
+    return f"background: {COLORS.bg_card}; border: 2px solid {border}; min-width: 80px"
+
+
+def _chip_html(border: str, icon: str, icon_color: str) -> str:
+    """Connector health chip HTML template for one health state."""
+    return (
+        f'<div class="p-3 rounded" style="{_chip_style(border)}">'
+        '<div class="row items-center gap-2 mb-1">'
+        f'<i class="q-icon notranslate material-icons" style="color: {icon_color}; '
+        f'font-size: 24px">{icon}</i>'
+        f'<span style="{_STYLE_BOLD}">{{name}}</span></div>'
+        f'<div style="{_STYLE_SECONDARY_12}">{{type}} ({{width}})</div>'
+        f'<div style="{_STYLE_SECONDARY_12}">{{up}}/{{total}} ports up</div>'
+        "{speed}</div>"
+    )
+
+
+# (all_up, any_up) -> chip HTML template.  All chips render as one ui.html.
+_CONNECTOR_HEALTH: dict[tuple[bool, bool], str] = {
+    (True, True): _chip_html(COLORS.green, "check_circle", COLORS.green),
+    (False, True): _chip_html(COLORS.yellow, "warning", COLORS.yellow),
+    (False, False): _chip_html(COLORS.border, "cancel", COLORS.red),
+}
+_CHIP_SPEED_HTML = f'<div style="{_STYLE_SPEED}">{{speed}}</div>'
+
+
+def _tile_html(border: str) -> str:
+    """Port tile HTML template for a given border color."""
+    return (
+        f'<div class="p-2 rounded text-center" style="{_tile_style(border)}">'
+        f'<div style="{_STYLE_BOLD}">P{{port_num}}</div>'
+        f'<div style="{_STYLE_PORT_ROLE}">{{role}}</div>'
+        "{status}{device}</div>"
+    )
+
+
+# Port role -> tile HTML template (unknown roles use _TILE_HTML_DEFAULT).
+# Each tile is a single ui.html element rather than a div with 3-5 children.
+_TILE_HTML: dict[str, str] = {
+    "upstream": _tile_html(COLORS.blue),
+    "downstream": _tile_html(COLORS.green),
+}
+_TILE_HTML_DEFAULT = _tile_html(COLORS.border)
+
+_DEVICE_BADGE_HTML = (
+    f'<span class="q-badge q-badge--outline" style="{_STYLE_DEVICE_BADGE}">{{dev_type}}</span>'
+)
+
+_EMPTY_STATION_HTML = (
+    f'<div class="w-full q-px-md q-py-sm rounded-borders" style="{_STYLE_CARD}">'
+    f'<span style="{_STYLE_STN_ID}; font-weight: bold">STN{{stn_idx}}</span> '
+    f'<span style="{_STYLE_TITLE}">{{label}}</span> '
+    f'<span style="{_STYLE_STN_BADGE}">({{connector}})</span> '
+    f'<span style="{_STYLE_MUTED}">No active ports</span></div>'
+)
+
+# is_link_up -> status text style
+_LINK_STATUS_STYLE: dict[bool, str] = {
+    True: f"color: {COLORS.green}; font-size: 11px",
+    False: f"color: {COLORS.red}; font-size: 11px",
+}
+
+
+class ConnectorRef(NamedTuple):
+    """Static connector reference row derived from a board profile."""
+
+    name: str
+    type: str
+    station: int
+    lanes: str
+    width: str
+    con_id: int
+    lane_lo: int
+    lane_hi: int
+
+
+class StationRef(NamedTuple):
+    """Static station reference row derived from a board profile."""
+
+    stn: int
+    label: str
+    ports: str
+    connector: str | None
+
+
+def _build_connector_ref(profile: BoardProfile) -> tuple[ConnectorRef, ...]:
+    """Build connector reference rows from a board profile."""
+    return tuple(
+        ConnectorRef(
+            name=cn_name,
+            type=info.connector_type or "Unknown",
+            station=info.station,
+            lanes=f"{info.lanes[0]}-{info.lanes[1]}",
+            width=f"x{info.lanes[1] - info.lanes[0] + 1}",
+            con_id=info.con_id,
+            lane_lo=info.lanes[0],
+            lane_hi=info.lanes[1],
+        )
         for cn_name, info in sorted(profile.connector_map.items())
-    ]
+    )
+
+
+def _build_station_to_connectors(
+    connector_ref: tuple[ConnectorRef, ...],
+) -> dict[int, tuple[ConnectorRef, ...]]:
+    """Group connector reference rows by station index."""
+    grouped: dict[int, list[ConnectorRef]] = defaultdict(list)
+    for ref in connector_ref:
+        grouped[ref.station].append(ref)
+    return {stn_idx: tuple(refs) for stn_idx, refs in grouped.items()}
+
+
+def _build_station_ref(profile: BoardProfile) -> tuple[StationRef, ...]:
+    """Build station reference rows from a board profile."""
+    return tuple(
+        StationRef(
+            stn=stn_id,
+            label=stn.label,
+            ports=f"{stn.port_range[0]}-{stn.port_range[1]}",
+            connector=stn.connector,
+        )
+        for stn_id, stn in sorted(profile.station_map.items())
+    )
 
 
-def _build_station_ref(profile: BoardProfile) -> list[dict]:
-    """Build station reference table rows from a board profile."""
+def _build_station_ref_rows(profile: BoardProfile) -> list[dict]:
+    """Build the display rows for the station reference table."""
     return [
         {
-            "stn": stn_id,
-            "label": stn.label,
-            "ports": f"{stn.port_range[0]}-{stn.port_range[1]}",
-            "connector": stn.connector,
+            "stn": f"STN{s.stn}",
+            "label": s.label,
+            "ports": s.ports,
+            "connector": s.connector or "-",
         }
-        for stn_id, stn in sorted(profile.station_map.items())
+        for s in _build_station_ref(profile)
     ]
 
 
+class _ProfileView(NamedTuple):
+    """Static per-profile lookups used by the topology page."""
+
+    # ui.table needs mappings rather than NamedTuples
+    connector_rows: list[dict]
+    station_to_connectors: dict[int, tuple[ConnectorRef, ...]]
+    station_ref_rows: list[dict]
+    # Station -> (group labels "CNx [lo:hi]" in lane order, connector ->
+    # label index).  Only stations with more than one connector are present;
+    # others render as a single grid.
+    station_port_groups: dict[int, tuple[tuple[str, ...], dict[ConnectorInfo, int]]]
+
+
+# Board profiles are static, so each profile's view is built once
+_PROFILE_VIEW_CACHE: dict[str, _ProfileView] = {}
+
+
+def _profile_view(profile: BoardProfile) -> _ProfileView:
+    """Return the cached static view for a board profile."""
+    view = _PROFILE_VIEW_CACHE.get(profile.name)
+    if view is None:
+        refs = _build_connector_ref(profile)
+        view = _PROFILE_VIEW_CACHE[profile.name] = _ProfileView(
+            connector_rows=[ref._asdict() for ref in refs],
+            station_to_connectors=_build_station_to_connectors(refs),
+            station_ref_rows=_build_station_ref_rows(profile),
+            station_port_groups=_build_station_port_groups(profile),
+        )
+    return view
+
+
+_CONNECTOR_COLUMNS: list[dict] = [
+    {"name": "name", "label": "Connector", "field": "name", "align": "left"},
+    {"name": "type", "label": "Type", "field": "type", "align": "left"},
+    {"name": "station", "label": "Station", "field": "station", "align": "center"},
+    {"name": "lanes", "label": "Lanes", "field": "lanes", "align": "center"},
+    {"name": "width", "label": "Width", "field": "width", "align": "center"},
+    {"name": "con_id", "label": "CON ID", "field": "con_id", "align": "center"},
+]
+
+_STATION_COLUMNS: list[dict] = [
+    {"name": "stn", "label": "Station", "field": "stn", "align": "left"},
+    {"name": "label", "label": "Purpose", "field": "label", "align": "left"},
+    {"name": "ports", "label": "Port Range", "field": "ports", "align": "center"},
+    {"name": "connector", "label": "Connector", "field": "connector", "align": "center"},
+]
+
+
+# Static block diagrams for boards with a known connector layout, keyed by
+# chip name.  B0 variants fall back to a generated station summary.
+_BLOCK_DIAGRAMS: dict[str, str] = {
+    "PEX90080": """\
+  [Host CPU] &lt;--x16--&gt; [Golden Finger / STN1]
+                               |
+                      [Atlas3 PEX90080 Switch]
+                        /      |       \\
+                  STN0(Int MCIO)  STN2(Ext MCIO)  STN6(Straddle)
+                  CN2[8:15]x8     CN0[40:47]x8     CN4[96:111]x16
+                  CN3[0:7]x8      CN1[32:39]x8""",
+    "PEX90144": """\
+  [Host CPU] &lt;--x16--&gt; [Golden Finger / STN2]
+                               |
+                      [Atlas3 PEX90144 Switch]
+                        /      |       \\
+                  STN0(RC)   STN1(Rsvd)  STN5(Straddle/CN4)
+                                          x16
+                        /               \\
+           STN7(Ext MCIO)            STN8(Int MCIO)
+           CN1[112:119]x8            CN3[128:135]x8
+           CN0[120:127]x8            CN2[136:143]x8""",
+}
+
+_DIAGRAM_STYLE = (
+    f"color: {COLORS.text_secondary}; font-family: 'JetBrains Mono', monospace; "
+    f"font-size: 12px; background: {COLORS.bg_primary}; "
+    f"padding: 12px; border-radius: 4px; line-height: 1.4"
+)
+
+
 def _build_block_diagram(profile: BoardProfile) -> str:
     """Build an ASCII block diagram for the given board profile."""
-    if profile.chip_name == "PEX90080":
-        return (
-            "  [Host CPU] &lt;--x16--&gt; [Golden Finger / STN1]\n"
-            "                               |\n"
-            "                      [Atlas3 PEX90080 Switch]\n"
-            "                        /      |       \\\n"
-            "                  STN0(Int MCIO)  STN2(Ext MCIO)  STN6(Straddle)\n"
-            "                  CN2[8:15]x8     CN0[40:47]x8     CN4[96:111]x16\n"
-            "                  CN3[0:7]x8      CN1[32:39]x8"
-        )
-    if profile.chip_name == "PEX90144":
-        return (
-            "  [Host CPU] &lt;--x16--&gt; [Golden Finger / STN2]\n"
-            "                               |\n"
-            "                      [Atlas3 PEX90144 Switch]\n"
-            "                        /      |       \\\n"
-            "                  STN0(RC)   STN1(Rsvd)  STN5(Straddle/CN4)\n"
-            "                                          x16\n"
-            "                        /               \\\n"
-            "           STN7(Ext MCIO)            STN8(Int MCIO)\n"
-            "           CN1[112:119]x8            CN3[128:135]x8\n"
-            "           CN0[120:127]x8            CN2[136:143]x8"
-        )
+    diagram = _BLOCK_DIAGRAMS.get(profile.chip_name)
+    if diagram is not None:
+        return diagram
     # B0 variants -- connector layout TBD from Broadcom
     stns = sorted(profile.station_map.keys())
     stn_labels = "  ".join(f"STN{s}" for s in stns)
@@ -81,28 +300,72 @@ def topology_page(device_id: str) -> None:
 
     def content():
         topo_data: dict = {}
+        view: dict = {}
         active_profile: list[BoardProfile] = [PROFILE_144]
 
+        cache_key = f"topo:{device_id}"
+        last_sig: list[str | None] = [None]
+
+        def apply_topology(resp: dict) -> None:
+            # Skip the view-model rebuild and DOM refresh when the payload
+            # matches what is on screen
+            sig = json.dumps(resp, sort_keys=True)
+            if sig == last_sig[0]:
+                return
+            last_sig[0] = sig
+
+            topo_data.clear()
+            topo_data.update(resp)
+            _normalize_topology(topo_data)
+
+            chip_type = topo_data.get("chip_id", 0)
+            real_chip_id = topo_data.get("real_chip_id", 0)
+            detected = get_board_profile(chip_type, chip_id=real_chip_id)
+            if detected.chip_name != active_profile[0].chip_name:
+                active_profile[0] = detected
+                refresh_hw_reference()
+
+            view.clear()
+            view.update(_build_topology_view(topo_data, active_profile[0]))
+            refresh_topology()
+
         async def load_topology():
             try:
+                # Only successful responses are cached, so an error body is
+                # never replayed as topology on the next mount
                 resp = await ui.run_javascript(
-                    f'return await (await fetch("/api/devices/{device_id}/topology")).json()',
+                    f'const r = await fetch("/api/devices/{device_id}/topology");'
+                    f'const d = await r.json().catch(() => null);'
+                    f'if (!r.ok) return {{error: (d && d.detail) || `HTTP ${{r.status}}`}};'
+                    f'sessionStorage.setItem("{cache_key}",'
+                    f' JSON.stringify({{ts: Date.now(), data: d}}));'
+                    f'return {{data: d}};',
                     timeout=15.0,
                 )
-                topo_data.clear()
-                topo_data.update(resp)
-
-                chip_type = topo_data.get("chip_id", 0)
-                real_chip_id = topo_data.get("real_chip_id", 0)
-                detected = get_board_profile(chip_type, chip_id=real_chip_id)
-                if detected.chip_name != active_profile[0].chip_name:
-                    active_profile[0] = detected
-                    refresh_hw_reference()
-
-                refresh_topology()
+                if "error" in resp:
+                    ui.notify(f"Error: {resp['error']}", type="negative")
+                    return
+                apply_topology(resp["data"])
             except Exception as e:
                 ui.notify(f"Error: {e}", type="negative")
 
+        async def hydrate_from_cache():
+            """Render the last snapshot from this browser session, then refresh it."""
+            try:
+                cached = await ui.run_javascript(
+                    f'const e = JSON.parse(sessionStorage.getItem("{cache_key}") || "null");'
+                    f'return e && Date.now() - e.ts < {_TOPOLOGY_CACHE_TTL_MS} ? e.data : null;',
+                    timeout=5.0,
+                )
+            except TimeoutError:
+                return  # browser slow or gone; the user can still load manually
+            except Exception as exc:
+                logger.debug("topology_cache_hydrate_failed", error=str(exc))
+                return
+            if cached:
+                apply_topology(cached)
+                await load_topology()
+
         with ui.row().classes("items-center gap-4"):
             ui.button("Load Topology", on_click=load_topology).props("flat color=primary")
 
@@ -125,28 +388,28 @@ def topology_page(device_id: str) -> None:
             topo_container.clear()
             with topo_container:
                 if not topo_data:
-                    with ui.card().classes("w-full p-4").style(
-                        f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}"
-                    ):
+                    with ui.card().classes("w-full p-4").style(_STYLE_CARD):
                         ui.label("Click Load Topology to discover the switch fabric.").style(
-                            f"color: {COLORS.text_muted}"
+                            _STYLE_MUTED
                         )
                     return
 
                 profile = active_profile[0]
-                _render_fabric_summary(topo_data, profile)
-                _render_connector_health(topo_data, profile)
-                _render_station_cards(topo_data, profile)
+                _render_fabric_summary(topo_data, profile, view)
+                _render_connector_health(topo_data, profile, view)
+                _render_station_cards(topo_data, view)
 
         refresh_topology()
+        ui.timer(0.1, hydrate_from_cache, once=True)
 
     page_layout("Switch Topology", content, device_id=device_id)
 
 
 def _render_hardware_reference(profile: BoardProfile) -> None:
     """Render the static Atlas3 hardware reference cards."""
-    connector_ref = _build_connector_ref(profile)
-    station_ref = _build_station_ref(profile)
+    profile_view = _profile_view(profile)
+    connector_rows = profile_view.connector_rows
+    station_rows = profile_view.station_ref_rows
 
     with ui.expansion(
         f"Atlas3 Host Card Reference ({profile.chip_name})",
@@ -158,76 +421,98 @@ def _render_hardware_reference(profile: BoardProfile) -> None:
         with ui.row().classes("w-full gap-4"):
             # Connector reference table
             with ui.column().classes("flex-1"):
-                ui.label("Physical Connectors").style(
-                    f"color: {COLORS.text_primary}; font-weight: bold"
-                )
-                if connector_ref:
-                    columns = [
-                        {"name": "name", "label": "Connector", "field": "name", "align": "left"},
-                        {"name": "type", "label": "Type", "field": "type", "align": "left"},
-                        {"name": "station", "label": "Station", "field": "station", "align": "center"},
-                        {"name": "lanes", "label": "Lanes", "field": "lanes", "align": "center"},
-                        {"name": "width", "label": "Width", "field": "width", "align": "center"},
-                        {"name": "con_id", "label": "CON ID", "field": "con_id", "align": "center"},
-                    ]
+                ui.label("Physical Connectors").style(_STYLE_BOLD)
+                if connector_rows:
                     ui.table(
-                        columns=columns, rows=connector_ref, row_key="name"
+                        columns=_CONNECTOR_COLUMNS, rows=connector_rows, row_key="name"
                     ).classes("w-full")
                 else:
                     ui.label(
                         "Connector layout pending from Broadcom."
-                    ).style(f"color: {COLORS.text_muted}; font-style: italic;")
+                    ).style(_STYLE_MUTED_ITALIC)
 
             # Station reference table
             with ui.column().classes("flex-1"):
-                ui.label("Station Layout").style(
-                    f"color: {COLORS.text_primary}; font-weight: bold"
-                )
-                rows = [
-                    {
-                        "stn": f"STN{s['stn']}",
-                        "label": s["label"],
-                        "ports": s["ports"],
-                        "connector": s["connector"] or "-",
-                    }
-                    for s in station_ref
-                ]
-                columns = [
-                    {"name": "stn", "label": "Station", "field": "stn", "align": "left"},
-                    {"name": "label", "label": "Purpose", "field": "label", "align": "left"},
-                    {"name": "ports", "label": "Port Range", "field": "ports", "align": "center"},
-                    {"name": "connector", "label": "Connector", "field": "connector", "align": "center"},
-                ]
-                ui.table(columns=columns, rows=rows, row_key="stn").classes("w-full")
+                ui.label("Station Layout").style(_STYLE_BOLD)
+                ui.table(
+                    columns=_STATION_COLUMNS, rows=station_rows, row_key="stn"
+                ).classes("w-full")
 
         # Board block diagram
         with ui.column().classes("w-full mt-3"):
-            ui.label("Data Path").style(
-                f"color: {COLORS.text_primary}; font-weight: bold"
-            )
-            with ui.element("pre").classes("w-full overflow-x-auto").style(
-                f"color: {COLORS.text_secondary}; font-family: 'JetBrains Mono', monospace; "
-                f"font-size: 12px; background: {COLORS.bg_primary}; "
-                f"padding: 12px; border-radius: 4px; line-height: 1.4"
-            ):
+            ui.label("Data Path").style(_STYLE_BOLD)
+            with ui.element("pre").classes("w-full overflow-x-auto").style(_DIAGRAM_STYLE):
                 ui.html(_build_block_diagram(profile))
 
 
-def _render_fabric_summary(topo_data: dict, profile: BoardProfile) -> None:
-    """Render the fabric summary card with chip info and port counts."""
-    with ui.card().classes("w-full p-4").style(
-        f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}"
-    ):
-        ui.label("Fabric Summary").classes("text-h6 mb-2").style(
-            f"color: {COLORS.text_primary}"
+def _normalize_topology(topo_data: dict) -> None:
+    """Fill in missing station/port keys in place so render loops can index directly.
+
+    Runs once when a payload is applied; the API model already provides
+    these fields, so this only guards older cached or partial payloads.
+    """
+    for stn in topo_data.setdefault("stations", []):
+        stn.setdefault("station_index", -1)
+        stn.setdefault("connector_name", None)
+        stn.setdefault("label", None)
+        stn.setdefault("lane_range", None)
+        for port in stn.setdefault("ports", []):
+            port.setdefault("port_number", -1)
+            port.setdefault("role", "unknown")
+            port.setdefault("connected_device", None)
+            status = port.setdefault("status", None)
+            if status:
+                status.setdefault("is_link_up", False)
+                status.setdefault("link_speed", "unknown")
+                status.setdefault("link_width", 0)
+            connected = port["connected_device"]
+            if connected:
+                connected.setdefault("device_type", "")
+                connected.setdefault("vendor_id", 0)
+                connected.setdefault("device_id", 0)
+
+
+def _build_topology_view(topo_data: dict, profile: BoardProfile) -> dict:
+    """Derive port counts, connector stats and station port groups.
+
+    Built once per distinct topology payload; the render functions only
+    read from it.
+    """
+    stations = topo_data["stations"]
+    ports_up = 0
+    total_ports = 0
+    station_views = []
+    for stn in stations:
+        ports = stn["ports"]
+        up = _count_up(ports)
+        ports_up += up
+        total_ports += len(ports)
+        groups = (
+            _group_ports_by_connector(stn["station_index"], ports, profile)
+            if ports else {}
         )
+        station_views.append({
+            "up": up,
+            "groups": [(name, gp, _count_up(gp)) for name, gp in groups.items()],
+        })
+
+    return {
+        "ports_up": ports_up,
+        "ports_down": total_ports - ports_up,
+        "connector_stats": _build_connector_stats(
+            stations, _profile_view(profile).station_to_connectors, profile
+        ),
+        "stations": station_views,
+    }
+
+
+def _render_fabric_summary(topo_data: dict, profile: BoardProfile, view: dict) -> None:
+    """Render the fabric summary card with chip info and port counts."""
+    with ui.card().classes("w-full p-4").style(_STYLE_CARD):
+        ui.label("Fabric Summary").classes("text-h6 mb-2").style(_STYLE_TITLE)
 
-        stations = topo_data.get("stations", [])
-        all_ports = []
-        for stn in stations:
-            all_ports.extend(stn.get("ports", []))
-        ports_up = sum(1 for p in all_ports if _port_is_up(p))
-        ports_down = len(all_ports) - ports_up
+        ports_up = view["ports_up"]
+        ports_down = view["ports_down"]
 
         with ui.grid(columns=7).classes("gap-4"):
             _stat_chip("Chip", f"0x{topo_data.get('chip_id', 0):04X}")
@@ -238,12 +523,12 @@ def _render_fabric_summary(topo_data: dict, profile: BoardProfile) -> None:
             _stat_chip(
                 "Ports UP",
                 str(ports_up),
-                COLORS.green if ports_up > 0 else COLORS.text_muted,
+                STYLE_GREEN if ports_up > 0 else STYLE_TEXT_MUTED,
             )
             _stat_chip(
                 "Ports DOWN",
                 str(ports_down),
-                COLORS.red if ports_down > 0 else COLORS.text_muted,
+                STYLE_RED if ports_down > 0 else STYLE_TEXT_MUTED,
             )
 
         upstream = topo_data.get("upstream_ports", [])
@@ -251,183 +536,169 @@ def _render_fabric_summary(topo_data: dict, profile: BoardProfile) -> None:
         if upstream:
             ui.label(
                 f"Upstream Ports: {', '.join(str(p) for p in upstream)}"
-            ).classes("mt-2").style(f"color: {COLORS.blue}")
+            ).classes("mt-2").style(STYLE_BLUE)
         if downstream:
             ui.label(
                 f"Downstream Ports: {', '.join(str(p) for p in downstream)}"
-            ).style(f"color: {COLORS.green}")
+            ).style(STYLE_GREEN)
 
 
-def _render_connector_health(topo_data: dict, profile: BoardProfile) -> None:
+def _render_connector_health(topo_data: dict, profile: BoardProfile, view: dict) -> None:
     """Render per-connector health summary showing link status at a glance."""
-    stations = topo_data.get("stations", [])
-    if not stations:
+    if not topo_data.get("stations"):
         return
 
-    connector_ref = _build_connector_ref(profile)
-    connector_stats = _build_connector_stats(stations, connector_ref)
+    connector_stats = view["connector_stats"]
     if not connector_stats:
         if not profile.connector_map:
-            with ui.card().classes("w-full p-4").style(
-                f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}"
-            ):
-                ui.label("Connector Health").classes("text-h6 mb-2").style(
-                    f"color: {COLORS.text_primary}"
-                )
+            with ui.card().classes("w-full p-4").style(_STYLE_CARD):
+                ui.label("Connector Health").classes("text-h6 mb-2").style(_STYLE_TITLE)
                 ui.label(
                     f"Connector layout for {profile.chip_name} is pending from Broadcom."
-                ).style(f"color: {COLORS.text_muted}; font-style: italic;")
+                ).style(_STYLE_MUTED_ITALIC)
         return
 
-    with ui.card().classes("w-full p-4").style(
-        f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}"
-    ):
-        ui.label("Connector Health").classes("text-h6 mb-2").style(
-            f"color: {COLORS.text_primary}"
+    with ui.card().classes("w-full p-4").style(_STYLE_CARD):
+        ui.label("Connector Health").classes("text-h6 mb-2").style(_STYLE_TITLE)
+        ui.html(
+            '<div class="row flex-wrap gap-4">'
+            + "".join(_connector_chip_html(cs) for cs in connector_stats)
+            + "</div>"
         )
-        with ui.row().classes("flex-wrap gap-4"):
-            for cs in connector_stats:
-                _render_connector_health_chip(cs)
 
 
 def _build_connector_stats(
     stations: list[dict],
-    connector_ref: list[dict],
+    station_connectors: dict[int, tuple[ConnectorRef, ...]],
+    profile: BoardProfile,
 ) -> list[dict]:
-    """Build per-connector statistics from live station/port data."""
-    stn_map = {s.get("station_index", -1): s for s in stations}
+    """Build per-connector statistics from live station/port data.
 
+    Stations are walked once in data order; each station's ports are
+    bucketed into its own connectors via ``connector_for_port``.
+    """
+    connector_map = profile.connector_map
     stats = []
-    for ref in connector_ref:
-        stn_data = stn_map.get(ref["station"])
-        if not stn_data:
+    for stn in stations:
+        refs = station_connectors.get(stn["station_index"])
+        if not refs:
             continue
-        ports = stn_data.get("ports", [])
-        lane_lo, lane_hi = (int(x) for x in ref["lanes"].split("-"))
-        connector_ports = [
-            p for p in ports
-            if lane_lo <= p.get("port_number", -1) <= lane_hi
-        ]
-        up = sum(1 for p in connector_ports if _port_is_up(p))
-        down = len(connector_ports) - up
-
-        active_speed = "none"
-        for p in connector_ports:
-            st = p.get("status")
-            if st and st.get("is_link_up"):
-                active_speed = st.get("link_speed", "unknown")
-                break
-
-        stats.append({
-            "name": ref["name"],
-            "type": ref["type"],
-            "width": ref["width"],
-            "total": len(connector_ports),
-            "up": up,
-            "down": down,
-            "speed": active_speed,
-        })
+        buckets: dict[ConnectorInfo, list[dict]] = {
+            connector_map[ref.name]: [] for ref in refs
+        }
+        for p in stn["ports"]:
+            bucket = buckets.get(connector_for_port(p["port_number"], profile))
+            if bucket is not None:
+                bucket.append(p)
+
+        for ref in refs:
+            connector_ports = buckets[connector_map[ref.name]]
+            up = _count_up(connector_ports)
+
+            active_speed = "none"
+            for p in connector_ports:
+                st = p["status"]
+                if st and st["is_link_up"]:
+                    active_speed = st["link_speed"]
+                    break
+
+            stats.append({
+                "name": ref.name,
+                "type": ref.type,
+                "width": ref.width,
+                "total": len(connector_ports),
+                "up": up,
+                "down": len(connector_ports) - up,
+                "speed": active_speed,
+            })
+
+    stats.sort(key=lambda cs: cs["name"])
     return stats
 
 
-def _render_connector_health_chip(cs: dict) -> None:
-    """Render a single connector health indicator chip."""
+def _connector_chip_html(cs: dict) -> str:
+    """Build the HTML for a single connector health indicator chip."""
     up = cs["up"]
     total = cs["total"]
     all_up = up == total and total > 0
     any_up = up > 0
-
-    border = (
-        COLORS.green if all_up
-        else COLORS.yellow if any_up
-        else COLORS.border
+    speed = cs["speed"]
+    return _CONNECTOR_HEALTH[(all_up, any_up)].format(
+        name=escape(cs["name"]),
+        type=escape(cs["type"]),
+        width=cs["width"],
+        up=up,
+        total=total,
+        speed=_CHIP_SPEED_HTML.format(speed=escape(speed)) if speed != "none" else "",
     )
 
-    with ui.element("div").classes("p-3 rounded").style(
-        f"background: {COLORS.bg_card}; "
-        f"border: 2px solid {border}; min-width: 140px"
-    ):
-        with ui.row().classes("items-center gap-2 mb-1"):
-            icon = "check_circle" if all_up else "warning" if any_up else "cancel"
-            icon_color = (
-                COLORS.green if all_up
-                else COLORS.yellow if any_up
-                else COLORS.red
-            )
-            ui.icon(icon).style(f"color: {icon_color}")
-            ui.label(cs["name"]).style(
-                f"color: {COLORS.text_primary}; font-weight: bold"
-            )
-        ui.label(f"{cs['type']} ({cs['width']})").style(
-            f"color: {COLORS.text_secondary}; font-size: 12px"
-        )
-        ui.label(f"{up}/{total} ports up").style(
-            f"color: {COLORS.text_secondary}; font-size: 12px"
-        )
-        if cs["speed"] != "none":
-            ui.label(cs["speed"]).style(
-                f"color: {COLORS.blue}; font-size: 12px"
-            )
-
 
-def _render_station_cards(topo_data: dict, profile: BoardProfile) -> None:
+def _render_station_cards(topo_data: dict, view: dict) -> None:
     """Render per-station detail cards with connector grouping."""
-    for station in topo_data.get("stations", []):
-        stn_idx = station.get("station_index", 0)
-        connector = station.get("connector_name") or "Internal"
-        label = station.get("label") or f"Station {stn_idx}"
-        lane_range = station.get("lane_range")
-        ports = station.get("ports", [])
+    for station, stn_view in zip(topo_data["stations"], view["stations"]):
+        stn_idx = station["station_index"]
+        connector = station["connector_name"] or "Internal"
+        label = station["label"] or f"Station {stn_idx}"
+        lane_range = station["lane_range"]
+        ports = station["ports"]
+
+        if not ports:
+            # Reserved/idle stations get a one-line placeholder, not a full card
+            ui.html(
+                _EMPTY_STATION_HTML.format(
+                    stn_idx=stn_idx, label=escape(label), connector=escape(connector),
+                )
+            )
+            continue
 
         total = len(ports)
-        up = sum(1 for p in ports if _port_is_up(p))
+        up = stn_view["up"]
 
-        with ui.card().classes("w-full p-4").style(
-            f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}"
-        ):
+        with ui.card().classes("w-full p-4").style(_STYLE_CARD):
             # Station header
             with ui.row().classes("items-center gap-4 mb-2"):
-                ui.label(f"STN{stn_idx}").classes("text-h6").style(
-                    f"color: {COLORS.blue}"
-                )
-                ui.label(label).style(f"color: {COLORS.text_primary}")
-                ui.badge(connector).props("outline").style(
-                    f"color: {COLORS.purple}"
-                )
+                ui.label(f"STN{stn_idx}").classes("text-h6").style(_STYLE_STN_ID)
+                ui.label(label).style(_STYLE_TITLE)
+                ui.badge(connector).props("outline").style(_STYLE_STN_BADGE)
                 if lane_range:
                     ui.label(
                         f"Ports {lane_range[0]}-{lane_range[1]}"
-                    ).style(f"color: {COLORS.text_muted}")
-                up_color = COLORS.green if up > 0 else COLORS.text_muted
-                ui.label(f"{up}/{total} up").style(
-                    f"color: {up_color}; font-size: 12px"
-                )
+                    ).style(_STYLE_MUTED)
+                ui.label(f"{up}/{total} up").style(_STYLE_UP_COUNT[up > 0])
 
-            if not ports:
-                ui.label("No active ports").style(
-                    f"color: {COLORS.text_muted}"
-                )
-                continue
-
-            # Group ports by sub-connector within the station
-            connector_groups = _group_ports_by_connector(stn_idx, ports, profile)
+            # Ports grouped by sub-connector within the station
+            connector_groups = stn_view["groups"]
 
             if len(connector_groups) > 1:
-                for group_name, group_ports in connector_groups.items():
-                    group_up = sum(1 for p in group_ports if _port_is_up(p))
+                for group_name, group_ports, group_up in connector_groups:
                     with ui.column().classes("w-full mb-2"):
                         with ui.row().classes("items-center gap-2 mb-1"):
-                            ui.label(group_name).style(
-                                f"color: {COLORS.orange}; font-weight: bold; font-size: 13px"
-                            )
+                            ui.label(group_name).style(_STYLE_GROUP_NAME)
                             ui.label(f"({group_up}/{len(group_ports)} up)").style(
-                                f"color: {COLORS.text_muted}; font-size: 12px"
+                                _STYLE_MUTED_12
                             )
                         _render_port_grid(group_ports)
             else:
                 _render_port_grid(ports)
 
 
+def _build_station_port_groups(
+    profile: BoardProfile,
+) -> dict[int, tuple[tuple[str, ...], dict[ConnectorInfo, int]]]:
+    """Build the per-station connector group labels and connector index."""
+    by_station: dict[int, list[tuple[str, ConnectorInfo]]] = defaultdict(list)
+    for cn_name, info in sorted(profile.connector_map.items(), key=lambda kv: kv[1].lanes):
+        by_station[info.station].append((cn_name, info))
+    return {
+        stn_idx: (
+            tuple(f"{cn_name} [{info.lanes[0]}:{info.lanes[1]}]" for cn_name, info in connectors),
+            {info: idx for idx, (_, info) in enumerate(connectors)},
+        )
+        for stn_idx, connectors in by_station.items()
+        if len(connectors) > 1
+    }
+
+
 def _group_ports_by_connector(
     stn_idx: int,
     ports: list[dict],
@@ -436,108 +707,103 @@ def _group_ports_by_connector(
     """Group ports by their physical connector within a station.
 
     Derives connector ranges from the profile's connector_map instead
-    of using hardcoded station/lane ranges.
+    of using hardcoded station/lane ranges.  Groups are ordered by lane
+    and empty groups are dropped.
     """
-    # Find all connectors that belong to this station
-    stn_connectors = [
-        (cn_name, info)
-        for cn_name, info in sorted(profile.connector_map.items())
-        if info.station == stn_idx
-    ]
-
-    if len(stn_connectors) <= 1:
+    entry = _profile_view(profile).station_port_groups.get(stn_idx)
+    if entry is None:
         return {"all": ports}
+    labels, connector_index = entry
 
-    groups: dict[str, list[dict]] = {}
+    buckets: list[list[dict]] = [[] for _ in labels]
+    appenders = [b.append for b in buckets]
     unmatched: list[dict] = []
+    unmatched_append = unmatched.append
     for port in ports:
-        pn = port.get("port_number", -1)
-        placed = False
-        for cn_name, info in stn_connectors:
-            lo, hi = info.lanes
-            if lo <= pn <= hi:
-                label = f"{cn_name} [{lo}:{hi}]"
-                groups.setdefault(label, []).append(port)
-                placed = True
-                break
-        if not placed:
-            unmatched.append(port)
+        idx = connector_index.get(connector_for_port(port["port_number"], profile))
+        if idx is None:
+            unmatched_append(port)
+        else:
+            appenders[idx](port)
 
+    groups = {label: bucket for label, bucket in zip(labels, buckets) if bucket}
     if unmatched:
         groups["Other"] = unmatched
 
     return groups
 
 
-def _render_port_grid(ports: list[dict]) -> None:
-    """Render a grid of port tiles with status coloring."""
-    with ui.row().classes("flex-wrap gap-2"):
-        for port in ports:
-            port_num = port.get("port_number", 0)
-            role = port.get("role", "unknown")
-            status = port.get("status")
-            is_up = status.get("is_link_up", False) if status else False
+def _render_port_grid(ports: list[dict], visible_cap: int = _PORT_GRID_VISIBLE_CAP) -> None:
+    """Render a grid of port tiles with status coloring.
 
-            border_color = (
-                COLORS.blue if role == "upstream"
-                else COLORS.green if role == "downstream"
-                else COLORS.border
-            )
-
-            with ui.element("div").classes(
-                "p-2 rounded text-center"
-            ).style(
-                f"background: {COLORS.bg_card}; "
-                f"border: 2px solid {border_color}; "
-                f"min-width: 80px"
-            ):
-                ui.label(f"P{port_num}").style(
-                    f"color: {COLORS.text_primary}; font-weight: bold"
-                )
-                ui.label(role).style(
-                    f"color: {COLORS.text_secondary}; font-size: 11px"
-                )
-                if status:
-                    speed = status.get("link_speed", "unknown")
-                    width = status.get("link_width", 0)
-                    status_color = (
-                        COLORS.green if is_up
-                        else COLORS.red
-                    )
-                    ui.label(
-                        f"x{width} {speed}" if is_up else "DOWN"
-                    ).style(
-                        f"color: {status_color}; font-size: 11px"
-                    )
-
-                # Show connected device info on DSP ports
-                connected = port.get("connected_device")
-                if connected:
-                    dev_type = connected.get("device_type", "")
-                    vid = connected.get("vendor_id", 0)
-                    did = connected.get("device_id", 0)
-                    if dev_type:
-                        ui.badge(dev_type).props("outline").style(
-                            f"color: {COLORS.cyan}; border-color: {COLORS.cyan}; "
-                            f"font-size: 9px"
-                        )
-                    if vid:
-                        ui.label(f"{vid:04x}:{did:04x}").style(
-                            f"color: {COLORS.text_muted}; font-size: 9px"
-                        )
+    Only the first ``visible_cap`` tiles are built up front; the rest are
+    created when the user expands the grid.
+    """
+    hidden = ports[visible_cap:]
+    with ui.row().classes("flex-wrap gap-2") as grid:
+        for port in ports[:visible_cap]:
+            _render_port_tile(port)
+
+        if hidden:
+            def show_hidden() -> None:
+                more_btn.delete()
+                with grid:
+                    for port in hidden:
+                        _render_port_tile(port)
+
+            more_btn = ui.button(
+                f"+{len(hidden)} more", on_click=show_hidden,
+            ).props("flat dense color=primary")
+
+
+def _render_port_tile(port: dict) -> None:
+    """Render a single port tile as one HTML element."""
+    role = port["role"]
+    status = port["status"]
+
+    status_html = ""
+    if status:
+        is_up = bool(status["is_link_up"])
+        if is_up:
+            speed = status["link_speed"]
+            width = status["link_width"]
+            text = escape(f"x{width} {speed}")
+        else:
+            text = "DOWN"
+        status_html = f'<div style="{_LINK_STATUS_STYLE[is_up]}">{text}</div>'
+
+    # Show connected device info on DSP ports
+    device_html = ""
+    connected = port["connected_device"]
+    if connected:
+        dev_type = connected["device_type"]
+        vid = connected["vendor_id"]
+        did = connected["device_id"]
+        if dev_type:
+            device_html += _DEVICE_BADGE_HTML.format(dev_type=escape(dev_type))
+        if vid:
+            device_html += f'<div style="{_STYLE_DEVICE_ID}">{vid:04x}:{did:04x}</div>'
+
+    ui.html(
+        _TILE_HTML.get(role, _TILE_HTML_DEFAULT).format(
+            port_num=port["port_number"],
+            role=escape(role),
+            status=status_html,
+            device=device_html,
+        )
+    )
 
 
-def _port_is_up(port: dict) -> bool:
-    """Check if a port is link-up from its status dict."""
-    status = port.get("status")
-    if not status:
-        return False
-    return status.get("is_link_up", False)
+def _count_up(ports: list[dict]) -> int:
+    """Count link-up ports, with the status check inlined to avoid a call per port."""
+    return sum(
+        1 for p in ports
+        if (st := p["status"]) and st["is_link_up"]
+    )
 
 
-def _stat_chip(label: str, value: str, color: str | None = None) -> None:
-    """Render a small stat display."""
-    val_color = color or COLORS.text_primary
+def _stat_chip(label: str, value: str, style: str = STYLE_TEXT_PRIMARY) -> None:
+    """Render a small stat display; *style* is one of the theme ``STYLE_*`` colours."""
     with ui.column().classes("items-center"):
-        ui.label(value).classes("text-h6").style(f"color: {val_color}")
-        ui.label(label).style(f"color: {COLORS.text_muted}; font-size: 12px")
+        ui.label(value).classes("text-h6").style(style)
+        ui.label(label).style(_STYLE_MUTED_12)
@@ -2,16 +2,247 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
 import time
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from itertools import chain
 
-from nicegui import ui
+import httpx
+from nicegui import background_tasks, ui
+from nicegui import json as nicegui_json
 
 from calypso.ui.layout import page_layout
-from calypso.ui.theme import COLORS
+from calypso.ui.services import api
+from calypso.ui.theme import (
+    COLORS,
+    STYLE_BLUE,
+    STYLE_CYAN,
+    STYLE_GREEN,
+    STYLE_RED,
+    STYLE_TEXT_MUTED,
+    STYLE_TEXT_PRIMARY,
+    STYLE_TEXT_SECONDARY,
+)
+from calypso.utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 _MAX_CHART_POINTS = 120
 
+_MB = 1 << 20
+
+# Temperature colour bands: < 60 C green, 60-80 C yellow, >= 80 C red
+_TEMP_BOUNDS_C = (60, 80)
+_TEMP_COLORS = (COLORS.green, COLORS.yellow, COLORS.red)
+
+# Matches the server-side cadence of /api/workloads/{id}/stream
+_PROGRESS_POLL_INTERVAL_S = 1.0
+
+# SMART ticks are buffered and applied to the cards/chart at most this often
+_SMART_FLUSH_INTERVAL_S = 0.25
+
+# Pre-formatted page-specific style strings (COLORS is immutable)
+_STYLE_CARD = f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}"
+_STYLE_PANEL = f"background: {COLORS.bg_card}; border: 1px solid {COLORS.border}"
+_STYLE_STAT_CARD = f"{_STYLE_PANEL}; min-width: 140px"
+_STYLE_MUTED_12 = f"{STYLE_TEXT_MUTED}; font-size: 12px"
+
+# Static table column definitions (results / SMART summary, history)
+_METRIC_COLUMNS = (
+    {"name": "metric", "label": "Metric", "field": "metric", "align": "left"},
+    {"name": "value", "label": "Value", "field": "value", "align": "right"},
+)
+# Bound formatters (format spec parsed once) and the stats rows they render
+_fmt_count = "{:,.0f}".format
+_fmt_rate = "{:,.1f}".format
+_fmt_fixed = "{:.1f}".format
+_RESULT_ROWS = (
+    ("IOPS Total", "iops_total", _fmt_count),
+    ("IOPS Read", "iops_read", _fmt_count),
+    ("IOPS Write", "iops_write", _fmt_count),
+    ("BW Total (MB/s)", "bandwidth_total_mbps", _fmt_rate),
+    ("BW Read (MB/s)", "bandwidth_read_mbps", _fmt_rate),
+    ("BW Write (MB/s)", "bandwidth_write_mbps", _fmt_rate),
+    ("Latency Avg (us)", "latency_avg_us", _fmt_fixed),
+    ("Latency Max (us)", "latency_max_us", _fmt_fixed),
+    ("Latency p50 (us)", "latency_p50_us", _fmt_fixed),
+    ("Latency p99 (us)", "latency_p99_us", _fmt_fixed),
+    ("Latency p999 (us)", "latency_p999_us", _fmt_fixed),
+    ("CPU Usage (%)", "cpu_usage_percent", _fmt_fixed),
+)
+_HISTORY_COLUMNS = (
+    {"name": "id", "label": "ID", "field": "id", "align": "left"},
+    {"name": "backend", "label": "Backend", "field": "backend", "align": "left"},
+    {"name": "bdf", "label": "BDF", "field": "bdf", "align": "left"},
+    {"name": "state", "label": "State", "field": "state", "align": "left"},
+    {"name": "iops", "label": "IOPS", "field": "iops", "align": "right"},
+    {"name": "bw", "label": "BW (MB/s)", "field": "bw", "align": "right"},
+)
+
+# Threshold bands behind the temperature series (kept in sync with _temp_color)
+_TEMP_ZONE_SERIES = {
+    "name": "_zones",
+    "type": "line",
+    "data": [],
+    "showSymbol": False,
+    "lineStyle": {"width": 0},
+    "markArea": {
+        "silent": True,
+        "label": {"show": True, "position": "insideRight", "fontSize": 10},
+        "data": [
+            [
+                {"yAxis": 0, "name": "Normal",
+                 "itemStyle": {"color": "rgba(63,185,80,0.08)"},
+                 "label": {"color": COLORS.green}},
+                {"yAxis": 60},
+            ],
+            [
+                {"yAxis": 60, "name": "Warm",
+                 "itemStyle": {"color": "rgba(210,153,34,0.08)"},
+                 "label": {"color": COLORS.yellow}},
+                {"yAxis": 80},
+            ],
+            [
+                {"yAxis": 80, "name": "Critical",
+                 "itemStyle": {"color": "rgba(248,81,73,0.08)"},
+                 "label": {"color": COLORS.red}},
+                {"yAxis": 120},
+            ],
+        ],
+    },
+}
+
+# Static temperature chart options shared by every session; pages add "series"
+_TEMP_CHART_BASE = {
+    "animation": False,
+    "backgroundColor": "transparent",
+    "grid": {"containLabel": True},
+    "tooltip": {
+        "trigger": "axis",
+        # Samples are stored unrounded; format to 0.1 C only for display
+        ":valueFormatter": '(v) => typeof v === "number" ? v.toFixed(1) + " C" : v',
+    },
+    "legend": {"textStyle": {"color": COLORS.text_secondary}},
+    "xAxis": {
+        "type": "time",
+        "axisLabel": {"color": COLORS.text_secondary},
+        "axisLine": {"lineStyle": {"color": COLORS.border}},
+    },
+    "yAxis": {
+        "type": "value",
+        "name": "Temperature (C)",
+        "nameTextStyle": {"color": COLORS.text_secondary},
+        "axisLabel": {"color": COLORS.text_secondary},
+        "splitLine": {"lineStyle": {"color": COLORS.border}},
+        "min": 0,
+    },
+}
+
+# Page script installed once per page load:
+# - reports tab visibility so hidden tabs only buffer SMART samples;
+# - calypsoWlAppend(id, cap, batches) appends per-series point batches to the
+#   temperature chart and trims each series to the ring capacity (series
+#   index 0 is the threshold-zone overlay).
+_PAGE_JS = """<script>
+document.addEventListener("visibilitychange", () => {
+    emitEvent("wl_visibility", !document.hidden);
+});
+window.calypsoWlAppend = (id, cap, batches) => {
+    const c = getElement(id).chart;
+    const series = c.getOption().series;
+    batches.forEach((pts, i) => {
+        const data = series[i + 1].data;
+        data.push(...pts);
+        if (data.length > cap) data.splice(0, data.length - cap);
+    });
+    c.setOption({series: series.map((s) => ({data: s.data}))});
+};
+</script>"""
+
+
+class _Ring:
+    """Fixed-capacity ring of ``(timestamp, value)`` chart points.
+
+    Points are stored interleaved in a single ``array('d')`` so appends never
+    allocate; ``[ts, value]`` pairs are only materialized when the chart is
+    rebuilt.
+    """
+
+    __slots__ = ("buf", "capacity", "count", "pos")
+
+    def __init__(self, capacity: int) -> None:
+        self.buf = array("d", [0.0]) * (2 * capacity)
+        self.capacity = capacity
+        self.pos = 0
+        self.count = 0
+
+    def append(self, ts: float, value: float) -> None:
+        i = 2 * self.pos
+        self.buf[i] = ts
+        self.buf[i + 1] = value
+        self.pos = (self.pos + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def to_pairs(self) -> list[list[float]]:
+        """Return the buffered points oldest-first as ``[ts, value]`` pairs."""
+        buf = self.buf
+        if self.count < self.capacity:
+            idx = range(0, 2 * self.count, 2)
+        else:
+            split = 2 * self.pos
+            idx = chain(range(split, len(buf), 2), range(0, split, 2))
+        return [[buf[i], buf[i + 1]] for i in idx]
+
+
+@dataclass(slots=True)
+class _PageState:
+    """Per-page workload state shared by the page's closures."""
+
+    workload_id: str | None = None
+    running: bool = False
+    result: dict | None = None
+    backends: list[str] = field(default_factory=list)
+    stream_task: asyncio.Task | None = None
+    visible: bool = True
+    stale_smart: dict | None = None
+
+
+@dataclass(slots=True)
+class _WorkloadForm:
+    """Workload configuration inputs (bound one-way from the form widgets)."""
+
+    backend: str = "spdk"
+    bdf: str = ""
+    workload_type: str = "randread"
+    io_size: float | None = 4096
+    queue_depth: float | None = 128
+    duration: float | None = 30
+    read_pct: float | None = 100
+    workers: float | None = 1
+    core_mask: str = ""
+
+
+def _single_flight(fn):
+    """Wrap an async handler so calls made while one is in flight are dropped."""
+    busy = False
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        nonlocal busy
+        if busy:
+            return None
+        busy = True
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            busy = False
+
+    return wrapper
+
 
 def workloads_page(device_id: str) -> None:
     """Render the NVMe workload generation page."""
@@ -26,193 +257,244 @@ def _workloads_content(device_id: str) -> None:
     """Build the workloads page content inside page_layout."""
 
     # Local state
-    state: dict = {
-        "workload_id": None,
-        "running": False,
-        "result": None,
-        "backends": [],
-    }
-    form: dict = {
-        "backend": "spdk",
-        "bdf": "",
-        "workload_type": "randread",
-        "io_size": 4096,
-        "queue_depth": 128,
-        "duration": 30,
-        "read_pct": 100,
-        "workers": 1,
-        "core_mask": "",
-    }
-    smart_chart_series: dict[str, list] = {}
+    state = _PageState()
+    form = _WorkloadForm()
+    smart_chart_series: dict[str, _Ring] = {}
+    chart_series: list[dict] = []
+    pending_smart: list[dict] = []
 
     # --- Actions ---
 
+    @_single_flight
     async def load_backends():
         try:
-            resp = await ui.run_javascript(
-                'return await (await fetch("/api/workloads/backends")).json()',
-                timeout=10.0,
-            )
-            state["backends"] = resp.get("available", [])
+            resp = (await api.get_client().get("/api/workloads/backends")).json()
+            state.backends = resp.get("available", [])
             refresh_backend_status()
         except Exception as e:
             ui.notify(f"Failed to load backends: {e}", type="negative")
 
     async def start_workload():
-        config = {
-            "backend": form["backend"],
-            "target_bdf": form["bdf"],
-            "workload_type": form["workload_type"],
-            "io_size_bytes": form["io_size"],
-            "queue_depth": form["queue_depth"],
-            "duration_seconds": form["duration"],
-            "read_percentage": form["read_pct"],
-            "num_workers": form["workers"],
-        }
-        if form["core_mask"]:
-            config["core_mask"] = form["core_mask"]
+        # Inputs write straight into ``form``; ui.number yields floats (or None
+        # when cleared), so cast once here rather than on every keystroke.
+        try:
+            config = {
+                "backend": form.backend,
+                "target_bdf": form.bdf,
+                "workload_type": form.workload_type,
+                "io_size_bytes": int(form.io_size),
+                "queue_depth": int(form.queue_depth),
+                "duration_seconds": int(form.duration),
+                "read_percentage": int(form.read_pct),
+                "num_workers": int(form.workers),
+            }
+        except (TypeError, ValueError):
+            ui.notify("All numeric fields must be filled in", type="warning")
+            return
+        if form.core_mask:
+            config["core_mask"] = form.core_mask
 
-        body = json.dumps(config)
         try:
-            resp = await ui.run_javascript(
-                f'return await (await fetch("/api/workloads/start", '
-                f'{{method:"POST", headers:{{"Content-Type":"application/json"}}, '
-                f"body: {json.dumps(body)}}})).json()",
-                timeout=10.0,
-            )
+            resp = (await api.get_client().post("/api/workloads/start", json=config)).json()
             if "detail" in resp:
                 ui.notify(f"Error: {resp['detail']}", type="negative")
                 return
-            state["workload_id"] = resp.get("workload_id")
-            state["running"] = True
-            state["result"] = None
+            state.workload_id = resp.get("workload_id")
+            state.running = True
+            state.result = None
             smart_chart_series.clear()
-            ui.notify(f"Workload started: {state['workload_id']}", type="positive")
+            chart_series.clear()
+            pending_smart.clear()
+            state.stale_smart = None
+            ui.notify(f"Workload started: {state.workload_id}", type="positive")
             refresh_progress()
-            _start_ws_stream(state["workload_id"])
+            _cancel_stream()
+            state.stream_task = background_tasks.create(
+                _stream_progress(state.workload_id), name="workload-progress-stream"
+            )
         except Exception as e:
             ui.notify(f"Failed to start workload: {e}", type="negative")
 
     async def stop_workload():
-        wl_id = state.get("workload_id")
+        wl_id = state.workload_id
         if not wl_id:
             return
+        _cancel_stream()
         try:
-            resp = await ui.run_javascript(
-                f'return await (await fetch("/api/workloads/{wl_id}/stop", '
-                f'{{method:"POST"}})).json()',
-                timeout=10.0,
-            )
-            state["running"] = False
-            state["result"] = resp
+            resp = (await api.get_client().post(f"/api/workloads/{wl_id}/stop")).json()
+            state.running = False
+            state.result = resp
             ui.notify("Workload stopped", type="info")
             refresh_progress()
             refresh_results()
         except Exception as e:
             ui.notify(f"Error stopping workload: {e}", type="negative")
 
-    async def _start_ws_stream(workload_id: str):
-        ws_js = (
-            f"(() => {{"
-            f'  const proto = window.location.protocol === "https:" ? "wss:" : "ws:";'
-            f"  const ws = new WebSocket("
-            f"    `${{proto}}//${{window.location.host}}/api/workloads/{workload_id}/stream`"
-            f"  );"
-            f"  window._calypso_wl_ws = ws;"
-            f"  ws.onmessage = (e) => {{"
-            f"    const data = JSON.parse(e.data);"
-            f"    if (data.error) {{ console.error(data.error); return; }}"
-            f'    emitEvent("wl_progress", data);'
-            f"  }};"
-            f'  ws.onclose = () => {{ emitEvent("wl_ws_closed", {{}}); }};'
-            f'  ws.onerror = () => {{ emitEvent("wl_ws_closed", {{}}); }};'
-            f'  return "connected";'
-            f"}})()"
-        )
+    async def _stream_progress(workload_id: str):
+        """Poll workload status in-process and apply each tick to the page."""
+        client = api.get_client()
         try:
-            await ui.run_javascript(ws_js)
+            while True:
+                await asyncio.sleep(_PROGRESS_POLL_INTERVAL_S)
+                resp = await client.get(f"/api/workloads/{workload_id}")
+                data = nicegui_json.loads(resp.content)
+                if page_client.is_deleted or "detail" in data:
+                    break
+                with page_client:
+                    on_wl_progress(data)
+                if data.get("state") not in ("pending", "running"):
+                    break
+        except (httpx.HTTPError, ValueError) as exc:
+            logger.warning("workload_stream_failed", workload_id=workload_id, error=str(exc))
+            if not page_client.is_deleted:
+                with page_client:
+                    ui.notify(f"Lost workload progress stream: {exc}", type="warning")
         except Exception:
-            pass
-
-    def on_wl_progress(e):
-        data = e.args
+            # Unexpected (e.g. from on_wl_progress): don't leave the page stuck
+            # in "running"; re-raise so background_tasks logs it
+            _close_stream_view()
+            raise
+        # A cancelled stream (stop/restart) propagates above and skips this
+        _close_stream_view()
+
+    def _close_stream_view():
+        if not page_client.is_deleted:
+            with page_client:
+                on_wl_closed()
+
+    def _cancel_stream():
+        task = state.stream_task
+        if task is not None and not task.done():
+            task.cancel()
+        state.stream_task = None
+
+    def on_wl_progress(data: dict):
         s = data.get("state", "")
+        _update_smart_from_progress(data)
         if s not in ("pending", "running"):
-            state["running"] = False
-            state["result"] = data
+            state.running = False
+            state.result = data
+            flush_smart()
             refresh_results()
         refresh_progress_data(data)
-        _update_smart_from_progress(data)
 
-    def on_wl_closed(_e):
-        state["running"] = False
+    def on_wl_closed():
+        state.running = False
         refresh_progress()
 
     def _update_smart_from_progress(data: dict):
-        """Extract SMART data from a WS progress tick and update cards + chart."""
+        """Queue SMART data from a progress tick for the next UI flush."""
         prog = data.get("progress") or {}
         smart = prog.get("smart")
         if smart is None:
             return
-        refresh_smart_cards(smart)
-        _append_smart_chart_point(smart)
+        pending_smart.append(smart)
+        smart_flush_timer.activate()
 
-    def _append_smart_chart_point(smart: dict):
+    def flush_smart():
+        """Apply all queued SMART ticks: cards from the latest, chart from all."""
+        smart_flush_timer.deactivate()
+        if not pending_smart:
+            return
+        batch = pending_smart[:]
+        pending_smart.clear()
+        known = len(smart_chart_series)
+        deltas: dict[str, list] = {}
+        for smart in batch:
+            _append_smart_chart_point(smart, deltas)
+        if not state.visible:
+            # Only buffer while the tab is hidden; on_visibility catches up
+            state.stale_smart = batch[-1]
+            return
+        update_smart_cards(batch[-1])
+        if known and len(smart_chart_series) == known:
+            _push_temp_chart_deltas(deltas)
+        else:
+            _render_temp_chart()
+
+    def on_visibility(e):
+        state.visible = bool(e.args)
+        stale = state.stale_smart
+        if state.visible and stale is not None:
+            state.stale_smart = None
+            update_smart_cards(stale)
+            _render_temp_chart()
+
+    def _series_ring(name: str) -> _Ring:
+        """Return the ring for *name*, registering a new chart series if needed."""
+        ring = smart_chart_series.get(name)
+        if ring is None:
+            ring = smart_chart_series[name] = _Ring(_MAX_CHART_POINTS)
+            chart_series.append({"name": name, "type": "line", "data": [], "showSymbol": False})
+        return ring
+
+    def _append_smart_chart_point(smart: dict, deltas: dict[str, list]):
         ts = smart.get("timestamp_ms", int(time.time() * 1000))
 
         composite = smart.get("composite_temp_celsius", 0)
-        key = "Composite"
-        smart_chart_series.setdefault(key, []).append([ts, round(composite, 1)])
-        if len(smart_chart_series[key]) > _MAX_CHART_POINTS:
-            smart_chart_series[key] = smart_chart_series[key][-_MAX_CHART_POINTS:]
+        _series_ring("Composite").append(ts, composite)
+        deltas.setdefault("Composite", []).append([ts, composite])
 
         for i, temp in enumerate(smart.get("temp_sensors_celsius", [])):
             skey = f"Sensor {i + 1}"
-            smart_chart_series.setdefault(skey, []).append([ts, round(temp, 1)])
-            if len(smart_chart_series[skey]) > _MAX_CHART_POINTS:
-                smart_chart_series[skey] = smart_chart_series[skey][-_MAX_CHART_POINTS:]
-
-        zone_series = temp_chart.options["series"][0] if temp_chart.options["series"] else {
-            "name": "_zones", "type": "line", "data": [],
-            "showSymbol": False, "lineStyle": {"width": 0},
-            "markArea": _temp_zone_mark_area,
+            _series_ring(skey).append(ts, temp)
+            deltas.setdefault(skey, []).append([ts, temp])
+
+    def _sync_temp_chart_options():
+        """Rebuild the server-side chart options from the rings."""
+        # chart_series is index-aligned with smart_chart_series
+        for entry, ring in zip(chart_series, smart_chart_series.values()):
+            entry["data"] = ring.to_pairs()
+        temp_chart.options["series"] = [_TEMP_ZONE_SERIES, *chart_series]
+        # Replace rather than mutate: the base legend dict is shared module state
+        temp_chart.options["legend"] = {
+            **_TEMP_CHART_BASE["legend"],
+            "data": list(smart_chart_series),
         }
-        temp_chart.options["series"] = [zone_series] + [
-            {"name": name, "type": "line", "data": points, "showSymbol": False}
-            for name, points in smart_chart_series.items()
-        ]
-        temp_chart.options["legend"]["data"] = list(smart_chart_series.keys())
+
+    def _render_temp_chart():
+        _sync_temp_chart_options()
         temp_chart.update()
 
+    def _push_temp_chart_deltas(deltas: dict[str, list]):
+        """Append only the new points client-side; the series set is unchanged.
+
+        The server-side options are refreshed without sending an update, so a
+        reconnecting client still renders the current data.
+        """
+        payload = nicegui_json.dumps([deltas.get(name, []) for name in smart_chart_series])
+        ui.run_javascript(f"calypsoWlAppend({temp_chart.id}, {_MAX_CHART_POINTS}, {payload})")
+        with temp_chart.props.suspend_updates():
+            _sync_temp_chart_options()
+
     # --- Page content ---
 
-    # Register WS event handlers
-    ui.on("wl_progress", on_wl_progress)
-    ui.on("wl_ws_closed", on_wl_closed)
+    page_client = ui.context.client
+    ui.add_body_html(_PAGE_JS)
+    ui.on("wl_visibility", on_visibility)
 
     # --- Backend Status ---
     with (
         ui.card()
         .classes("w-full p-4")
-        .style(f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}")
+        .style(_STYLE_CARD)
     ):
-        ui.label("Backend Status").classes("text-h6 mb-2").style(f"color: {COLORS.text_primary}")
+        ui.label("Backend Status").classes("text-h6 mb-2").style(STYLE_TEXT_PRIMARY)
         backend_container = ui.row().classes("items-center gap-4")
 
         @ui.refreshable
         def refresh_backend_status():
             backend_container.clear()
             with backend_container:
-                avail = state.get("backends", [])
+                avail = state.backends
                 for name in ["spdk", "pynvme"]:
                     ok = name in avail
-                    color = COLORS.green if ok else COLORS.red
                     icon_name = "check_circle" if ok else "cancel"
                     with ui.row().classes("items-center gap-1"):
-                        ui.icon(icon_name).style(f"color: {color}")
-                        ui.label(name.upper()).style(f"color: {COLORS.text_primary}")
+                        ui.icon(icon_name).style(STYLE_GREEN if ok else STYLE_RED)
+                        ui.label(name.upper()).style(STYLE_TEXT_PRIMARY)
                 if not avail:
-                    ui.label("No backends available").style(f"color: {COLORS.text_muted}")
+                    ui.label("No backends available").style(STYLE_TEXT_MUTED)
 
         refresh_backend_status()
 
@@ -220,66 +502,57 @@ def _workloads_content(device_id: str) -> None:
     with (
         ui.card()
         .classes("w-full p-4")
-        .style(f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}")
+        .style(_STYLE_CARD)
     ):
-        ui.label("Configuration").classes("text-h6 mb-2").style(f"color: {COLORS.text_primary}")
+        ui.label("Configuration").classes("text-h6 mb-2").style(STYLE_TEXT_PRIMARY)
         with ui.row().classes("w-full gap-4 flex-wrap"):
             ui.select(
                 options=["spdk", "pynvme"],
                 label="Backend",
-                value=form["backend"],
-                on_change=lambda e: form.update({"backend": e.value}),
-            ).classes("w-32")
+                value=form.backend,
+            ).bind_value_to(form, "backend").classes("w-32")
             ui.input(
                 label="Target BDF",
-                value=form["bdf"],
+                value=form.bdf,
                 placeholder="0000:01:00.0",
-                on_change=lambda e: form.update({"bdf": e.value}),
-            ).classes("w-48")
+            ).bind_value_to(form, "bdf").classes("w-48")
             ui.select(
                 options=["randread", "randwrite", "read", "write", "randrw", "rw"],
                 label="Workload Type",
-                value=form["workload_type"],
-                on_change=lambda e: form.update({"workload_type": e.value}),
-            ).classes("w-36")
+                value=form.workload_type,
+            ).bind_value_to(form, "workload_type").classes("w-36")
             ui.number(
                 label="IO Size (bytes)",
-                value=form["io_size"],
+                value=form.io_size,
                 min=512,
                 step=512,
-                on_change=lambda e: form.update({"io_size": int(e.value)}),
-            ).classes("w-36")
+            ).bind_value_to(form, "io_size").classes("w-36")
             ui.number(
                 label="Queue Depth",
-                value=form["queue_depth"],
+                value=form.queue_depth,
                 min=1,
-                on_change=lambda e: form.update({"queue_depth": int(e.value)}),
-            ).classes("w-28")
+            ).bind_value_to(form, "queue_depth").classes("w-28")
             ui.number(
                 label="Duration (s)",
-                value=form["duration"],
+                value=form.duration,
                 min=1,
-                on_change=lambda e: form.update({"duration": int(e.value)}),
-            ).classes("w-28")
+            ).bind_value_to(form, "duration").classes("w-28")
             ui.number(
                 label="Read %",
-                value=form["read_pct"],
+                value=form.read_pct,
                 min=0,
                 max=100,
-                on_change=lambda e: form.update({"read_pct": int(e.value)}),
-            ).classes("w-24")
+            ).bind_value_to(form, "read_pct").classes("w-24")
             ui.number(
                 label="Workers",
-                value=form["workers"],
+                value=form.workers,
                 min=1,
-                on_change=lambda e: form.update({"workers": int(e.value)}),
-            ).classes("w-24")
+            ).bind_value_to(form, "workers").classes("w-24")
             ui.input(
                 label="Core Mask",
-                value=form["core_mask"],
+                value=form.core_mask,
                 placeholder="0xFF",
-                on_change=lambda e: form.update({"core_mask": e.value}),
-            ).classes("w-28")
+            ).bind_value_to(form, "core_mask").classes("w-28")
 
         with ui.row().classes("gap-2 mt-2"):
             ui.button("Start Workload", on_click=start_workload).props("flat color=positive")
@@ -289,30 +562,26 @@ def _workloads_content(device_id: str) -> None:
     with (
         ui.card()
         .classes("w-full p-4")
-        .style(f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}")
+        .style(_STYLE_CARD)
     ):
-        ui.label("Progress").classes("text-h6 mb-2").style(f"color: {COLORS.text_primary}")
+        ui.label("Progress").classes("text-h6 mb-2").style(STYLE_TEXT_PRIMARY)
         progress_container = ui.column().classes("w-full")
 
         @ui.refreshable
         def refresh_progress():
             progress_container.clear()
             with progress_container:
-                if not state.get("workload_id"):
-                    ui.label("No workload running.").style(f"color: {COLORS.text_muted}")
+                if not state.workload_id:
+                    ui.label("No workload running.").style(STYLE_TEXT_MUTED)
                     return
-                if state.get("running"):
-                    ui.spinner("dots", size="lg").style(f"color: {COLORS.blue}")
-                    ui.label(f"Workload {state['workload_id']} is running...").style(
-                        f"color: {COLORS.blue}"
-                    )
+                if state.running:
+                    ui.spinner("dots", size="lg").style(STYLE_BLUE)
+                    ui.label(f"Workload {state.workload_id} is running...").style(STYLE_BLUE)
                 else:
-                    ui.label(f"Workload {state['workload_id']} finished.").style(
-                        f"color: {COLORS.text_secondary}"
-                    )
+                    ui.label(f"Workload {state.workload_id} finished.").style(STYLE_TEXT_SECONDARY)
 
         progress_bar = ui.linear_progress(value=0, show_value=False).classes("w-full")
-        progress_label = ui.label("").style(f"color: {COLORS.text_secondary}")
+        progress_label = ui.label("").style(STYLE_TEXT_SECONDARY)
 
         def refresh_progress_data(data: dict):
             prog = data.get("progress")
@@ -333,132 +602,59 @@ def _workloads_content(device_id: str) -> None:
     with (
         ui.card()
         .classes("w-full p-4")
-        .style(f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}")
+        .style(_STYLE_CARD)
     ):
-        ui.label("DUT SMART Health").classes("text-h6 mb-2").style(f"color: {COLORS.text_primary}")
-        smart_cards_container = ui.row().classes("w-full gap-4")
-
-        @ui.refreshable
-        def refresh_smart_cards(smart: dict | None = None):
-            smart_cards_container.clear()
-            with smart_cards_container:
-                if smart is None:
-                    ui.label("No SMART data (pynvme backend only)").style(
-                        f"color: {COLORS.text_muted}"
-                    )
-                    return
-
-                temp = smart.get("composite_temp_celsius", 0)
-                ps = smart.get("power_state", 0)
-                poh = smart.get("power_on_hours", 0)
-                spare = smart.get("available_spare_pct", 100)
-
-                _smart_stat(
-                    "Temperature",
-                    f"{temp:.0f} C",
-                    _temp_color(temp),
-                    "thermostat",
-                )
-                _smart_stat(
-                    "Power State",
-                    f"PS{ps}",
-                    COLORS.blue,
-                    "power_settings_new",
-                )
-                _smart_stat(
-                    "Power-On Hours",
-                    f"{poh:,}",
-                    COLORS.text_primary,
-                    "schedule",
-                )
-                spare_color = COLORS.green if spare > 10 else COLORS.red
-                _smart_stat(
-                    "Available Spare",
-                    f"{spare}%",
-                    spare_color,
-                    "battery_std",
-                )
-
-        refresh_smart_cards()
+        ui.label("DUT SMART Health").classes("text-h6 mb-2").style(STYLE_TEXT_PRIMARY)
+        smart_placeholder = ui.label("No SMART data (pynvme backend only)").style(STYLE_TEXT_MUTED)
+        with ui.row().classes("w-full gap-4") as smart_cards_row:
+            stat_temp = _smart_stat("Temperature", "thermostat")
+            stat_ps = _smart_stat("Power State", "power_settings_new")
+            stat_poh = _smart_stat("Power-On Hours", "schedule")
+            stat_spare = _smart_stat("Available Spare", "battery_std")
+        smart_cards_row.set_visibility(False)
+
+        def update_smart_cards(smart: dict):
+            """Write the latest SMART values into the existing stat cards."""
+            if not smart_cards_row.visible:
+                smart_placeholder.set_visibility(False)
+                smart_cards_row.set_visibility(True)
+            temp = smart.get("composite_temp_celsius", 0)
+            spare = smart.get("available_spare_pct", 100)
+            stat_temp.set(f"{temp:.0f} C", _temp_color(temp))
+            stat_ps.set(f"PS{smart.get('power_state', 0)}", COLORS.blue)
+            stat_poh.set(f"{smart.get('power_on_hours', 0):,}", COLORS.text_primary)
+            stat_spare.set(f"{spare}%", COLORS.green if spare > 10 else COLORS.red)
 
     # --- Temperature Chart ---
     with (
         ui.card()
         .classes("w-full p-4")
-        .style(f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}")
+        .style(_STYLE_CARD)
     ):
-        ui.label("DUT Temperature").classes("text-h6 mb-2").style(f"color: {COLORS.text_primary}")
-        _temp_zone_mark_area = {
-            "silent": True,
-            "label": {"show": True, "position": "insideRight", "fontSize": 10},
-            "data": [
-                [
-                    {"yAxis": 0, "name": "Normal",
-                     "itemStyle": {"color": "rgba(63,185,80,0.08)"},
-                     "label": {"color": COLORS.green}},
-                    {"yAxis": 60},
-                ],
-                [
-                    {"yAxis": 60, "name": "Warm",
-                     "itemStyle": {"color": "rgba(210,153,34,0.08)"},
-                     "label": {"color": COLORS.yellow}},
-                    {"yAxis": 80},
-                ],
-                [
-                    {"yAxis": 80, "name": "Critical",
-                     "itemStyle": {"color": "rgba(248,81,73,0.08)"},
-                     "label": {"color": COLORS.red}},
-                    {"yAxis": 120},
-                ],
-            ],
-        }
-        temp_chart = ui.echart({
-            "animation": False,
-            "backgroundColor": "transparent",
-            "grid": {"containLabel": True},
-            "tooltip": {"trigger": "axis"},
-            "legend": {"textStyle": {"color": COLORS.text_secondary}},
-            "xAxis": {
-                "type": "time",
-                "axisLabel": {"color": COLORS.text_secondary},
-                "axisLine": {"lineStyle": {"color": COLORS.border}},
-            },
-            "yAxis": {
-                "type": "value",
-                "name": "Temperature (C)",
-                "nameTextStyle": {"color": COLORS.text_secondary},
-                "axisLabel": {"color": COLORS.text_secondary},
-                "splitLine": {"lineStyle": {"color": COLORS.border}},
-                "min": 0,
-            },
-            "series": [
-                {
-                    "name": "_zones",
-                    "type": "line",
-                    "data": [],
-                    "showSymbol": False,
-                    "lineStyle": {"width": 0},
-                    "markArea": _temp_zone_mark_area,
-                },
-            ],
-        }).classes("w-full").style("height: 300px")
+        ui.label("DUT Temperature").classes("text-h6 mb-2").style(STYLE_TEXT_PRIMARY)
+        temp_chart = (
+            ui.echart({**_TEMP_CHART_BASE, "series": [_TEMP_ZONE_SERIES]})
+            .classes("w-full")
+            .style("height: 300px")
+        )
+        smart_flush_timer = ui.timer(_SMART_FLUSH_INTERVAL_S, flush_smart, active=False)
 
     # --- Results ---
     with (
         ui.card()
         .classes("w-full p-4")
-        .style(f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}")
+        .style(_STYLE_CARD)
     ):
-        ui.label("Results").classes("text-h6 mb-2").style(f"color: {COLORS.text_primary}")
+        ui.label("Results").classes("text-h6 mb-2").style(STYLE_TEXT_PRIMARY)
         results_container = ui.column().classes("w-full")
 
         @ui.refreshable
         def refresh_results():
             results_container.clear()
             with results_container:
-                r = state.get("result")
+                r = state.result
                 if r is None:
-                    ui.label("No results yet.").style(f"color: {COLORS.text_muted}")
+                    ui.label("No results yet.").style(STYLE_TEXT_MUTED)
                     return
 
                 result_data = r.get("result") or {}
@@ -466,46 +662,21 @@ def _workloads_content(device_id: str) -> None:
                 if s is None:
                     err = result_data.get("error")
                     if err:
-                        ui.label(f"Error: {err}").style(f"color: {COLORS.red}")
+                        ui.label(f"Error: {err}").style(STYLE_RED)
                     else:
-                        ui.label("No stats available.").style(f"color: {COLORS.text_muted}")
+                        ui.label("No stats available.").style(STYLE_TEXT_MUTED)
                     return
 
                 rows = [
-                    {"metric": "IOPS Total", "value": f"{s.get('iops_total', 0):,.0f}"},
-                    {"metric": "IOPS Read", "value": f"{s.get('iops_read', 0):,.0f}"},
-                    {"metric": "IOPS Write", "value": f"{s.get('iops_write', 0):,.0f}"},
-                    {
-                        "metric": "BW Total (MB/s)",
-                        "value": f"{s.get('bandwidth_total_mbps', 0):,.1f}",
-                    },
-                    {
-                        "metric": "BW Read (MB/s)",
-                        "value": f"{s.get('bandwidth_read_mbps', 0):,.1f}",
-                    },
-                    {
-                        "metric": "BW Write (MB/s)",
-                        "value": f"{s.get('bandwidth_write_mbps', 0):,.1f}",
-                    },
-                    {"metric": "Latency Avg (us)", "value": f"{s.get('latency_avg_us', 0):.1f}"},
-                    {"metric": "Latency Max (us)", "value": f"{s.get('latency_max_us', 0):.1f}"},
-                    {"metric": "Latency p50 (us)", "value": f"{s.get('latency_p50_us', 0):.1f}"},
-                    {"metric": "Latency p99 (us)", "value": f"{s.get('latency_p99_us', 0):.1f}"},
-                    {"metric": "Latency p999 (us)", "value": f"{s.get('latency_p999_us', 0):.1f}"},
-                    {"metric": "CPU Usage (%)", "value": f"{s.get('cpu_usage_percent', 0):.1f}"},
+                    {"metric": metric, "value": fmt(s.get(key, 0))}
+                    for metric, key, fmt in _RESULT_ROWS
                 ]
-                columns = [
-                    {"name": "metric", "label": "Metric", "field": "metric", "align": "left"},
-                    {"name": "value", "label": "Value", "field": "value", "align": "right"},
-                ]
-                ui.table(columns=columns, rows=rows, row_key="metric").classes("w-full")
+                ui.table(columns=_METRIC_COLUMNS, rows=rows, row_key="metric").classes("w-full")
 
                 # SMART summary after I/O stats
                 sh = result_data.get("smart_history")
                 if sh and sh.get("snapshots"):
-                    ui.label("SMART Summary").classes("text-subtitle1 mt-4").style(
-                        f"color: {COLORS.cyan}"
-                    )
+                    ui.label("SMART Summary").classes("text-subtitle1 mt-4").style(STYLE_CYAN)
                     smart_rows = [
                         {
                             "metric": "Peak Temperature",
@@ -537,12 +708,8 @@ def _workloads_content(device_id: str) -> None:
                     smart_rows.append(
                         {"metric": "Samples Collected", "value": str(len(sh.get("snapshots", [])))}
                     )
-                    smart_cols = [
-                        {"name": "metric", "label": "Metric", "field": "metric", "align": "left"},
-                        {"name": "value", "label": "Value", "field": "value", "align": "right"},
-                    ]
                     ui.table(
-                        columns=smart_cols,
+                        columns=_METRIC_COLUMNS,
                         rows=smart_rows,
                         row_key="metric",
                     ).classes("w-full")
@@ -553,25 +720,21 @@ def _workloads_content(device_id: str) -> None:
     with (
         ui.card()
         .classes("w-full p-4")
-        .style(f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}")
+        .style(_STYLE_CARD)
     ):
-        ui.label("Combined View (Host + Switch)").classes("text-h6 mb-2").style(
-            f"color: {COLORS.text_primary}"
-        )
+        ui.label("Combined View (Host + Switch)").classes("text-h6 mb-2").style(STYLE_TEXT_PRIMARY)
         combined_container = ui.row().classes("w-full gap-4")
 
+        @_single_flight
         async def load_combined():
-            wl_id = state.get("workload_id")
+            wl_id = state.workload_id
             if not wl_id:
                 ui.notify("No workload to show combined view for", type="warning")
                 return
             try:
-                resp = await ui.run_javascript(
-                    f"return await (await fetch("
-                    f'"/api/workloads/{wl_id}/combined/{device_id}"'
-                    f")).json()",
-                    timeout=10.0,
-                )
+                resp = (
+                    await api.get_client().get(f"/api/workloads/{wl_id}/combined/{device_id}")
+                ).json()
                 _render_combined(resp)
             except Exception as e:
                 ui.notify(f"Error: {e}", type="negative")
@@ -583,55 +746,43 @@ def _workloads_content(device_id: str) -> None:
                 with (
                     ui.card()
                     .classes("flex-1 p-3")
-                    .style(f"background: {COLORS.bg_card}; border: 1px solid {COLORS.border}")
+                    .style(_STYLE_PANEL)
                 ):
-                    ui.label("Host Workload").classes("text-subtitle1").style(
-                        f"color: {COLORS.blue}"
-                    )
+                    ui.label("Host Workload").classes("text-subtitle1").style(STYLE_BLUE)
                     ws = data.get("workload_stats")
                     if ws:
-                        ui.label(f"IOPS: {ws.get('iops_total', 0):,.0f}").style(
-                            f"color: {COLORS.text_primary}"
-                        )
+                        ui.label(f"IOPS: {ws.get('iops_total', 0):,.0f}").style(STYLE_TEXT_PRIMARY)
                         ui.label(f"BW: {ws.get('bandwidth_total_mbps', 0):,.1f} MB/s").style(
-                            f"color: {COLORS.text_primary}"
+                            STYLE_TEXT_PRIMARY
                         )
                         ui.label(f"Lat avg: {ws.get('latency_avg_us', 0):.1f} us").style(
-                            f"color: {COLORS.text_secondary}"
+                            STYLE_TEXT_SECONDARY
                         )
                     else:
-                        ui.label("No stats").style(f"color: {COLORS.text_muted}")
+                        ui.label("No stats").style(STYLE_TEXT_MUTED)
 
                 # Right: Switch perf
                 with (
                     ui.card()
                     .classes("flex-1 p-3")
-                    .style(f"background: {COLORS.bg_card}; border: 1px solid {COLORS.border}")
+                    .style(_STYLE_PANEL)
                 ):
-                    ui.label("Switch Performance").classes("text-subtitle1").style(
-                        f"color: {COLORS.green}"
-                    )
+                    ui.label("Switch Performance").classes("text-subtitle1").style(STYLE_GREEN)
                     snap = data.get("switch_snapshot")
                     if snap:
                         port_stats = snap.get("port_stats", [])
-                        total_in = sum(
-                            ps.get("ingress_payload_byte_rate", 0) for ps in port_stats
-                        ) / (1024 * 1024)
-                        total_out = sum(
-                            ps.get("egress_payload_byte_rate", 0) for ps in port_stats
-                        ) / (1024 * 1024)
-                        ui.label(f"Ingress: {total_in:.1f} MB/s").style(
-                            f"color: {COLORS.text_primary}"
-                        )
-                        ui.label(f"Egress: {total_out:.1f} MB/s").style(
-                            f"color: {COLORS.text_primary}"
-                        )
-                        ui.label(f"Ports: {len(port_stats)}").style(
-                            f"color: {COLORS.text_secondary}"
-                        )
+                        total_in = total_out = 0
+                        for ps in port_stats:
+                            total_in += ps.get("ingress_payload_byte_rate", 0)
+                            total_out += ps.get("egress_payload_byte_rate", 0)
+                        total_in /= _MB
+                        total_out /= _MB
+                        ui.label(f"Ingress: {total_in:.1f} MB/s").style(STYLE_TEXT_PRIMARY)
+                        ui.label(f"Egress: {total_out:.1f} MB/s").style(STYLE_TEXT_PRIMARY)
+                        ui.label(f"Ports: {len(port_stats)}").style(STYLE_TEXT_SECONDARY)
                     else:
                         ui.label("No switch perf data (start perf monitor first)").style(
-                            f"color: {COLORS.text_muted}"
+                            STYLE_TEXT_MUTED
                         )
 
         ui.button("Refresh Combined View", on_click=load_combined).props("flat color=primary")
@@ -640,17 +791,15 @@ def _workloads_content(device_id: str) -> None:
     with (
         ui.card()
         .classes("w-full p-4")
-        .style(f"background: {COLORS.bg_secondary}; border: 1px solid {COLORS.border}")
+        .style(_STYLE_CARD)
     ):
-        ui.label("Workload History").classes("text-h6 mb-2").style(f"color: {COLORS.text_primary}")
+        ui.label("Workload History").classes("text-h6 mb-2").style(STYLE_TEXT_PRIMARY)
         history_container = ui.column().classes("w-full")
 
+        @_single_flight
         async def load_history():
             try:
-                resp = await ui.run_javascript(
-                    'return await (await fetch("/api/workloads")).json()',
-                    timeout=10.0,
-                )
+                resp = (await api.get_client().get("/api/workloads")).json()
                 _render_history(resp)
             except Exception as e:
                 ui.notify(f"Error: {e}", type="negative")
@@ -659,7 +808,7 @@ def _workloads_content(device_id: str) -> None:
             history_container.clear()
             with history_container:
                 if not data:
-                    ui.label("No workload history.").style(f"color: {COLORS.text_muted}")
+                    ui.label("No workload history.").style(STYLE_TEXT_MUTED)
                     return
                 rows = []
                 for wl in data:
@@ -671,43 +820,56 @@ def _workloads_content(device_id: str) -> None:
                             "backend": wl.get("backend", ""),
                             "bdf": wl.get("target_bdf", ""),
                             "state": wl.get("state", ""),
-                            "iops": f"{s.get('iops_total', 0):,.0f}" if s else "-",
-                            "bw": f"{s.get('bandwidth_total_mbps', 0):,.1f}" if s else "-",
+                            "iops": _fmt_count(s.get("iops_total", 0)) if s else "-",
+                            "bw": _fmt_rate(s.get("bandwidth_total_mbps", 0)) if s else "-",
                         }
                     )
-                columns = [
-                    {"name": "id", "label": "ID", "field": "id", "align": "left"},
-                    {"name": "backend", "label": "Backend", "field": "backend", "align": "left"},
-                    {"name": "bdf", "label": "BDF", "field": "bdf", "align": "left"},
-                    {"name": "state", "label": "State", "field": "state", "align": "left"},
-                    {"name": "iops", "label": "IOPS", "field": "iops", "align": "right"},
-                    {"name": "bw", "label": "BW (MB/s)", "field": "bw", "align": "right"},
-                ]
-                ui.table(columns=columns, rows=rows, row_key="id").classes("w-full")
+                ui.table(columns=_HISTORY_COLUMNS, rows=rows, row_key="id").classes("w-full")
 
         ui.button("Refresh History", on_click=load_history).props("flat color=primary")
 
-    # Auto-load backends on page open
-    ui.timer(0.1, load_backends, once=True)
+    # Load backends straight away: the in-process API needs no connected
+    # browser. The task has no slot stack of its own, so enter the page client.
+    # background_tasks keeps a strong reference and logs any exception.
+    async def _initial_load():
+        with page_client:
+            await load_backends()
+
+    background_tasks.create(_initial_load(), name="workloads-initial-load")
+
+
+class _SmartStat:
+    """Icon and value label of one SMART stat card, updated in place."""
+
+    __slots__ = ("color", "icon", "value")
+
+    def __init__(self, icon: ui.icon, value: ui.label) -> None:
+        self.icon = icon
+        self.value = value
+        self.color = ""
+
+    def set(self, text: str, color: str) -> None:
+        self.value.set_text(text)
+        if color != self.color:
+            self.color = color
+            self.icon.style(replace=f"color: {color}; font-size: 20px")
+            self.value.style(replace=f"color: {color}; font-weight: bold")
 
 
-def _smart_stat(label: str, value: str, color: str, icon: str) -> None:
-    """Render a SMART health stat card."""
+def _smart_stat(label: str, icon: str) -> _SmartStat:
+    """Render an empty SMART health stat card and return its updatable parts."""
     with (
         ui.card()
         .classes("flex-1 p-3")
-        .style(f"background: {COLORS.bg_card}; border: 1px solid {COLORS.border}; min-width: 140px")
+        .style(_STYLE_STAT_CARD)
     ):
         with ui.row().classes("items-center gap-2"):
-            ui.icon(icon).style(f"color: {color}; font-size: 20px")
-            ui.label(value).classes("text-subtitle1").style(f"color: {color}; font-weight: bold")
-        ui.label(label).style(f"color: {COLORS.text_muted}; font-size: 12px")
+            icon_el = ui.icon(icon)
+            value_el = ui.label("").classes("text-subtitle1")
+        ui.label(label).style(_STYLE_MUTED_12)
+    return _SmartStat(icon_el, value_el)
 
 
 def _temp_color(temp_c: float) -> str:
     """Return color based on temperature threshold."""
-    if temp_c >= 80:
-        return COLORS.red
-    if temp_c >= 60:
-        return COLORS.yellow
-    return COLORS.green
+    return _TEMP_COLORS[bisect_right(_TEMP_BOUNDS_C, temp_c)]
@@ -0,0 +1,42 @@
+"""In-process client for calling the Calypso REST API from UI pages.
+
+The dashboard is mounted on the same FastAPI app that serves ``/api``, so
+pages can dispatch requests straight into it over ASGI instead of asking
+the browser to ``fetch()`` the endpoint and relay the JSON back.
+"""
+
+from __future__ import annotations
+
+import httpx
+from fastapi import FastAPI
+
+_client: httpx.AsyncClient | None = None
+
+
+def bind_app(app: FastAPI) -> None:
+    """Create the shared client for *app*. Called once from ``setup_ui``."""
+    global _client
+    _client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://calypso",
+        timeout=10.0,
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared API client.
+
+    Raises:
+        RuntimeError: If :func:`bind_app` has not been called.
+    """
+    if _client is None:
+        raise RuntimeError("API client not bound; call bind_app() first")
+    return _client
+
+
+async def close() -> None:
+    """Close the shared client, if any."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
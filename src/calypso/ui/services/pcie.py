@@ -1,20 +1,83 @@
 """Shared PCIe scan and connect helpers for UI pages.
 
-These functions run blocking PLX SDK calls and should be invoked via
-``asyncio.to_thread()`` from NiceGUI async handlers.
+``scan_pcie_devices`` and ``connect_pcie_device`` run blocking PLX SDK
+calls. NiceGUI async handlers should await the ``*_async`` variants,
+which run them on a dedicated single-thread executor so SDK calls are
+serialised and a burst of clicks cannot flood the default thread pool.
+Wrapping the blocking functions in ``asyncio.to_thread()`` is deprecated.
 """
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
 from calypso.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_driver_ready = False
+_driver_lock = threading.Lock()
+
+# SDK-dependent callables, bound by _ensure_driver() on first success so the
+# hot scan/connect paths don't re-run function-level imports on every call.
+_sdk = SimpleNamespace()
+
+# The PLX SDK is not thread-safe; funnel all UI calls through one worker.
+_pcie_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pcie-sdk")
+
 
 class DriverSetupError(Exception):
     """Raised when the PLX SDK driver/library cannot be loaded."""
 
 
+def _ensure_driver() -> None:
+    """Load the PLX library and configure prototypes once per process.
+
+    Raises:
+        DriverSetupError: If the PLX library or driver is unavailable.
+    """
+    global _driver_ready
+    if _driver_ready:
+        return
+
+    from calypso.bindings.functions import initialize
+    from calypso.bindings.library import load_library
+    from calypso.exceptions import DriverNotFoundError
+
+    with _driver_lock:
+        if _driver_ready:
+            return
+        try:
+            load_library()
+            initialize()
+        except DriverNotFoundError as exc:
+            raise DriverSetupError(str(exc)) from exc
+        except Exception as exc:
+            raise DriverSetupError(f"Failed to initialize PLX SDK: {exc}") from exc
+
+        from calypso.api.app import get_device_registry
+        from calypso.core.discovery import scan_devices
+        from calypso.core.switch import SwitchDevice
+        from calypso.transport.pcie import PcieTransport
+
+        _sdk.DriverNotFoundError = DriverNotFoundError
+        _sdk.get_device_registry = get_device_registry
+        _sdk.scan_devices = scan_devices
+        _sdk.SwitchDevice = SwitchDevice
+        _sdk.PcieTransport = PcieTransport
+        _driver_ready = True
+
+
+def reset_driver_cache() -> None:
+    """Force the next scan/connect to re-run PLX SDK initialisation."""
+    global _driver_ready
+    with _driver_lock:
+        _driver_ready = False
+
+
 def scan_pcie_devices() -> list:
     """Load the PLX SDK and scan for PCIe devices.
 
@@ -24,23 +87,11 @@ def scan_pcie_devices() -> list:
     Raises:
         DriverSetupError: If the PLX library or driver is unavailable.
     """
-    from calypso.bindings.functions import initialize
-    from calypso.bindings.library import load_library
-    from calypso.core.discovery import scan_devices
-    from calypso.exceptions import DriverNotFoundError
-    from calypso.transport.pcie import PcieTransport
-
-    try:
-        load_library()
-        initialize()
-    except DriverNotFoundError as exc:
-        raise DriverSetupError(str(exc)) from exc
-    except Exception as exc:
-        raise DriverSetupError(f"Failed to initialize PLX SDK: {exc}") from exc
+    _ensure_driver()
 
     try:
-        return scan_devices(PcieTransport())
-    except DriverNotFoundError as exc:
+        return _sdk.scan_devices(_sdk.PcieTransport())
+    except _sdk.DriverNotFoundError as exc:
         raise DriverSetupError(str(exc)) from exc
 
 
@@ -63,20 +114,9 @@ def connect_pcie_device(device_index: int) -> str:
     if device_index < 0:
         raise ValueError(f"Invalid device index: {device_index}")
 
-    from calypso.api.app import get_device_registry
-    from calypso.bindings.functions import initialize
-    from calypso.bindings.library import load_library
-    from calypso.core.switch import SwitchDevice
-    from calypso.exceptions import DriverNotFoundError
-    from calypso.transport.pcie import PcieTransport
+    _ensure_driver()
 
-    try:
-        load_library()
-        initialize()
-    except DriverNotFoundError as exc:
-        raise DriverSetupError(str(exc)) from exc
-
-    sw = SwitchDevice(PcieTransport())
+    sw = _sdk.SwitchDevice(_sdk.PcieTransport())
     try:
         sw.open(device_index)
         device_id = f"dev_{sw.device_info.bus:02x}_{sw.device_info.slot:02x}"
@@ -84,7 +124,7 @@ def connect_pcie_device(device_index: int) -> str:
         sw.close()
         raise
 
-    registry = get_device_registry()
+    registry = _sdk.get_device_registry()
     existing = registry.get(device_id)
     if existing is not None:
         # Device already registered at this BDF -- reuse it, close the new handle.
@@ -93,3 +133,15 @@ def connect_pcie_device(device_index: int) -> str:
 
     registry[device_id] = sw
     return device_id
+
+
+async def scan_pcie_devices_async() -> list:
+    """Run :func:`scan_pcie_devices` on the PCIe SDK executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pcie_executor, scan_pcie_devices)
+
+
+async def connect_pcie_device_async(device_index: int) -> str:
+    """Run :func:`connect_pcie_device` on the PCIe SDK executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pcie_executor, connect_pcie_device, device_index)
@@ -8,7 +8,7 @@ Cyan accent, green/yellow/red status indicators, JetBrains Mono for hex values.
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Colors:
     """Dashboard color palette."""
 
@@ -45,6 +45,16 @@ class Colors:
 
 COLORS = Colors()
 
+# Pre-built ``color:`` styles for the label colours most pages share
+STYLE_TEXT_PRIMARY = f"color: {COLORS.text_primary}"
+STYLE_TEXT_SECONDARY = f"color: {COLORS.text_secondary}"
+STYLE_TEXT_MUTED = f"color: {COLORS.text_muted}"
+STYLE_CYAN = f"color: {COLORS.cyan}"
+STYLE_BLUE = f"color: {COLORS.blue}"
+STYLE_GREEN = f"color: {COLORS.green}"
+STYLE_YELLOW = f"color: {COLORS.yellow}"
+STYLE_RED = f"color: {COLORS.red}"
+
 # Global CSS injected into every page
 GLOBAL_CSS = f"""
 :root {{
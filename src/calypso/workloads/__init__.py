@@ -6,30 +6,26 @@ degrades gracefully when neither is installed.
 
 from __future__ import annotations
 
+import functools
 import shutil
 
-_pynvme_available: bool | None = None
-_spdk_available: bool | None = None
+_backends_cache: tuple[str, ...] | None = None
 
 
+@functools.cache
 def is_pynvme_available() -> bool:
     """Check whether the pynvme library can be imported."""
-    global _pynvme_available
-    if _pynvme_available is None:
-        try:
-            import pynvme  # noqa: F401
-            _pynvme_available = True
-        except ImportError:
-            _pynvme_available = False
-    return _pynvme_available
+    try:
+        import pynvme  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
 
+@functools.cache
 def is_spdk_available() -> bool:
     """Check whether the spdk_nvme_perf binary is on PATH."""
-    global _spdk_available
-    if _spdk_available is None:
-        _spdk_available = shutil.which("spdk_nvme_perf") is not None
-    return _spdk_available
+    return shutil.which("spdk_nvme_perf") is not None
 
 
 def is_any_backend_available() -> bool:
@@ -37,11 +33,29 @@ def is_any_backend_available() -> bool:
     return is_pynvme_available() or is_spdk_available()
 
 
-def available_backends() -> list[str]:
-    """Return names of all usable backends."""
-    backends: list[str] = []
-    if is_spdk_available():
-        backends.append("spdk")
-    if is_pynvme_available():
-        backends.append("pynvme")
-    return backends
+def available_backends(flush_cache: bool = False) -> tuple[str, ...]:
+    """Return names of all usable backends.
+
+    The result is probed once and cached as an immutable tuple.
+
+    Args:
+        flush_cache: Re-probe all backends (e.g. after installing one).
+    """
+    global _backends_cache
+    if flush_cache:
+        flush_backend_cache()
+    if _backends_cache is None:
+        _backends_cache = tuple(
+            name
+            for name, probe in (("spdk", is_spdk_available), ("pynvme", is_pynvme_available))
+            if probe()
+        )
+    return _backends_cache
+
+
+def flush_backend_cache() -> None:
+    """Forget all cached backend probe results."""
+    global _backends_cache
+    _backends_cache = None
+    is_pynvme_available.cache_clear()
+    is_spdk_available.cache_clear()
@@ -0,0 +1,43 @@
+"""CPU affinity for workload housekeeping threads (Linux only).
+
+SMART polling and subprocess monitoring threads can wake on the same
+cores that SPDK/pynvme pin for I/O submission. Setting
+``CALYPSO_HOUSEKEEPING_CPUS`` (e.g. ``"0"`` or ``"0,1"``) confines those
+threads to the listed CPUs. Unset, threads keep the default affinity.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+
+from calypso.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_ENV_VAR = "CALYPSO_HOUSEKEEPING_CPUS"
+
+
+@functools.cache
+def housekeeping_cpus() -> frozenset[int] | None:
+    """Return the configured housekeeping CPU set, or None if unset/invalid."""
+    raw = os.environ.get(_ENV_VAR, "").strip()
+    if not raw:
+        return None
+    try:
+        cpus = frozenset(int(part) for part in raw.split(",") if part.strip())
+    except ValueError:
+        logger.warning("housekeeping_cpus_invalid", value=raw)
+        return None
+    return cpus or None
+
+
+def pin_housekeeping_thread() -> None:
+    """Restrict the calling thread to the housekeeping CPUs, if configured."""
+    cpus = housekeeping_cpus()
+    if cpus is None:
+        return
+    try:
+        os.sched_setaffinity(0, cpus)
+    except (AttributeError, OSError) as exc:
+        logger.debug("housekeeping_affinity_failed", error=str(exc))
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import abc
+import itertools
+import os
 
 from calypso.workloads.models import (
     WorkloadConfig,
@@ -10,6 +12,15 @@ from calypso.workloads.models import (
     WorkloadResult,
 )
 
+# Shared by every backend so IDs never collide in the manager's routing map.
+# next() on itertools.count is atomic under the GIL.
+_workload_ids = itertools.count(1)
+
+
+def new_workload_id() -> str:
+    """Return a process-unique workload ID (no randomness, no syscall)."""
+    return f"wl_{os.getpid():x}_{next(_workload_ids):x}"
+
 
 class WorkloadBackend(abc.ABC):
     """Base class for NVMe workload generation backends."""
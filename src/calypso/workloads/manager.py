@@ -20,6 +20,13 @@ from calypso.workloads.models import (
 
 logger = get_logger(__name__)
 
+# Placeholder in _active_bdfs while backend.start() runs outside the lock
+_PENDING_START = "<starting>"
+
+_TERMINAL_STATES = frozenset(
+    {WorkloadState.COMPLETED, WorkloadState.FAILED, WorkloadState.STOPPED}
+)
+
 
 class WorkloadManager:
     """Manages workload lifecycle across all available backends."""
@@ -27,9 +34,17 @@ class WorkloadManager:
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._backends: dict[BackendType, WorkloadBackend] = {}
-        self._workload_backend_map: dict[str, BackendType] = {}
+        self._backend_for: dict[str, WorkloadBackend] = {}  # workload_id -> backend
         self._active_bdfs: dict[str, str] = {}  # bdf -> workload_id
+        self._workload_id_to_bdf: dict[str, str] = {}  # reverse of _active_bdfs
         self._configs: dict[str, WorkloadConfig] = {}
+        # Immutable (workload_id, backend type) pairs, swapped on every insert so
+        # list_workloads can iterate it without taking the lock.
+        self._snapshot: tuple[tuple[str, BackendType], ...] = ()
+        # Finished workloads never change, so their status is built once
+        self._final_status_cache: dict[str, WorkloadStatus] = {}
+        self._backend_types: tuple[BackendType, ...] = ()
+        self._shutdownable: list[WorkloadBackend] = []
         self._initialized = False
 
     def _init_backends(self) -> None:
@@ -50,11 +65,16 @@ class WorkloadManager:
             self._backends[BackendType.PYNVME] = PynvmeBackend()
             logger.info("workload_backend_loaded", backend="pynvme")
 
+        self._backend_types = tuple(self._backends)
+        self._shutdownable = [
+            b for b in self._backends.values() if callable(getattr(b, "shutdown", None))
+        ]
+
     @property
-    def available_backends(self) -> list[BackendType]:
-        """Return list of backends that are installed and usable."""
+    def available_backends(self) -> tuple[BackendType, ...]:
+        """Return the backends that are installed and usable."""
         self._init_backends()
-        return list(self._backends.keys())
+        return self._backend_types
 
     def validate_target(self, backend_type: BackendType, bdf: str) -> bool:
         """Validate whether a target BDF is accessible via the given backend."""
@@ -72,29 +92,32 @@ class WorkloadManager:
         if backend is None:
             raise WorkloadBackendUnavailable(
                 f"Backend '{config.backend.value}' is not available. "
-                f"Available: {[b.value for b in self._backends]}"
+                f"Available: {[b.value for b in self._backend_types]}"
             )
 
+        # Reserve the BDF, then release the lock for the (slow) backend start
         with self._lock:
-            # Prevent duplicate BDF usage
-            existing_id = self._active_bdfs.get(config.target_bdf)
-            if existing_id is not None:
-                existing_backend = self._workload_backend_map.get(existing_id)
-                if existing_backend is not None:
-                    eb = self._backends.get(existing_backend)
-                    if eb is not None and eb.is_running(existing_id):
-                        raise WorkloadAlreadyRunning(
-                            f"BDF {config.target_bdf} already has active workload "
-                            f"{existing_id}"
-                        )
-                # Previous workload finished, clean up stale tracking
-                del self._active_bdfs[config.target_bdf]
-
+            self._check_bdf_free(config.target_bdf)
+            # Any previous workload on this BDF has finished; drop stale tracking
+            stale_id = self._active_bdfs.pop(config.target_bdf, None)
+            if stale_id is not None:
+                self._workload_id_to_bdf.pop(stale_id, None)
+            self._active_bdfs[config.target_bdf] = _PENDING_START
+
+        try:
             workload_id = backend.start(config)
+        except BaseException:
+            with self._lock:
+                if self._active_bdfs.get(config.target_bdf) == _PENDING_START:
+                    del self._active_bdfs[config.target_bdf]
+            raise
 
-            self._workload_backend_map[workload_id] = config.backend
+        with self._lock:
+            self._backend_for[workload_id] = backend
             self._active_bdfs[config.target_bdf] = workload_id
+            self._workload_id_to_bdf[workload_id] = config.target_bdf
             self._configs[workload_id] = config
+            self._snapshot = (*self._snapshot, (workload_id, config.backend))
 
         logger.info(
             "workload_started",
@@ -103,7 +126,8 @@ class WorkloadManager:
             bdf=config.target_bdf,
         )
 
-        return WorkloadStatus(
+        # Every field comes from an already-validated model; skip re-validation
+        return WorkloadStatus.model_construct(
             workload_id=workload_id,
             backend=config.backend,
             target_bdf=config.target_bdf,
@@ -120,12 +144,11 @@ class WorkloadManager:
 
         with self._lock:
             # Clean up BDF tracking
-            for bdf, wl_id in list(self._active_bdfs.items()):
-                if wl_id == workload_id:
-                    del self._active_bdfs[bdf]
-                    break
+            bdf = self._workload_id_to_bdf.pop(workload_id, None)
+            if bdf is not None:
+                self._active_bdfs.pop(bdf, None)
 
-        return WorkloadStatus(
+        status = WorkloadStatus.model_construct(
             workload_id=workload_id,
             backend=config.backend,
             target_bdf=config.target_bdf,
@@ -133,9 +156,20 @@ class WorkloadManager:
             config=config,
             result=result,
         )
+        # A poll may have cached the run as FAILED before stop() marked it
+        # STOPPED; the post-stop result is authoritative.
+        if result.state in _TERMINAL_STATES:
+            self._final_status_cache[workload_id] = status
+        else:
+            self._final_status_cache.pop(workload_id, None)
+        return status
 
     def get_status(self, workload_id: str) -> WorkloadStatus:
         """Get full status of a workload."""
+        cached = self._final_status_cache.get(workload_id)
+        if cached is not None:
+            return cached
+
         backend = self._get_backend_for(workload_id)
         config = self._configs[workload_id]
         result = backend.get_result(workload_id)
@@ -144,7 +178,7 @@ class WorkloadManager:
         if backend.is_running(workload_id):
             progress = backend.get_progress(workload_id)
 
-        return WorkloadStatus(
+        status = WorkloadStatus.model_construct(
             workload_id=workload_id,
             backend=config.backend,
             target_bdf=config.target_bdf,
@@ -153,13 +187,18 @@ class WorkloadManager:
             result=result if result.state != WorkloadState.RUNNING else None,
             progress=progress,
         )
+        if result.state in _TERMINAL_STATES:
+            self._final_status_cache[workload_id] = status
+        return status
 
     def list_workloads(self) -> list[WorkloadStatus]:
-        """List all tracked workloads."""
-        with self._lock:
-            workload_ids = list(self._workload_backend_map.keys())
+        """List all tracked workloads.
+
+        Finished workloads are served from the status cache without
+        touching their backend.
+        """
         statuses = []
-        for workload_id in workload_ids:
+        for workload_id, _ in self._snapshot:
             try:
                 statuses.append(self.get_status(workload_id))
             except Exception:
@@ -168,24 +207,32 @@ class WorkloadManager:
 
     def shutdown(self) -> None:
         """Stop all running workloads and clean up."""
-        for backend in self._backends.values():
-            if hasattr(backend, "shutdown"):
-                try:
-                    backend.shutdown()
-                except Exception:
-                    logger.warning("backend_shutdown_error", backend=backend.backend_name)
+        for backend in self._shutdownable:
+            try:
+                backend.shutdown()
+            except Exception:
+                logger.warning("backend_shutdown_error", backend=backend.backend_name)
         with self._lock:
             self._active_bdfs.clear()
+            self._workload_id_to_bdf.clear()
         logger.info("workload_manager_shutdown")
 
+    def _check_bdf_free(self, bdf: str) -> None:
+        """Raise if *bdf* already has a running workload. Caller holds the lock."""
+        existing_id = self._active_bdfs.get(bdf)
+        if existing_id is None:
+            return
+        if existing_id == _PENDING_START:
+            raise WorkloadAlreadyRunning(f"BDF {bdf} already has a workload starting")
+        eb = self._backend_for.get(existing_id)
+        if eb is not None and eb.is_running(existing_id):
+            raise WorkloadAlreadyRunning(
+                f"BDF {bdf} already has active workload {existing_id}"
+            )
+
     def _get_backend_for(self, workload_id: str) -> WorkloadBackend:
         """Look up the backend responsible for a given workload."""
-        backend_type = self._workload_backend_map.get(workload_id)
-        if backend_type is None:
-            raise WorkloadNotFoundError(f"Workload {workload_id} not found")
-        backend = self._backends.get(backend_type)
+        backend = self._backend_for.get(workload_id)
         if backend is None:
-            raise WorkloadNotFoundError(
-                f"Backend for workload {workload_id} is no longer available"
-            )
+            raise WorkloadNotFoundError(f"Workload {workload_id} not found")
         return backend
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 from pydantic import BaseModel, Field, field_validator
 
-_BDF_RE = re.compile(r"^[0-9a-fA-F]{4}:[0-9a-fA-F]{2}:[0-9a-fA-F]{2}\.[0-7]$")
-_CORE_MASK_RE = re.compile(r"^0[xX][0-9a-fA-F]+$")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_FUNCTION_DIGITS = frozenset("01234567")
 
 
 class WorkloadType(str, Enum):
@@ -42,6 +41,8 @@ class WorkloadState(str, Enum):
 class WorkloadConfig(BaseModel):
     """Configuration for a workload run."""
 
+    model_config = {"frozen": True}
+
     backend: BackendType
     target_bdf: str = Field(description="PCIe BDF address, e.g. 0000:01:00.0")
     workload_type: WorkloadType = WorkloadType.RANDREAD
@@ -58,14 +59,24 @@ class WorkloadConfig(BaseModel):
     @field_validator("target_bdf")
     @classmethod
     def validate_bdf(cls, v: str) -> str:
-        if not _BDF_RE.fullmatch(v):
+        # Fixed-width DDDD:BB:SS.F -- cheaper as position checks than a regex
+        if (
+            len(v) != 12
+            or v[4] != ":"
+            or v[7] != ":"
+            or v[10] != "."
+            or v[11] not in _FUNCTION_DIGITS
+            or not _HEX_DIGITS.issuperset(v[:4] + v[5:7] + v[8:10])
+        ):
             raise ValueError(f"Invalid PCIe BDF address: {v!r} (expected format: 0000:01:00.0)")
         return v
 
     @field_validator("core_mask")
     @classmethod
     def validate_core_mask(cls, v: str | None) -> str | None:
-        if v is not None and not _CORE_MASK_RE.fullmatch(v):
+        if v is not None and not (
+            len(v) > 2 and v[0] == "0" and v[1] in "xX" and _HEX_DIGITS.issuperset(v[2:])
+        ):
             raise ValueError(f"Invalid core mask: {v!r} (expected hex format: 0xFF)")
         return v
 
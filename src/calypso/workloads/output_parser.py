@@ -7,131 +7,126 @@ import re
 from calypso.workloads.models import WorkloadIOStats
 
 
-# Regex patterns for spdk_nvme_perf output lines
-_TOTAL_LINE_RE = re.compile(
-    r"Total\s*:\s*"
-    r"(?P<iops>[\d.]+)\s*IOPS\s+"
-    r"(?P<bw>[\d.]+)\s*MiB/s",
-)
-_LATENCY_AVG_RE = re.compile(
-    r"Average\s+Latency\s*:\s*(?P<val>[\d.]+)\s*us",
-    re.IGNORECASE,
-)
-_LATENCY_MAX_RE = re.compile(
-    r"(?:Max|Maximum)\s+Latency\s*:\s*(?P<val>[\d.]+)\s*us",
-    re.IGNORECASE,
-)
-_LATENCY_P50_RE = re.compile(
-    r"50(?:\.0+)?(?:th)?\s*(?:percentile|pctile|%ile)\s*.*?:\s*(?P<val>[\d.]+)\s*us",
-    re.IGNORECASE,
-)
-_LATENCY_P99_RE = re.compile(
-    r"99(?:\.0+)?(?:th)?\s*(?:percentile|pctile|%ile)\s*.*?:\s*(?P<val>[\d.]+)\s*us",
-    re.IGNORECASE,
-)
-_LATENCY_P999_RE = re.compile(
-    r"99\.9(?:0+)?(?:th)?\s*(?:percentile|pctile|%ile)\s*.*?:\s*(?P<val>[\d.]+)\s*us",
-    re.IGNORECASE,
-)
-_READ_IOPS_RE = re.compile(
-    r"Read\s*:\s*(?P<iops>[\d.]+)\s*IOPS\s+(?P<bw>[\d.]+)\s*MiB/s",
-    re.IGNORECASE,
+# Per-line patterns for spdk_nvme_perf output, in match-priority order.
+# p999 must precede p99 (more specific match first). Only "Total" is
+# case-sensitive; the rest are wrapped in (?i:...).
+_LINE_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("total", r"Total\s*:\s*(?P<total_iops>[\d.]+)\s*IOPS\s+(?P<total_bw>[\d.]+)\s*MiB/s"),
+    ("read", r"(?i:Read\s*:\s*(?P<read_iops>[\d.]+)\s*IOPS\s+(?P<read_bw>[\d.]+)\s*MiB/s)"),
+    ("write", r"(?i:Write\s*:\s*(?P<write_iops>[\d.]+)\s*IOPS\s+(?P<write_bw>[\d.]+)\s*MiB/s)"),
+    ("avg", r"(?i:Average\s+Latency\s*:\s*(?P<avg_val>[\d.]+)\s*us)"),
+    ("max", r"(?i:(?:Max|Maximum)\s+Latency\s*:\s*(?P<max_val>[\d.]+)\s*us)"),
+    (
+        "p50",
+        r"(?i:50(?:\.0+)?(?:th)?\s*(?:percentile|pctile|%ile)\s*.*?:\s*(?P<p50_val>[\d.]+)\s*us)",
+    ),
+    (
+        "p999",
+        (
+            r"(?i:99\.9(?:0+)?(?:th)?\s*(?:percentile|pctile|%ile)\s*.*?:\s*"
+            r"(?P<p999_val>[\d.]+)\s*us)"
+        ),
+    ),
+    (
+        "p99",
+        r"(?i:99(?:\.0+)?(?:th)?\s*(?:percentile|pctile|%ile)\s*.*?:\s*(?P<p99_val>[\d.]+)\s*us)",
+    ),
+    ("cpu", r"(?i:CPU\s+Usage\s*:\s*(?P<cpu_val>[\d.]+)\s*%)"),
 )
-_WRITE_IOPS_RE = re.compile(
-    r"Write\s*:\s*(?P<iops>[\d.]+)\s*IOPS\s+(?P<bw>[\d.]+)\s*MiB/s",
-    re.IGNORECASE,
+
+# One alternation per line instead of up to nine separate searches. Each
+# branch carries its own lazy ".*?" prefix, so match() exhausts a branch over
+# the whole line before trying the next -- i.e. the priority order above is
+# kept, not "leftmost match wins". The outer named group closes last, so
+# m.lastgroup is the branch tag. spdk_nvme_perf output is plain ASCII, so
+# re.ASCII keeps \d, \s and the case folding on the narrow 8-bit paths.
+_LINE_RE = re.compile(
+    "|".join(f".*?(?P<{tag}>{pat})" for tag, pat in _LINE_PATTERNS), re.ASCII
 )
-_CPU_RE = re.compile(
-    r"CPU\s+Usage\s*:\s*(?P<val>[\d.]+)\s*%",
-    re.IGNORECASE,
+
+# Tags that carry an (iops, bandwidth) pair rather than a single value
+_PAIR_TAGS = frozenset({"total", "read", "write"})
+
+
+# Accumulated values, keyed by pattern group name
+_VAL_KEYS = (
+    "total_iops", "total_bw", "read_iops", "read_bw", "write_iops", "write_bw",
+    "avg_val", "max_val", "p50_val", "p99_val", "p999_val", "cpu_val",
 )
 
 
+class StreamingSpdkParser:
+    """Incremental spdk_nvme_perf parser fed one output line at a time.
+
+    Later lines overwrite earlier values of the same kind, so periodic
+    output converges on the final summary without re-parsing the text.
+    """
+
+    def __init__(self) -> None:
+        self._vals = dict.fromkeys(_VAL_KEYS, 0.0)
+
+    def feed(self, line: str) -> WorkloadIOStats | None:
+        """Consume *line*; return the updated stats if it carried a value."""
+        # Literal prefilter: every pattern needs a ':' and one of these
+        # keywords ("ile" covers percentile/pctile/%ile). Plain substring
+        # tests are far cheaper than the alternation, and let the banner,
+        # device rows and -LL histogram buckets skip the regex entirely.
+        if ":" not in line:
+            return None
+        low = line.lower()
+        if not (
+            "total" in low
+            or "read" in low
+            or "write" in low
+            or "latency" in low
+            or "ile" in low
+            or "cpu" in low
+        ):
+            return None
+        m = _LINE_RE.match(line)
+        if m is None:
+            return None
+        tag = m.lastgroup
+        vals = self._vals
+        if tag in _PAIR_TAGS:
+            vals[tag + "_iops"] = float(m.group(tag + "_iops"))
+            vals[tag + "_bw"] = float(m.group(tag + "_bw"))
+        else:
+            vals[tag + "_val"] = float(m.group(tag + "_val"))
+        return self.final()
+
+    def final(self) -> WorkloadIOStats:
+        """Return stats for everything fed so far."""
+        vals = self._vals
+        # When only a Total line is present (no separate Read/Write), leave
+        # per-direction fields at zero -- the caller knows the workload type and
+        # can attribute correctly if needed.
+        iops_total = vals["total_iops"]
+        bw_total_mbps = vals["total_bw"]
+        return WorkloadIOStats(
+            iops_read=vals["read_iops"],
+            iops_write=vals["write_iops"],
+            iops_total=iops_total if iops_total > 0 else vals["read_iops"] + vals["write_iops"],
+            bandwidth_read_mbps=vals["read_bw"],
+            bandwidth_write_mbps=vals["write_bw"],
+            bandwidth_total_mbps=(
+                bw_total_mbps if bw_total_mbps > 0 else vals["read_bw"] + vals["write_bw"]
+            ),
+            latency_avg_us=vals["avg_val"],
+            latency_max_us=vals["max_val"],
+            latency_p50_us=vals["p50_val"],
+            latency_p99_us=vals["p99_val"],
+            latency_p999_us=vals["p999_val"],
+            cpu_usage_percent=vals["cpu_val"],
+        )
+
+
 def parse_spdk_output(text: str) -> WorkloadIOStats:
     """Parse spdk_nvme_perf stdout into a WorkloadIOStats model.
 
     Handles multiple output format variations across SPDK versions.
     """
-    iops_total = 0.0
-    bw_total_mbps = 0.0
-    iops_read = 0.0
-    iops_write = 0.0
-    bw_read_mbps = 0.0
-    bw_write_mbps = 0.0
-    latency_avg = 0.0
-    latency_max = 0.0
-    latency_p50 = 0.0
-    latency_p99 = 0.0
-    latency_p999 = 0.0
-    cpu_usage = 0.0
-
+    parser = StreamingSpdkParser()
     for line in text.splitlines():
-        m = _TOTAL_LINE_RE.search(line)
-        if m:
-            iops_total = float(m.group("iops"))
-            bw_total_mbps = float(m.group("bw"))
-            continue
-
-        m = _READ_IOPS_RE.search(line)
-        if m:
-            iops_read = float(m.group("iops"))
-            bw_read_mbps = float(m.group("bw"))
-            continue
-
-        m = _WRITE_IOPS_RE.search(line)
-        if m:
-            iops_write = float(m.group("iops"))
-            bw_write_mbps = float(m.group("bw"))
-            continue
-
-        m = _LATENCY_AVG_RE.search(line)
-        if m:
-            latency_avg = float(m.group("val"))
-            continue
-
-        m = _LATENCY_MAX_RE.search(line)
-        if m:
-            latency_max = float(m.group("val"))
-            continue
-
-        m = _LATENCY_P50_RE.search(line)
-        if m:
-            latency_p50 = float(m.group("val"))
-            continue
-
-        # p999 must be checked before p99 (more specific match first)
-        m = _LATENCY_P999_RE.search(line)
-        if m:
-            latency_p999 = float(m.group("val"))
-            continue
-
-        m = _LATENCY_P99_RE.search(line)
-        if m:
-            latency_p99 = float(m.group("val"))
-            continue
-
-        m = _CPU_RE.search(line)
-        if m:
-            cpu_usage = float(m.group("val"))
-            continue
-
-    # When only a Total line is present (no separate Read/Write), leave
-    # per-direction fields at zero -- the caller knows the workload type and
-    # can attribute correctly if needed.
-
-    return WorkloadIOStats(
-        iops_read=iops_read,
-        iops_write=iops_write,
-        iops_total=iops_total if iops_total > 0 else iops_read + iops_write,
-        bandwidth_read_mbps=bw_read_mbps,
-        bandwidth_write_mbps=bw_write_mbps,
-        bandwidth_total_mbps=(
-            bw_total_mbps if bw_total_mbps > 0 else bw_read_mbps + bw_write_mbps
-        ),
-        latency_avg_us=latency_avg,
-        latency_max_us=latency_max,
-        latency_p50_us=latency_p50,
-        latency_p99_us=latency_p99,
-        latency_p999_us=latency_p999,
-        cpu_usage_percent=cpu_usage,
-    )
+        parser.feed(line)
+    return parser.final()
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import math
 import threading
 import time
-import uuid
+from collections import deque
 from dataclasses import dataclass, field
 
 from calypso.utils.logging import get_logger
-from calypso.workloads.base import WorkloadBackend
+from calypso.workloads.affinity import pin_housekeeping_thread
+from calypso.workloads.base import WorkloadBackend, new_workload_id
 from calypso.workloads.exceptions import (
     WorkloadNotFoundError,
 )
@@ -25,6 +29,29 @@ from calypso.workloads.smart_parser import read_smart_from_controller
 
 logger = get_logger(__name__)
 
+# Snapshots kept per workload (~1.7 h at the default 3 s poll interval).
+# Peak/average temperature still cover the whole run.
+_SMART_HISTORY_MAX = 2048
+
+# With several workloads sharing the poller, snapshots are appended to a
+# workload's history in batches of this size (or after the flush age), taking
+# wl.lock once per batch. A lone workload flushes every snapshot.
+_SMART_BATCH_SIZE = 8
+_SMART_FLUSH_SECONDS = 10.0
+
+# How long a validate_target() probe result is reused for the same BDF
+_VALIDATE_TTL_SECONDS = 5.0
+
+# IOWorker result-dict keys reduced by _aggregate_results, in column order
+_RESULT_KEYS = (
+    "io_count_read",
+    "io_count_write",
+    "mseconds",
+    "latency_average_us",
+    "latency_max_us",
+    "cpu_usage",
+)
+
 
 @dataclass
 class _PynvmeWorkload:
@@ -41,35 +68,258 @@ class _PynvmeWorkload:
     error: str | None = None
     current_iops: float = 0.0
     current_bw_mbps: float = 0.0
+    ns_size: int = 0
     lock: threading.Lock = field(default_factory=threading.Lock)
-    smart_snapshots: list[SmartSnapshot] = field(default_factory=list)
+    smart_snapshots: deque[SmartSnapshot] = field(
+        default_factory=lambda: deque(maxlen=_SMART_HISTORY_MAX)
+    )
     latest_smart: SmartSnapshot | None = None
     smart_poll_interval: float = 3.0
+    smart_count: int = 0
+    smart_temp_mean: float = 0.0
+    smart_temp_peak: float = 0.0
+    smart_history: SmartTimeSeries | None = None
+
+    def add_smart_snapshot(self, snap: SmartSnapshot) -> None:
+        """Record a SMART snapshot and update running stats. Caller holds lock."""
+        self.smart_snapshots.append(snap)
+        self.latest_smart = snap
+        temp = snap.composite_temp_celsius
+        if self.smart_count == 0 or temp > self.smart_temp_peak:
+            self.smart_temp_peak = temp
+        self.smart_count += 1
+        # Welford running mean: no unbounded sum to lose precision over long runs
+        self.smart_temp_mean += (temp - self.smart_temp_mean) / self.smart_count
+        self.smart_history = None
+
+
+class _SmartPoller:
+    """One background thread that polls SMART for every registered workload.
+
+    Entries sit in a min-heap keyed by next poll deadline, so N concurrent
+    workloads cost one mostly-sleeping thread instead of N. The thread is
+    started on the first registration and exits once nothing is registered.
+
+    ``latest_smart`` is published as soon as a snapshot is read; the history
+    append is batched per workload and flushed on unregister.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._entries: dict[str, tuple[_PynvmeWorkload, object]] = {}
+        self._polling: str | None = None
+        # workload_id -> (monotonic time of first pending snapshot, snapshots)
+        self._pending: dict[str, tuple[float, list[SmartSnapshot]]] = {}
+        self._thread: threading.Thread | None = None
+
+    def register(self, wl: _PynvmeWorkload, ctrl: object) -> None:
+        """Start polling *ctrl* for *wl*, beginning immediately."""
+        with self._cond:
+            self._entries[wl.workload_id] = (wl, ctrl)
+            heapq.heappush(self._heap, (time.monotonic(), next(self._seq), wl.workload_id))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pynvme-smart", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def unregister(self, workload_id: str) -> None:
+        """Stop polling *workload_id*; waits out a poll already in flight."""
+        with self._cond:
+            entry = self._entries.pop(workload_id, None)
+            while self._polling == workload_id:
+                self._cond.wait()
+            pending = self._pending.pop(workload_id, None)
+            self._cond.notify()
+        if entry is not None and pending is not None:
+            self._flush(entry[0], pending[1])
+
+    def _run(self) -> None:
+        pin_housekeeping_thread()
+        with self._cond:
+            try:
+                self._poll_forever()
+            finally:
+                # Let the next register() start a fresh thread, even if this
+                # one died on an unexpected error
+                self._thread = None
+
+    def _poll_forever(self) -> None:
+        """Poll due workloads until none are registered. Caller holds _cond."""
+        while True:
+            if not self._entries:
+                self._heap.clear()
+                return
+            if not self._heap:
+                self._cond.wait()
+                continue
+            deadline, _, workload_id = self._heap[0]
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                self._cond.wait(timeout=delay)
+                continue
+            heapq.heappop(self._heap)
+            entry = self._entries.get(workload_id)
+            if entry is None:
+                continue  # unregistered since it was scheduled
+            wl, ctrl = entry
+
+            self._polling = workload_id
+            self._cond.release()
+            try:
+                snap = read_smart_from_controller(ctrl)
+                if snap is not None:
+                    self._record(wl, snap)
+            except Exception as exc:
+                # One workload's failure must not stop polling for the rest
+                logger.warning("pynvme_smart_poll_failed", workload_id=workload_id, error=str(exc))
+            finally:
+                self._cond.acquire()
+                self._polling = None
+                self._cond.notify_all()
+
+            if workload_id in self._entries:
+                next_poll = self._next_poll_time(wl, time.monotonic())
+                heapq.heappush(self._heap, (next_poll, next(self._seq), workload_id))
+
+    def _record(self, wl: _PynvmeWorkload, snap: SmartSnapshot) -> None:
+        """Publish *snap* and queue it, flushing the batch when it is due."""
+        wl.latest_smart = snap
+        now = time.monotonic()
+        first, batch = self._pending.setdefault(wl.workload_id, (now, []))
+        batch.append(snap)
+        batch_size = _SMART_BATCH_SIZE if len(self._entries) > 1 else 1
+        if len(batch) >= batch_size or now - first >= _SMART_FLUSH_SECONDS:
+            del self._pending[wl.workload_id]
+            self._flush(wl, batch)
+
+    @staticmethod
+    def _flush(wl: _PynvmeWorkload, batch: list[SmartSnapshot]) -> None:
+        with wl.lock:
+            for snap in batch:
+                wl.add_smart_snapshot(snap)
+
+    @staticmethod
+    def _next_poll_time(wl: _PynvmeWorkload, now: float) -> float:
+        """Next slot on the workload's fixed poll grid strictly after *now*.
+
+        Polls stay aligned to ``start_time + k * interval``; if the poller
+        stalled past several slots, the missed ones are skipped rather than
+        issued back to back.
+        """
+        interval = wl.smart_poll_interval
+        if interval <= 0:
+            return now
+        k = math.floor((now - wl.start_time) / interval) + 1
+        return wl.start_time + k * interval
+
+
+@dataclass
+class _SharedDevice:
+    """An open pynvme device shared by every workload targeting its BDF."""
+
+    pcie: object
+    ctrl: object
+    ns: object
+    ns_size: int = 0
+    refs: int = 0
+
+
+class _PcieRegistry:
+    """Reference-counted per-BDF cache of open pynvme devices.
+
+    A device is opened on the first :meth:`acquire` for its BDF and closed
+    when the last holder calls :meth:`release`. SMART reads on a shared
+    controller need no extra mutex: they all come from the single
+    :class:`_SmartPoller` thread.
+    """
+
+    def __init__(self) -> None:
+        self._by_bdf: dict[str, _SharedDevice] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, bdf: str) -> _SharedDevice:
+        """Return the open device for *bdf*, opening it if needed."""
+        with self._lock:
+            dev = self._by_bdf.get(bdf)
+            if dev is None:
+                import pynvme
+
+                pcie = pynvme.Pcie(bdf)
+                try:
+                    ctrl = pynvme.Controller(pcie)
+                    ns = pynvme.Namespace(ctrl)
+                except Exception:
+                    try:
+                        pcie.close()
+                    except Exception:
+                        pass
+                    raise
+                id_data = getattr(ns, "id_data", None)
+                ns_size = id_data.get(7, 0) if id_data is not None else 0
+                dev = _SharedDevice(pcie=pcie, ctrl=ctrl, ns=ns, ns_size=ns_size)
+                self._by_bdf[bdf] = dev
+            dev.refs += 1
+            return dev
+
+    def release(self, bdf: str) -> None:
+        """Drop one reference to *bdf*; closes the device on the last one."""
+        with self._lock:
+            dev = self._by_bdf.get(bdf)
+            if dev is None:
+                return
+            dev.refs -= 1
+            if dev.refs > 0:
+                return
+            del self._by_bdf[bdf]
+        try:
+            dev.pcie.close()
+        except Exception:
+            pass
 
 
 class PynvmeBackend(WorkloadBackend):
     """Workload backend using the pynvme Python library."""
 
     def __init__(self) -> None:
+        # Copy-on-write registry: writers swap in a new dict under
+        # _registry_lock, readers use whichever dict is current without locking.
         self._workloads: dict[str, _PynvmeWorkload] = {}
+        self._registry_lock = threading.Lock()
+        self._smart_poller = _SmartPoller()
+        self._devices = _PcieRegistry()
+        self._validate_cache: dict[str, tuple[float, bool]] = {}
 
     @property
     def backend_name(self) -> str:
         return "pynvme"
 
     def validate_target(self, bdf: str) -> bool:
-        """Verify the NVMe device at *bdf* is accessible via pynvme."""
+        """Verify the NVMe device at *bdf* is accessible via pynvme.
+
+        Probing opens and closes the device, so results are reused for
+        a few seconds per BDF.
+        """
+        now = time.monotonic()
+        cached = self._validate_cache.get(bdf)
+        if cached is not None and now - cached[0] < _VALIDATE_TTL_SECONDS:
+            return cached[1]
         try:
             import pynvme
 
             pcie = pynvme.Pcie(bdf)
             pcie.close()
-            return True
+            ok = True
         except Exception:
-            return False
+            ok = False
+        self._validate_cache[bdf] = (now, ok)
+        return ok
 
     def start(self, config: WorkloadConfig) -> str:
-        workload_id = f"wl_{uuid.uuid4().hex[:12]}"
+        workload_id = new_workload_id()
         logger.info("pynvme_start", workload_id=workload_id, bdf=config.target_bdf)
 
         wl = _PynvmeWorkload(
@@ -85,7 +335,8 @@ class PynvmeBackend(WorkloadBackend):
             daemon=True,
         )
         wl.thread = worker_thread
-        self._workloads[workload_id] = wl
+        with self._registry_lock:
+            self._workloads = {**self._workloads, workload_id: wl}
         worker_thread.start()
         return workload_id
 
@@ -102,49 +353,54 @@ class PynvmeBackend(WorkloadBackend):
             wl.thread.join(timeout=wl.config.duration_seconds + 10)
         with wl.lock:
             if wl.state == WorkloadState.RUNNING:
-                wl.state = WorkloadState.STOPPED
                 wl.end_time = time.monotonic()
+                wl.state = WorkloadState.STOPPED
+
+    # Lock-free reads: the worker thread publishes each scalar field with a
+    # single attribute assignment (atomic under the GIL) and assigns ``state``
+    # last, so a reader that sees a terminal state also sees the stats, error
+    # and end_time written before it. Only composite reads take ``wl.lock``.
 
     def get_result(self, workload_id: str) -> WorkloadResult:
         wl = self._get_workload(workload_id)
+        state = wl.state
+        duration_ms = 0.0
+        end_time = wl.end_time
+        if end_time > 0:
+            duration_ms = (end_time - wl.start_time) * 1000
         with wl.lock:
-            duration_ms = 0.0
-            if wl.end_time > 0:
-                duration_ms = (wl.end_time - wl.start_time) * 1000
-            return WorkloadResult(
-                workload_id=workload_id,
-                config=wl.config,
-                stats=wl.stats,
-                duration_ms=duration_ms,
-                error=wl.error,
-                state=wl.state,
-                smart_history=self._build_smart_history(wl),
-            )
+            smart_history = self._build_smart_history(wl)
+        return WorkloadResult(
+            workload_id=workload_id,
+            config=wl.config,
+            stats=wl.stats,
+            duration_ms=duration_ms,
+            error=wl.error,
+            state=state,
+            smart_history=smart_history,
+        )
 
     def get_progress(self, workload_id: str) -> WorkloadProgress:
         wl = self._get_workload(workload_id)
-        with wl.lock:
-            elapsed = time.monotonic() - wl.start_time if wl.start_time > 0 else 0.0
-            return WorkloadProgress(
-                workload_id=workload_id,
-                elapsed_seconds=elapsed,
-                total_seconds=float(wl.config.duration_seconds),
-                current_iops=wl.current_iops,
-                current_bandwidth_mbps=wl.current_bw_mbps,
-                state=wl.state,
-                smart=wl.latest_smart,
-            )
+        start_time = wl.start_time
+        elapsed = time.monotonic() - start_time if start_time > 0 else 0.0
+        return WorkloadProgress(
+            workload_id=workload_id,
+            elapsed_seconds=elapsed,
+            total_seconds=float(wl.config.duration_seconds),
+            current_iops=wl.current_iops,
+            current_bandwidth_mbps=wl.current_bw_mbps,
+            state=wl.state,
+            smart=wl.latest_smart,
+        )
 
     def is_running(self, workload_id: str) -> bool:
         wl = self._workloads.get(workload_id)
-        if wl is None:
-            return False
-        with wl.lock:
-            return wl.state == WorkloadState.RUNNING
+        return wl is not None and wl.state == WorkloadState.RUNNING
 
     def shutdown(self) -> None:
         """Stop all running workloads."""
-        for wl_id in list(self._workloads):
+        for wl_id in self._workloads:  # snapshot; never mutated in place
             if self.is_running(wl_id):
                 try:
                     self.stop(wl_id)
@@ -161,42 +417,31 @@ class PynvmeBackend(WorkloadBackend):
 
     def _run_workload(self, wl: _PynvmeWorkload) -> None:
         """Background thread: open device, run IOWorker(s), collect results."""
-        pcie = None
+        bdf = wl.config.target_bdf
         try:
-            import pynvme
-
-            pcie = pynvme.Pcie(wl.config.target_bdf)
-            ctrl = pynvme.Controller(pcie)
-            ns = pynvme.Namespace(ctrl)
+            dev = self._devices.acquire(bdf)
         except Exception as exc:
             with wl.lock:
                 wl.error = f"Failed to open device: {exc}"
-                wl.state = WorkloadState.FAILED
                 wl.end_time = time.monotonic()
-            if pcie is not None:
-                try:
-                    pcie.close()
-                except Exception:
-                    pass
+                wl.state = WorkloadState.FAILED
             return
 
         try:
-            results = self._run_ioworkers(wl, ns, ctrl)
+            wl.ns_size = dev.ns_size
+            results = self._run_ioworkers(wl, dev.ns, dev.ctrl)
             with wl.lock:
                 if wl.state == WorkloadState.RUNNING:
                     wl.stats = self._aggregate_results(results, wl.config)
-                    wl.state = WorkloadState.COMPLETED
                     wl.end_time = time.monotonic()
+                    wl.state = WorkloadState.COMPLETED
         except Exception as exc:
             with wl.lock:
                 wl.error = f"IOWorker error: {exc}"
-                wl.state = WorkloadState.FAILED
                 wl.end_time = time.monotonic()
+                wl.state = WorkloadState.FAILED
         finally:
-            try:
-                pcie.close()
-            except Exception:
-                pass
+            self._devices.release(bdf)
 
     def _run_ioworkers(
         self,
@@ -209,22 +454,21 @@ class PynvmeBackend(WorkloadBackend):
         num_workers = config.num_workers
         io_size_lba = max(1, config.io_size_bytes // 512)
 
-        # Calculate LBA region per worker to avoid conflicts
-        ns_size = getattr(ns, "id_data", {}).get(7, 0) if hasattr(ns, "id_data") else 0
+        # Calculate LBA region per worker to avoid conflicts; the last worker
+        # absorbs the remainder so the slices tile [region_start, region_end)
         region_start = config.region_start or 0
-        region_end = config.region_end or ns_size
+        region_end = config.region_end or wl.ns_size
 
         region_size = region_end - region_start
         worker_region = region_size // num_workers if num_workers > 0 else region_size
+        edges = [region_start + i * worker_region for i in range(num_workers)]
+        edges.append(region_end)
 
         workers = []
-        for i in range(num_workers):
+        for w_start, w_end in itertools.pairwise(edges):
             if wl.stop_event.is_set():
                 break
 
-            w_start = region_start + i * worker_region
-            w_end = w_start + worker_region if i < num_workers - 1 else region_end
-
             worker_kwargs = {
                 "io_size": io_size_lba,
                 "qdepth": config.queue_depth,
@@ -254,35 +498,32 @@ class PynvmeBackend(WorkloadBackend):
         return results
 
     def _poll_smart_loop(self, wl: _PynvmeWorkload, ctrl: object) -> None:
-        """Poll SMART data at regular intervals until duration expires or stopped."""
-        deadline = wl.start_time + wl.config.duration_seconds
-        while not wl.stop_event.is_set():
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                break
-
-            snap = read_smart_from_controller(ctrl)
-            if snap is not None:
-                with wl.lock:
-                    wl.smart_snapshots.append(snap)
-                    wl.latest_smart = snap
-
-            wait_time = min(wl.smart_poll_interval, remaining)
-            if wait_time > 0:
-                wl.stop_event.wait(timeout=wait_time)
+        """Poll SMART via the shared poller until duration expires or stopped."""
+        remaining = wl.start_time + wl.config.duration_seconds - time.monotonic()
+        if remaining <= 0 or wl.stop_event.is_set():
+            return
+        self._smart_poller.register(wl, ctrl)
+        try:
+            wl.stop_event.wait(timeout=remaining)
+        finally:
+            self._smart_poller.unregister(wl.workload_id)
 
     @staticmethod
     def _build_smart_history(wl: _PynvmeWorkload) -> SmartTimeSeries | None:
         """Build SmartTimeSeries from accumulated snapshots. Caller holds wl.lock."""
-        if not wl.smart_snapshots:
+        if wl.smart_count == 0:
             return None
-        temps = [s.composite_temp_celsius for s in wl.smart_snapshots]
-        return SmartTimeSeries(
-            snapshots=list(wl.smart_snapshots),
-            peak_temp_celsius=max(temps),
-            avg_temp_celsius=sum(temps) / len(temps),
-            latest=wl.smart_snapshots[-1],
-        )
+        # Rebuilt only after a new snapshot; repeated get_result polls reuse it
+        if wl.smart_history is None:
+            wl.smart_history = SmartTimeSeries(
+                snapshots=list(wl.smart_snapshots),
+                peak_temp_celsius=wl.smart_temp_peak,
+                avg_temp_celsius=wl.smart_temp_mean,
+                # Not wl.latest_smart: that is published before its batch is
+                # flushed, and latest must agree with snapshots/peak/avg
+                latest=wl.smart_snapshots[-1],
+            )
+        return wl.smart_history
 
     @staticmethod
     def _aggregate_results(
@@ -290,21 +531,17 @@ class PynvmeBackend(WorkloadBackend):
         config: WorkloadConfig,
     ) -> WorkloadIOStats:
         """Combine results from multiple IOWorkers into a single stats model."""
-        total_read = 0
-        total_write = 0
-        total_ms = 0.0
-        latency_avg_sum = 0.0
-        latency_max_val = 0.0
-        cpu_sum = 0.0
-
-        for r in results:
-            total_read += r.get("io_count_read", 0)
-            total_write += r.get("io_count_write", 0)
-            ms = r.get("mseconds", 0)
-            total_ms = max(total_ms, float(ms))
-            latency_avg_sum += r.get("latency_average_us", 0)
-            latency_max_val = max(latency_max_val, r.get("latency_max_us", 0))
-            cpu_sum += r.get("cpu_usage", 0)
+        # Transpose to one column per key, then reduce each with a C builtin
+        columns = zip(*([r.get(k, 0) for k in _RESULT_KEYS] for r in results))
+        reads, writes, mseconds, lat_avgs, lat_maxes, cpus = (
+            tuple(columns) or ((),) * len(_RESULT_KEYS)
+        )
+        total_read = sum(reads)
+        total_write = sum(writes)
+        total_ms = max(0.0, float(max(mseconds, default=0)))
+        latency_avg_sum = sum(lat_avgs, 0.0)
+        latency_max_val = max(0.0, max(lat_maxes, default=0))
+        cpu_sum = sum(cpus, 0.0)
 
         duration_s = total_ms / 1000.0 if total_ms > 0 else float(config.duration_seconds)
         n = len(results) if results else 1
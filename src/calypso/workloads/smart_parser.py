@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import struct
 import time
+from itertools import takewhile
 
 from calypso.utils.logging import get_logger
 from calypso.workloads.models import SmartSnapshot
@@ -12,8 +13,16 @@ logger = get_logger(__name__)
 
 _KELVIN_OFFSET = 273
 
+# All fields we read from the SMART log, in one little-endian layout:
+# composite temp (K) @1, available spare (%) @3, power-on hours low 8 bytes
+# @128, temperature sensors 1-8 (K) @200.
+_SMART_LAYOUT = struct.Struct("<xHB124xQ64x8H")
+_unpack_smart = _SMART_LAYOUT.unpack_from
 
-def parse_smart_buffer(buf: bytes, power_state: int = 0) -> SmartSnapshot:
+
+def parse_smart_buffer(
+    buf: bytes | bytearray | memoryview, power_state: int = 0
+) -> SmartSnapshot:
     """Parse a 512-byte NVMe SMART log page buffer into a SmartSnapshot.
 
     NVMe spec 1.4+ SMART/Health Information (Log Page 02h):
@@ -21,27 +30,22 @@ def parse_smart_buffer(buf: bytes, power_state: int = 0) -> SmartSnapshot:
       Byte  3:     Available Spare (%)
       Bytes 128-143: Power On Hours (uint128, we read low 8 bytes)
       Bytes 200-215: Temperature Sensor 1-8 (uint16 each, Kelvin, 0 = absent)
+
+    Any buffer-protocol object is accepted; only short buffers are copied.
     """
     if len(buf) < 512:
-        buf = buf + b"\x00" * (512 - len(buf))
+        buf = bytes(buf).ljust(512, b"\x00")
 
-    composite_k = struct.unpack_from("<H", buf, 1)[0]
+    composite_k, available_spare, poh_low, *sensors_k = _unpack_smart(buf, 0)
     composite_c = max(0.0, float(composite_k - _KELVIN_OFFSET)) if composite_k > 0 else 0.0
 
-    available_spare = buf[3]
-
-    poh_low = struct.unpack_from("<Q", buf, 128)[0]
-
-    sensors: list[float] = []
-    for i in range(8):
-        offset = 200 + i * 2
-        val_k = struct.unpack_from("<H", buf, offset)[0]
-        if val_k == 0:
-            break
-        sensors.append(max(0.0, float(val_k - _KELVIN_OFFSET)))
+    # The sensor list ends at the first unpopulated (zero) slot
+    sensors = [
+        max(0.0, float(val_k - _KELVIN_OFFSET)) for val_k in takewhile(bool, sensors_k)
+    ]
 
     return SmartSnapshot(
-        timestamp_ms=int(time.time() * 1000),
+        timestamp_ms=time.time_ns() // 1_000_000,
         composite_temp_celsius=composite_c,
         temp_sensors_celsius=sensors,
         power_on_hours=poh_low,
@@ -66,7 +70,13 @@ def read_smart_from_controller(ctrl: object) -> SmartSnapshot | None:
         except Exception:
             pass
 
-        return parse_smart_buffer(bytes(buf), power_state=power_state)
+        # Parse in place -- struct reads straight from the buffer protocol.
+        # Fall back to a copy for buffer types that don't expose it.
+        try:
+            view = memoryview(buf)
+        except TypeError:
+            view = bytes(buf)
+        return parse_smart_buffer(view, power_state=power_state)
     except Exception as exc:
         logger.debug("smart_read_failed", error=str(exc))
         return None
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import shutil
+import os
+import selectors
 import subprocess
 import threading
 import time
-import uuid
 from dataclasses import dataclass, field
 
 from calypso.utils.logging import get_logger
-from calypso.workloads.base import WorkloadBackend
+from calypso.workloads import is_spdk_available
+from calypso.workloads.affinity import pin_housekeeping_thread
+from calypso.workloads.base import WorkloadBackend, new_workload_id
 from calypso.workloads.exceptions import (
     WorkloadNotFoundError,
     WorkloadTargetError,
@@ -23,12 +25,18 @@ from calypso.workloads.models import (
     WorkloadState,
     WorkloadType,
 )
-from calypso.workloads.output_parser import parse_spdk_output
+from calypso.workloads.output_parser import StreamingSpdkParser
 
 logger = get_logger(__name__)
 
 _KILL_TIMEOUT_SECONDS = 5
 
+# Tail of raw tool output kept per workload for diagnostics
+_RETAINED_OUTPUT_CHARS = 65536
+
+_READ_CHUNK_BYTES = 65536
+_SELECT_TIMEOUT_SECONDS = 0.5
+
 
 @dataclass
 class _SpdkWorkload:
@@ -44,6 +52,8 @@ class _SpdkWorkload:
     stderr_text: str = ""
     stats: WorkloadIOStats | None = None
     error: str | None = None
+    current_iops: float = 0.0
+    current_bw_mbps: float = 0.0
     lock: threading.Lock = field(default_factory=threading.Lock)
 
 
@@ -51,7 +61,10 @@ class SpdkBackend(WorkloadBackend):
     """Workload backend using the SPDK spdk_nvme_perf CLI tool."""
 
     def __init__(self) -> None:
+        # Copy-on-write registry: writers swap in a new dict under
+        # _registry_lock, readers use whichever dict is current without locking.
         self._workloads: dict[str, _SpdkWorkload] = {}
+        self._registry_lock = threading.Lock()
 
     @property
     def backend_name(self) -> str:
@@ -59,10 +72,10 @@ class SpdkBackend(WorkloadBackend):
 
     def validate_target(self, bdf: str) -> bool:
         """Check that spdk_nvme_perf is available (device probing deferred to SPDK)."""
-        return shutil.which("spdk_nvme_perf") is not None
+        return is_spdk_available()
 
     def start(self, config: WorkloadConfig) -> str:
-        workload_id = f"wl_{uuid.uuid4().hex[:12]}"
+        workload_id = new_workload_id()
         cmd = self._build_command(config)
         logger.info("spdk_start", workload_id=workload_id, cmd=" ".join(cmd))
 
@@ -71,7 +84,6 @@ class SpdkBackend(WorkloadBackend):
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
             )
         except FileNotFoundError as exc:
             raise WorkloadTargetError(
@@ -96,7 +108,8 @@ class SpdkBackend(WorkloadBackend):
             daemon=True,
         )
         wl.thread = monitor_thread
-        self._workloads[workload_id] = wl
+        with self._registry_lock:
+            self._workloads = {**self._workloads, workload_id: wl}
         monitor_thread.start()
         return workload_id
 
@@ -140,9 +153,9 @@ class SpdkBackend(WorkloadBackend):
                 workload_id=workload_id,
                 elapsed_seconds=elapsed,
                 total_seconds=float(wl.config.duration_seconds),
-                current_iops=wl.stats.iops_total if wl.stats else 0.0,
+                current_iops=wl.stats.iops_total if wl.stats else wl.current_iops,
                 current_bandwidth_mbps=(
-                    wl.stats.bandwidth_total_mbps if wl.stats else 0.0
+                    wl.stats.bandwidth_total_mbps if wl.stats else wl.current_bw_mbps
                 ),
                 state=wl.state,
             )
@@ -156,7 +169,7 @@ class SpdkBackend(WorkloadBackend):
 
     def shutdown(self) -> None:
         """Stop all running workloads."""
-        for wl_id in list(self._workloads):
+        for wl_id in self._workloads:  # snapshot; never mutated in place
             if self.is_running(wl_id):
                 try:
                     self.stop(wl_id)
@@ -172,12 +185,20 @@ class SpdkBackend(WorkloadBackend):
         return wl
 
     def _monitor_process(self, wl: _SpdkWorkload) -> None:
-        """Background thread: wait for process to finish, then parse output."""
+        """Background thread: stream process output, then parse the final stats.
+
+        Each stdout line is fed to a streaming parser as it arrives, so
+        ``get_progress`` reports live IOPS/bandwidth instead of zeros until
+        exit and the final stats need no second pass over the output.
+        """
+        pin_housekeeping_thread()
         proc = wl.process
         if proc is None:
             return
+        parser = StreamingSpdkParser()
         try:
-            stdout, stderr = proc.communicate()
+            stdout_b, stderr_b = self._stream_output(wl, proc, parser)
+            proc.wait()
         except Exception as exc:
             with wl.lock:
                 wl.error = str(exc)
@@ -185,13 +206,17 @@ class SpdkBackend(WorkloadBackend):
                 wl.end_time = time.monotonic()
             return
 
+        # Read raw bytes and decode once, rather than per chunk via text mode
+        stdout = stdout_b.decode("utf-8", errors="replace")
+        stderr = stderr_b.decode("utf-8", errors="replace")
+
         with wl.lock:
-            wl.stdout_text = stdout
-            wl.stderr_text = stderr
+            wl.stdout_text = stdout[-_RETAINED_OUTPUT_CHARS:]
+            wl.stderr_text = stderr[-_RETAINED_OUTPUT_CHARS:]
             wl.end_time = time.monotonic()
             if proc.returncode == 0:
                 try:
-                    wl.stats = parse_spdk_output(stdout)
+                    wl.stats = parser.final()
                     wl.state = WorkloadState.COMPLETED
                 except Exception as exc:
                     wl.error = f"Output parse error: {exc}"
@@ -202,23 +227,76 @@ class SpdkBackend(WorkloadBackend):
                     wl.error += f": {stderr.strip()[:500]}"
                 wl.state = WorkloadState.FAILED
 
+    @staticmethod
+    def _stream_output(
+        wl: _SpdkWorkload, proc: subprocess.Popen, parser: StreamingSpdkParser
+    ) -> tuple[bytes, bytes]:
+        """Read stdout/stderr until EOF, feeding each complete stdout line to *parser*.
+
+        Only the last ``_RETAINED_OUTPUT_CHARS`` bytes of each stream are
+        kept, so a long run does not grow memory without bound.
+        """
+        stdout_b = bytearray()
+        stderr_b = bytearray()
+        parsed_upto = 0
+
+        def feed(end: int) -> None:
+            nonlocal parsed_upto
+            window = stdout_b[parsed_upto:end].decode("utf-8", errors="replace")
+            parsed_upto = end
+            live = None
+            for line in window.splitlines():
+                live = parser.feed(line) or live
+            if live is not None and live.iops_total > 0:
+                with wl.lock:
+                    wl.current_iops = live.iops_total
+                    wl.current_bw_mbps = live.bandwidth_total_mbps
+
+        with selectors.DefaultSelector() as sel:
+            sel.register(proc.stdout, selectors.EVENT_READ, stdout_b)
+            sel.register(proc.stderr, selectors.EVENT_READ, stderr_b)
+            while sel.get_map():
+                for key, _ in sel.select(timeout=_SELECT_TIMEOUT_SECONDS):
+                    chunk = os.read(key.fd, _READ_CHUNK_BYTES)
+                    if not chunk:
+                        sel.unregister(key.fileobj)
+                        continue
+                    buf = key.data
+                    buf += chunk
+                    if buf is stdout_b:
+                        if b"\n" in chunk:
+                            # Parse only the newly completed lines
+                            feed(stdout_b.rindex(b"\n") + 1)
+                        # Keep only the retained tail, never dropping unparsed bytes
+                        drop = min(len(stdout_b) - _RETAINED_OUTPUT_CHARS, parsed_upto)
+                        if drop > 0:
+                            del stdout_b[:drop]
+                            parsed_upto -= drop
+                    elif len(stderr_b) > _RETAINED_OUTPUT_CHARS:
+                        del stderr_b[:-_RETAINED_OUTPUT_CHARS]
+        if parsed_upto < len(stdout_b):
+            feed(len(stdout_b))  # unterminated last line
+        return bytes(stdout_b), bytes(stderr_b)
+
     @staticmethod
     def _build_command(config: WorkloadConfig) -> list[str]:
         """Map WorkloadConfig fields to spdk_nvme_perf CLI flags."""
-        cmd = ["spdk_nvme_perf"]
-        cmd.extend(["-o", str(config.io_size_bytes)])
-        cmd.extend(["-q", str(config.queue_depth)])
-        cmd.extend(["-w", config.workload_type.value])
-        cmd.extend(["-t", str(config.duration_seconds)])
+        cmd = [
+            "spdk_nvme_perf",
+            "-o", str(config.io_size_bytes),
+            "-q", str(config.queue_depth),
+            "-w", config.workload_type.value,
+            "-t", str(config.duration_seconds),
+        ]
 
         if config.core_mask is not None:
-            cmd.extend(["-c", config.core_mask])
+            cmd += ("-c", config.core_mask)
 
         if config.workload_type in (WorkloadType.RANDRW, WorkloadType.RW):
-            cmd.extend(["-M", str(config.read_percentage)])
+            cmd += ("-M", str(config.read_percentage))
 
         # SPDK transport address
         bdf = config.target_bdf.replace(":", ".")
-        cmd.extend(["-r", f"trtype:PCIe traddr:{bdf}"])
+        cmd += ("-r", f"trtype:PCIe traddr:{bdf}")
 
         return cmd
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+from itertools import pairwise
+from pathlib import Path
+
 import pytest
 
+import calypso
 from calypso.hardware.atlas3 import (
     PROFILE_80,
     PROFILE_144,
@@ -19,6 +25,23 @@ from calypso.hardware.atlas3 import (
     station_for_port,
 )
 
+ALL_PROFILES = (
+    PROFILE_144,
+    PROFILE_80,
+    PROFILE_A024,
+    PROFILE_A032,
+    PROFILE_A048,
+    PROFILE_A064,
+    PROFILE_A080,
+    PROFILE_A096,
+)
+B0_PROFILES = ALL_PROFILES[2:]
+
+
+@pytest.fixture(scope="module", params=ALL_PROFILES, ids=lambda p: p.chip_name)
+def any_profile(request: pytest.FixtureRequest) -> BoardProfile:
+    return request.param
+
 
 # ---------------------------------------------------------------------------
 # Profile data integrity
@@ -27,115 +50,84 @@ from calypso.hardware.atlas3 import (
 class TestProfileIntegrity:
     """Verify each profile has consistent station maps."""
 
-    @pytest.mark.parametrize(
-        "profile",
-        [
-            PROFILE_144,
-            PROFILE_80,
-            PROFILE_A024,
-            PROFILE_A032,
-            PROFILE_A048,
-            PROFILE_A064,
-            PROFILE_A080,
-            PROFILE_A096,
-        ],
-        ids=lambda p: p.chip_name,
-    )
-    def test_station_ids_match_keys(self, profile: BoardProfile) -> None:
-        """Station map keys must match the StationInfo.id field."""
-        for key, stn in profile.station_map.items():
-            assert key == stn.id, f"{profile.chip_name}: key {key} != stn.id {stn.id}"
-
-    @pytest.mark.parametrize(
-        "profile",
-        [
-            PROFILE_144,
-            PROFILE_80,
-            PROFILE_A024,
-            PROFILE_A032,
-            PROFILE_A048,
-            PROFILE_A064,
-            PROFILE_A080,
-            PROFILE_A096,
-        ],
-        ids=lambda p: p.chip_name,
-    )
-    def test_port_ranges_valid(self, profile: BoardProfile) -> None:
-        """All port ranges must have low <= high."""
-        for stn in profile.station_map.values():
+    def test_station_map_invariants(self, any_profile: BoardProfile) -> None:
+        """Keys match StationInfo.id, each range has low <= high, and no ranges overlap."""
+        ordered = any_profile._ordered_stations
+        assert len(ordered) == len(any_profile.station_map)
+        assert list(any_profile.station_map) == sorted(any_profile.station_map), (
+            f"{any_profile.chip_name}: stations not defined in ascending ID order"
+        )
+        for stn in ordered:
             lo, hi = stn.port_range
-            assert lo <= hi, f"{profile.chip_name} STN{stn.id}: {lo} > {hi}"
+            assert any_profile.station_map.get(stn.id) is stn, (
+                f"{any_profile.chip_name}: STN{stn.id} not stored under key {stn.id}"
+            )
+            assert lo <= hi, f"{any_profile.chip_name} STN{stn.id}: {lo} > {hi}"
+        for prev, stn in pairwise(ordered):
+            hi, lo_next = prev.port_range[1], stn.port_range[0]
+            assert hi < lo_next, (
+                f"{any_profile.chip_name}: STN port ranges overlap at {hi} >= {lo_next}"
+            )
+
 
     @pytest.mark.parametrize(
         "profile",
-        [
-            PROFILE_144,
-            PROFILE_80,
-            PROFILE_A024,
-            PROFILE_A032,
-            PROFILE_A048,
-            PROFILE_A064,
-            PROFILE_A080,
-            PROFILE_A096,
-        ],
+        [PROFILE_144, PROFILE_80],
         ids=lambda p: p.chip_name,
     )
-    def test_no_overlapping_port_ranges(self, profile: BoardProfile) -> None:
-        """Port ranges across stations must not overlap."""
-        ranges = [(stn.id, *stn.port_range) for stn in profile.station_map.values()]
-        ranges.sort(key=lambda r: r[1])
-        for i in range(len(ranges) - 1):
-            _, _, hi = ranges[i]
-            _, lo_next, _ = ranges[i + 1]
-            assert hi < lo_next, (
-                f"{profile.chip_name}: STN port ranges overlap at {hi} >= {lo_next}"
+    def test_connectors_within_station(self, profile: BoardProfile) -> None:
+        """Every connector must sit inside its station's port range with a unique CON ID."""
+        con_ids = [info.con_id for info in profile.connector_map.values()]
+        assert len(con_ids) == len(set(con_ids)), f"{profile.chip_name}: duplicate CON IDs"
+        for cn_name, info in profile.connector_map.items():
+            stn = profile.station_map.get(info.station)
+            assert stn is not None, f"{profile.chip_name} {cn_name}: no STN{info.station}"
+            lo, hi = stn.port_range
+            assert lo <= info.lanes[0] <= info.lanes[1] <= hi, (
+                f"{profile.chip_name} {cn_name}: lanes {info.lanes} outside STN{stn.id}"
             )
 
-
 # ---------------------------------------------------------------------------
 # B0 station map correctness (vs SDK PlxChipGetPortMask)
 # ---------------------------------------------------------------------------
 
+# (profile, station IDs in map order, expected port ranges for a sample of stations)
+_B0_EXPECTED = (
+    (PROFILE_A024, (0, 1), {0: (0, 15), 1: (24, 31)}),
+    (PROFILE_A032, (0, 1), {0: (0, 15), 1: (16, 31)}),
+    (PROFILE_A048, (0, 1, 2), {0: (0, 15), 1: (16, 31), 2: (32, 47)}),
+    # PEX90064 skips station 2 -- ports 0-31 + 48-79
+    (
+        PROFILE_A064,
+        (0, 1, 3, 4),
+        {0: (0, 15), 1: (16, 31), 3: (48, 63), 4: (64, 79)},
+    ),
+    (PROFILE_A080, (0, 1, 2, 3, 4), {0: (0, 15), 4: (64, 79)}),
+    (PROFILE_A096, (0, 1, 2, 3, 4, 5), {0: (0, 15), 5: (80, 95)}),
+)
+
+
 class TestB0StationMaps:
     """Verify B0 profiles match SDK-defined port masks."""
 
-    def test_a024_stations(self) -> None:
-        assert sorted(PROFILE_A024.station_map.keys()) == [0, 1]
-        assert PROFILE_A024.station_map[0].port_range == (0, 15)
-        assert PROFILE_A024.station_map[1].port_range == (24, 31)
-
-    def test_a032_stations(self) -> None:
-        assert sorted(PROFILE_A032.station_map.keys()) == [0, 1]
-        assert PROFILE_A032.station_map[0].port_range == (0, 15)
-        assert PROFILE_A032.station_map[1].port_range == (16, 31)
-
-    def test_a048_stations(self) -> None:
-        assert sorted(PROFILE_A048.station_map.keys()) == [0, 1, 2]
-        assert PROFILE_A048.station_map[0].port_range == (0, 15)
-        assert PROFILE_A048.station_map[1].port_range == (16, 31)
-        assert PROFILE_A048.station_map[2].port_range == (32, 47)
-
-    def test_a064_stations(self) -> None:
-        """PEX90064 skips station 2 — ports 0-31 + 48-79."""
-        assert sorted(PROFILE_A064.station_map.keys()) == [0, 1, 3, 4]
-        assert PROFILE_A064.station_map[0].port_range == (0, 15)
-        assert PROFILE_A064.station_map[1].port_range == (16, 31)
-        assert PROFILE_A064.station_map[3].port_range == (48, 63)
-        assert PROFILE_A064.station_map[4].port_range == (64, 79)
-
-    def test_a080_stations(self) -> None:
-        assert sorted(PROFILE_A080.station_map.keys()) == [0, 1, 2, 3, 4]
-        assert PROFILE_A080.station_map[0].port_range == (0, 15)
-        assert PROFILE_A080.station_map[4].port_range == (64, 79)
-
-    def test_a096_stations(self) -> None:
-        assert sorted(PROFILE_A096.station_map.keys()) == [0, 1, 2, 3, 4, 5]
-        assert PROFILE_A096.station_map[0].port_range == (0, 15)
-        assert PROFILE_A096.station_map[5].port_range == (80, 95)
+    @pytest.mark.parametrize(
+        ("profile", "keys", "ranges"),
+        _B0_EXPECTED,
+        ids=[profile.chip_name for profile, _, _ in _B0_EXPECTED],
+    )
+    def test_b0_station_layout(
+        self,
+        profile: BoardProfile,
+        keys: tuple[int, ...],
+        ranges: dict[int, tuple[int, int]],
+    ) -> None:
+        assert tuple(profile.station_map) == keys
+        for stn_id, port_range in ranges.items():
+            assert profile.station_map[stn_id].port_range == port_range
 
     @pytest.mark.parametrize(
         "profile",
-        [PROFILE_A024, PROFILE_A032, PROFILE_A048, PROFILE_A064, PROFILE_A080, PROFILE_A096],
+        B0_PROFILES,
         ids=lambda p: p.chip_name,
     )
     def test_b0_connector_maps_empty(self, profile: BoardProfile) -> None:
@@ -254,6 +246,31 @@ class TestStationForPort:
         stn = station_for_port(999, PROFILE_A096)
         assert stn is None
 
+    def test_matches_port_range_scan(self, any_profile: BoardProfile) -> None:
+        """Every port, including gaps and discontiguous layouts, agrees with a range scan."""
+        for port in range(160):
+            expected = next(
+                (
+                    stn for stn in any_profile.station_map.values()
+                    if stn.port_range[0] <= port <= stn.port_range[1]
+                ),
+                None,
+            )
+            assert station_for_port(port, any_profile) is expected, f"port {port}"
+
+    def test_negative_port_returns_none(self) -> None:
+        assert station_for_port(-1, PROFILE_144) is None
+
+    def test_station_boundaries(self) -> None:
+        """First and last port of every station resolve to it; neighbours don't leak."""
+        for stn in PROFILE_144.station_map.values():
+            low, high = stn.port_range
+            assert station_for_port(low, PROFILE_144) is stn
+            assert station_for_port(high, PROFILE_144) is stn
+        # Gap between station 2 (32-47) and station 5 (80-95)
+        assert station_for_port(48, PROFILE_144) is None
+        assert station_for_port(79, PROFILE_144) is None
+
 
 class TestConnectorForPort:
     """Verify connector lookup for A0 profiles and B0 (empty) profiles."""
@@ -273,3 +290,48 @@ class TestConnectorForPort:
         assert connector_for_port(0, PROFILE_A024) is None
         assert connector_for_port(48, PROFILE_A064) is None
         assert connector_for_port(80, PROFILE_A096) is None
+
+    def test_unmapped_and_out_of_range_ports(self) -> None:
+        assert connector_for_port(0, PROFILE_144) is None
+        assert connector_for_port(-1, PROFILE_144) is None
+        assert connector_for_port(999, PROFILE_144) is None
+
+    def test_every_lane_maps_to_its_connector(self) -> None:
+        for conn in PROFILE_144.connector_map.values():
+            low, high = conn.lanes
+            for port in range(low, high + 1):
+                assert connector_for_port(port, PROFILE_144) is conn
+
+
+class TestPackageImports:
+    """calypso.hardware loads its submodules lazily."""
+
+    def test_atlas3_import_skips_register_modules(self) -> None:
+        code = (
+            "import sys, calypso.hardware.atlas3\n"
+            "assert 'calypso.hardware.pcie_registers' not in sys.modules\n"
+            "assert 'calypso.hardware.atlas3_phy' not in sys.modules\n"
+            "from calypso.hardware import PCIeLinkSpeed\n"
+            "assert 'calypso.hardware.pcie_registers' in sys.modules\n"
+        )
+        # Run from the directory holding the calypso package so a fresh
+        # interpreter imports the same tree regardless of how it's installed
+        src_dir = Path(calypso.__file__).resolve().parents[1]
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=src_dir)
+
+    def test_profiles_built_on_demand(self) -> None:
+        code = (
+            "import calypso.hardware.atlas3 as a\n"
+            "assert a._profile.cache_info().currsize == 0\n"
+            "assert a.get_board_profile(0x9080) is a.PROFILE_80\n"
+            "assert a._profile.cache_info().currsize == 1\n"
+            "assert a.STATION_MAP is a.PROFILE_144.station_map\n"
+        )
+        src_dir = Path(calypso.__file__).resolve().parents[1]
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=src_dir)
+
+    def test_unknown_attribute_raises(self) -> None:
+        import calypso.hardware
+
+        with pytest.raises(AttributeError):
+            calypso.hardware.NOT_A_REGISTER  # noqa: B018
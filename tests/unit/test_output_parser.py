@@ -0,0 +1,75 @@
+"""Unit tests for calypso.workloads.output_parser."""
+
+from __future__ import annotations
+
+from calypso.workloads.output_parser import StreamingSpdkParser, parse_spdk_output
+
+_SAMPLE = """\
+Initializing NVMe Controllers
+Read : 1000.50 IOPS 3.91 MiB/s
+Write : 500.25 IOPS 1.95 MiB/s
+Total : 1500.75 IOPS 5.86 MiB/s
+Average Latency : 42.1 us
+Maximum Latency: 900.0 us
+50th percentile : 40.0 us
+99th percentile : 120.5 us
+99.9th percentile : 450.0 us
+CPU Usage : 37.5 %
+"""
+
+
+class TestParseSpdkOutput:
+    def test_full_sample(self):
+        stats = parse_spdk_output(_SAMPLE)
+        assert stats.iops_read == 1000.50
+        assert stats.iops_write == 500.25
+        assert stats.iops_total == 1500.75
+        assert stats.bandwidth_total_mbps == 5.86
+        assert stats.latency_avg_us == 42.1
+        assert stats.latency_max_us == 900.0
+        assert stats.cpu_usage_percent == 37.5
+
+    def test_p999_not_taken_as_p99(self):
+        stats = parse_spdk_output(_SAMPLE)
+        assert stats.latency_p50_us == 40.0
+        assert stats.latency_p99_us == 120.5
+        assert stats.latency_p999_us == 450.0
+
+    def test_total_derived_from_read_write(self):
+        stats = parse_spdk_output("Read : 10 IOPS 1 MiB/s\nWrite : 5 IOPS 2 MiB/s\n")
+        assert stats.iops_total == 15.0
+        assert stats.bandwidth_total_mbps == 3.0
+
+    def test_total_is_case_sensitive(self):
+        stats = parse_spdk_output("total : 10 IOPS 1 MiB/s\n")
+        assert stats.iops_total == 0.0
+
+    def test_first_pattern_in_priority_order_wins_per_line(self):
+        # Read is listed after Total, so a line carrying both yields Total only
+        stats = parse_spdk_output("Read: 1 IOPS 2 MiB/s Total : 3 IOPS 4 MiB/s")
+        assert stats.iops_total == 3.0
+        assert stats.iops_read == 0.0
+
+    def test_empty_output(self):
+        stats = parse_spdk_output("")
+        assert stats.iops_total == 0.0
+        assert stats.latency_avg_us == 0.0
+
+
+class TestStreamingSpdkParser:
+    def test_feed_returns_none_for_unmatched_lines(self):
+        parser = StreamingSpdkParser()
+        assert parser.feed("Initializing NVMe Controllers") is None
+        assert parser.feed("Attached to NVMe Controller at 0000:01:00.0") is None
+
+    def test_later_lines_overwrite_earlier_values(self):
+        parser = StreamingSpdkParser()
+        assert parser.feed("Total : 100.0 IOPS 1.0 MiB/s").iops_total == 100.0
+        assert parser.feed("Total : 250.0 IOPS 2.5 MiB/s").iops_total == 250.0
+        assert parser.final().bandwidth_total_mbps == 2.5
+
+    def test_matches_batch_parse(self):
+        parser = StreamingSpdkParser()
+        for line in _SAMPLE.splitlines():
+            parser.feed(line)
+        assert parser.final() == parse_spdk_output(_SAMPLE)
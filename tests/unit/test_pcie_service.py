@@ -0,0 +1,67 @@
+"""Unit tests for calypso.ui.services.pcie."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from calypso.bindings import functions, library
+from calypso.exceptions import DriverNotFoundError
+from calypso.ui.services import pcie
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    counts = {"load": 0, "init": 0}
+
+    def fake_load():
+        counts["load"] += 1
+
+    def fake_init():
+        counts["init"] += 1
+
+    monkeypatch.setattr(library, "load_library", fake_load)
+    monkeypatch.setattr(functions, "initialize", fake_init)
+    pcie.reset_driver_cache()
+    yield counts
+    pcie.reset_driver_cache()
+
+
+class TestEnsureDriver:
+    def test_initialises_once(self, calls):
+        pcie._ensure_driver()
+        pcie._ensure_driver()
+        assert calls == {"load": 1, "init": 1}
+
+    def test_reset_forces_reinit(self, calls):
+        pcie._ensure_driver()
+        pcie.reset_driver_cache()
+        pcie._ensure_driver()
+        assert calls == {"load": 2, "init": 2}
+
+    def test_failure_not_cached(self, calls, monkeypatch):
+        def boom():
+            raise DriverNotFoundError("no driver")
+
+        monkeypatch.setattr(library, "load_library", boom)
+        with pytest.raises(pcie.DriverSetupError, match="no driver"):
+            pcie._ensure_driver()
+        assert pcie._driver_ready is False
+
+    def test_scan_uses_bound_sdk(self, calls, monkeypatch):
+        pcie._ensure_driver()
+        monkeypatch.setattr(pcie._sdk, "PcieTransport", lambda: "transport")
+        monkeypatch.setattr(pcie._sdk, "scan_devices", lambda t: [t])
+        assert pcie.scan_pcie_devices() == ["transport"]
+
+
+class TestAsyncWrappers:
+    def test_scan_runs_on_pcie_executor(self, monkeypatch):
+        seen = []
+        monkeypatch.setattr(
+            pcie, "scan_pcie_devices", lambda: seen.append(threading.current_thread().name)
+        )
+        asyncio.run(pcie.scan_pcie_devices_async())
+        assert seen[0].startswith("pcie-sdk")
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import struct
+import sys
 import threading
 import time
+from collections import deque
 from unittest.mock import MagicMock
 
+import pytest
+
 from calypso.workloads.models import (
     BackendType,
     SmartSnapshot,
@@ -16,7 +20,12 @@ from calypso.workloads.models import (
     WorkloadResult,
     WorkloadState,
 )
-from calypso.workloads.pynvme_backend import PynvmeBackend, _PynvmeWorkload
+from calypso.workloads.pynvme_backend import (
+    PynvmeBackend,
+    _PcieRegistry,
+    _PynvmeWorkload,
+    _SmartPoller,
+)
 
 _KELVIN_OFFSET = 273
 
@@ -190,7 +199,7 @@ class TestBuildSmartHistory:
     def test_single_snapshot(self):
         wl = _PynvmeWorkload(workload_id="wl_single", config=_make_config())
         snap = _make_snapshot(temp=42.0)
-        wl.smart_snapshots = [snap]
+        wl.add_smart_snapshot(snap)
 
         result = PynvmeBackend._build_smart_history(wl)
 
@@ -202,11 +211,8 @@ class TestBuildSmartHistory:
 
     def test_multiple_snapshots_computes_peak_and_avg(self):
         wl = _PynvmeWorkload(workload_id="wl_multi", config=_make_config())
-        wl.smart_snapshots = [
-            _make_snapshot(temp=40.0),
-            _make_snapshot(temp=60.0),
-            _make_snapshot(temp=80.0),
-        ]
+        for temp in (40.0, 60.0, 80.0):
+            wl.add_smart_snapshot(_make_snapshot(temp=temp))
 
         result = PynvmeBackend._build_smart_history(wl)
 
@@ -219,7 +225,8 @@ class TestBuildSmartHistory:
         wl = _PynvmeWorkload(workload_id="wl_latest", config=_make_config())
         snap1 = _make_snapshot(temp=30.0, poh=100)
         snap2 = _make_snapshot(temp=50.0, poh=200)
-        wl.smart_snapshots = [snap1, snap2]
+        wl.add_smart_snapshot(snap1)
+        wl.add_smart_snapshot(snap2)
 
         result = PynvmeBackend._build_smart_history(wl)
 
@@ -229,12 +236,36 @@ class TestBuildSmartHistory:
     def test_returns_copy_of_snapshots(self):
         wl = _PynvmeWorkload(workload_id="wl_copy", config=_make_config())
         snap = _make_snapshot(temp=50.0)
-        wl.smart_snapshots = [snap]
+        wl.add_smart_snapshot(snap)
 
         result = PynvmeBackend._build_smart_history(wl)
 
         assert result.snapshots is not wl.smart_snapshots
-        assert result.snapshots == wl.smart_snapshots
+        assert result.snapshots == list(wl.smart_snapshots)
+
+    def test_history_reused_until_next_snapshot(self):
+        wl = _PynvmeWorkload(workload_id="wl_reuse", config=_make_config())
+        wl.add_smart_snapshot(_make_snapshot(temp=40.0))
+        first = PynvmeBackend._build_smart_history(wl)
+        assert PynvmeBackend._build_smart_history(wl) is first
+
+        wl.add_smart_snapshot(_make_snapshot(temp=60.0))
+        second = PynvmeBackend._build_smart_history(wl)
+        assert second is not first
+        assert second.avg_temp_celsius == 50.0
+        assert len(second.snapshots) == 2
+
+    def test_history_is_bounded_but_stats_cover_whole_run(self):
+        wl = _PynvmeWorkload(workload_id="wl_long", config=_make_config())
+        wl.smart_snapshots = deque(maxlen=3)
+        for temp in (90.0, 10.0, 20.0, 30.0, 50.0):
+            wl.add_smart_snapshot(_make_snapshot(temp=temp))
+
+        result = PynvmeBackend._build_smart_history(wl)
+
+        assert [s.composite_temp_celsius for s in result.snapshots] == [20.0, 30.0, 50.0]
+        assert result.peak_temp_celsius == 90.0
+        assert result.avg_temp_celsius == 40.0
 
 
 # ---------------------------------------------------------------------------
@@ -352,6 +383,142 @@ class TestPollSmartLoop:
         assert len(wl.smart_snapshots) >= 1
 
 
+class TestSmartPoller:
+    def test_next_poll_skips_missed_slots(self):
+        wl = _PynvmeWorkload(
+            workload_id="wl_grid", config=_make_config(), start_time=100.0, smart_poll_interval=3.0
+        )
+        assert _SmartPoller._next_poll_time(wl, 100.5) == 103.0
+        assert _SmartPoller._next_poll_time(wl, 103.0) == 106.0
+        # Stalled for several intervals: resume on the grid, no catch-up burst
+        assert _SmartPoller._next_poll_time(wl, 111.2) == 112.0
+
+    def test_concurrent_workloads_share_one_poll_thread(self):
+        buf = _build_smart_buffer(composite_k=_KELVIN_OFFSET + 40)
+        ctrl = MagicMock()
+        ctrl.getlogpage.return_value = bytes(buf)
+        ctrl.getfeatures.return_value = 0
+        backend = PynvmeBackend()
+        workloads = [
+            _PynvmeWorkload(
+                workload_id=f"wl_shared{i}",
+                config=_make_config(duration_seconds=1),
+                state=WorkloadState.RUNNING,
+                start_time=time.monotonic(),
+                smart_poll_interval=0.1,
+            )
+            for i in range(3)
+        ]
+        threads = [
+            threading.Thread(target=backend._poll_smart_loop, args=(wl, ctrl))
+            for wl in workloads
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.3)
+        poll_threads = [t for t in threading.enumerate() if t.name == "pynvme-smart"]
+        for t in threads:
+            t.join(timeout=3)
+
+        assert len(poll_threads) == 1
+        assert all(wl.smart_count >= 2 for wl in workloads)
+        assert backend._smart_poller._entries == {}
+
+    def test_failing_workload_does_not_stop_shared_thread(self, monkeypatch):
+        buf = _build_smart_buffer(composite_k=_KELVIN_OFFSET + 40)
+        ctrl = MagicMock()
+        ctrl.getlogpage.return_value = bytes(buf)
+        ctrl.getfeatures.return_value = 0
+        poller = _SmartPoller()
+        bad, good = (
+            _PynvmeWorkload(
+                workload_id=wid,
+                config=_make_config(),
+                start_time=time.monotonic(),
+                smart_poll_interval=0.05,
+            )
+            for wid in ("wl_bad", "wl_good")
+        )
+        original = poller._record
+
+        def record(wl, snap):
+            if wl is bad:
+                raise RuntimeError("boom")
+            original(wl, snap)
+
+        monkeypatch.setattr(poller, "_record", record)
+        poller.register(bad, ctrl)
+        poller.register(good, ctrl)
+        time.sleep(0.3)
+        poller.unregister("wl_bad")
+        poller.unregister("wl_good")
+
+        assert good.smart_count >= 2
+        deadline = time.monotonic() + 2
+        while poller._thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert poller._thread is None
+
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_thread_slot_cleared_when_loop_dies(self, monkeypatch):
+        poller = _SmartPoller()
+
+        def explode():
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(poller, "_poll_forever", explode)
+        wl = _PynvmeWorkload(workload_id="wl_dies", config=_make_config())
+        poller.register(wl, MagicMock())
+        thread = poller._thread
+        thread.join(timeout=2)
+        assert poller._thread is None
+        poller.unregister("wl_dies")
+
+    def test_shared_poller_batches_history_appends(self):
+        poller = _SmartPoller()
+        wl = _PynvmeWorkload(workload_id="wl_batch", config=_make_config())
+        other = _PynvmeWorkload(workload_id="wl_other", config=_make_config())
+        poller._entries = {wl.workload_id: (wl, None), other.workload_id: (other, None)}
+
+        for _ in range(7):
+            poller._record(wl, _make_snapshot())
+        assert wl.smart_count == 0
+        assert wl.latest_smart is not None
+
+        poller._record(wl, _make_snapshot())
+        assert wl.smart_count == 8
+
+        poller._record(wl, _make_snapshot())
+        poller.unregister(wl.workload_id)
+        assert wl.smart_count == 9
+
+    def test_history_consistent_while_batch_pending(self):
+        poller = _SmartPoller()
+        wl = _PynvmeWorkload(workload_id="wl_hist", config=_make_config())
+        other = _PynvmeWorkload(workload_id="wl_other", config=_make_config())
+        poller._entries = {wl.workload_id: (wl, None), other.workload_id: (other, None)}
+
+        for temp in range(40, 48):
+            poller._record(wl, _make_snapshot(temp=float(temp)))
+        # Two hotter readings still pending in the next batch
+        poller._record(wl, _make_snapshot(temp=90.0))
+        poller._record(wl, _make_snapshot(temp=95.0))
+
+        assert wl.latest_smart.composite_temp_celsius == 95.0
+        history = PynvmeBackend._build_smart_history(wl)
+        assert history.latest is history.snapshots[-1]
+        temps = [s.composite_temp_celsius for s in history.snapshots]
+        assert history.peak_temp_celsius == max(temps) == 47.0
+        assert history.avg_temp_celsius == pytest.approx(sum(temps) / len(temps))
+
+    def test_lone_workload_flushes_every_snapshot(self):
+        poller = _SmartPoller()
+        wl = _PynvmeWorkload(workload_id="wl_lone", config=_make_config())
+        poller._entries = {wl.workload_id: (wl, None)}
+        poller._record(wl, _make_snapshot())
+        assert wl.smart_count == 1
+
+
 # ---------------------------------------------------------------------------
 # 4. Graceful degradation -- get_progress/get_result without SMART data
 # ---------------------------------------------------------------------------
@@ -416,9 +583,9 @@ class TestGracefulDegradation:
             state=WorkloadState.COMPLETED,
             start_time=1000.0,
             end_time=1030.0,
-            smart_snapshots=snaps,
-            latest_smart=snaps[-1],
         )
+        for snap in snaps:
+            wl.add_smart_snapshot(snap)
         backend._workloads["wl_withhist"] = wl
 
         result = backend.get_result("wl_withhist")
@@ -454,3 +621,82 @@ class TestGracefulDegradation:
         assert data["smart_history"] is None
         json_str = result.model_dump_json()
         assert "smart_history" in json_str
+
+
+# ---------------------------------------------------------------------------
+# 5. Shared per-BDF device registry
+# ---------------------------------------------------------------------------
+
+
+class TestPcieRegistry:
+    def _fake_pynvme(self, monkeypatch):
+        fake = MagicMock()
+        monkeypatch.setitem(sys.modules, "pynvme", fake)
+        return fake
+
+    def test_device_shared_and_closed_on_last_release(self, monkeypatch):
+        fake = self._fake_pynvme(monkeypatch)
+        registry = _PcieRegistry()
+
+        first = registry.acquire("0000:01:00.0")
+        second = registry.acquire("0000:01:00.0")
+        assert first is second
+        assert fake.Pcie.call_count == 1
+
+        registry.release("0000:01:00.0")
+        first.pcie.close.assert_not_called()
+        registry.release("0000:01:00.0")
+        first.pcie.close.assert_called_once()
+
+    def test_failed_open_closes_pcie_and_is_not_cached(self, monkeypatch):
+        fake = self._fake_pynvme(monkeypatch)
+        fake.Controller.side_effect = RuntimeError("no controller")
+        registry = _PcieRegistry()
+
+        with pytest.raises(RuntimeError):
+            registry.acquire("0000:01:00.0")
+        fake.Pcie.return_value.close.assert_called_once()
+        assert registry._by_bdf == {}
+
+
+class TestWorkerRegions:
+    def _regions(self, monkeypatch, **overrides) -> list[tuple[int, int] | None]:
+        backend = PynvmeBackend()
+        monkeypatch.setattr(backend, "_poll_smart_loop", lambda wl, ctrl: None)
+        wl = _PynvmeWorkload(workload_id="wl_regions", config=_make_config(**overrides))
+        wl.ns_size = 1000
+        ns = MagicMock()
+        backend._run_ioworkers(wl, ns, MagicMock())
+        regions = []
+        for call in ns.ioworker.call_args_list:
+            kwargs = call.kwargs
+            if "region_start" in kwargs:
+                regions.append((kwargs["region_start"], kwargs["region_end"]))
+            else:
+                regions.append(None)
+        return regions
+
+    def test_single_worker_uses_whole_namespace(self, monkeypatch):
+        assert self._regions(monkeypatch) == [None]
+
+    def test_last_worker_absorbs_remainder(self, monkeypatch):
+        assert self._regions(monkeypatch, num_workers=3) == [(0, 333), (333, 666), (666, 1000)]
+
+    def test_explicit_region_is_split(self, monkeypatch):
+        regions = self._regions(monkeypatch, num_workers=2, region_start=100, region_end=300)
+        assert regions == [(100, 200), (200, 300)]
+
+
+class TestValidateTarget:
+    def test_probe_result_reused_within_ttl(self, monkeypatch):
+        fake = MagicMock()
+        monkeypatch.setitem(sys.modules, "pynvme", fake)
+        backend = PynvmeBackend()
+
+        assert backend.validate_target("0000:01:00.0") is True
+        assert backend.validate_target("0000:01:00.0") is True
+        assert fake.Pcie.call_count == 1
+
+        fake.Pcie.side_effect = RuntimeError("gone")
+        backend._validate_cache["0000:01:00.0"] = (time.monotonic() - 60, True)
+        assert backend.validate_target("0000:01:00.0") is False
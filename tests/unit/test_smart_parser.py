@@ -92,6 +92,12 @@ class TestParseSmartBuffer:
         assert snap.composite_temp_celsius == 0.0
         assert snap.available_spare_pct == 0
 
+    def test_memoryview_input(self):
+        buf = _build_smart_buffer(composite_k=_KELVIN_OFFSET + 45, poh=7)
+        snap = parse_smart_buffer(memoryview(buf))
+        assert snap.composite_temp_celsius == 45.0
+        assert snap.power_on_hours == 7
+
     def test_all_zeros_buffer(self):
         buf = bytes(512)
         snap = parse_smart_buffer(buf)
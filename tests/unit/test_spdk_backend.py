@@ -0,0 +1,78 @@
+"""Unit tests for calypso.workloads.spdk_backend output monitoring."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+
+from calypso.workloads.models import BackendType, WorkloadConfig, WorkloadState
+from calypso.workloads.spdk_backend import _RETAINED_OUTPUT_CHARS, SpdkBackend, _SpdkWorkload
+
+_SCRIPT = """
+import sys, time
+print("Total : 100.0 IOPS 0.39 MiB/s", flush=True)
+time.sleep(0.6)
+print("Total : 250.0 IOPS 0.98 MiB/s", flush=True)
+print("some warning", file=sys.stderr, flush=True)
+"""
+
+
+def _spawn(script: str) -> _SpdkWorkload:
+    proc = subprocess.Popen(
+        [sys.executable, "-c", script], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    return _SpdkWorkload(
+        workload_id="wl_spdk",
+        config=WorkloadConfig(backend=BackendType.SPDK, target_bdf="0000:01:00.0"),
+        process=proc,
+        state=WorkloadState.RUNNING,
+        start_time=time.monotonic(),
+    )
+
+
+class TestMonitorProcess:
+    def test_live_progress_then_final_stats(self):
+        backend = SpdkBackend()
+        wl = _spawn(_SCRIPT)
+        backend._workloads[wl.workload_id] = wl
+        monitor = threading.Thread(target=backend._monitor_process, args=(wl,))
+        monitor.start()
+
+        deadline = time.monotonic() + 3
+        while wl.current_iops == 0.0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        progress = backend.get_progress(wl.workload_id)
+        assert progress.current_iops == 100.0
+        assert progress.state == WorkloadState.RUNNING
+
+        monitor.join(timeout=5)
+        assert wl.state == WorkloadState.COMPLETED
+        assert wl.stats.iops_total == 250.0
+        assert "some warning" in wl.stderr_text
+
+    def test_nonzero_exit_reports_stderr(self):
+        backend = SpdkBackend()
+        wl = _spawn("import sys; print('bad bdf', file=sys.stderr); sys.exit(3)")
+        backend._monitor_process(wl)
+        assert wl.state == WorkloadState.FAILED
+        assert "code 3" in wl.error
+        assert "bad bdf" in wl.error
+
+    def test_long_output_keeps_only_tail(self):
+        backend = SpdkBackend()
+        wl = _spawn(
+            "import sys\n"
+            "for i in range(20000):\n"
+            "    print(f'line {i:05d} padding padding padding')\n"
+            "    print(f'err {i:05d} padding padding padding', file=sys.stderr)\n"
+            "print('Total : 300.0 IOPS 1.17 MiB/s')\n"
+        )
+        backend._monitor_process(wl)
+        assert wl.state == WorkloadState.COMPLETED
+        assert wl.stats.iops_total == 300.0
+        assert len(wl.stdout_text) <= _RETAINED_OUTPUT_CHARS
+        assert len(wl.stderr_text) <= _RETAINED_OUTPUT_CHARS
+        assert "line 00000" not in wl.stdout_text
+        assert "err 19999" in wl.stderr_text
@@ -0,0 +1,41 @@
+"""Unit tests for calypso.workloads.affinity."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from calypso.workloads import affinity
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    affinity.housekeeping_cpus.cache_clear()
+    yield
+    affinity.housekeeping_cpus.cache_clear()
+
+
+class TestHousekeepingCpus:
+    def test_unset_means_no_pinning(self, monkeypatch):
+        monkeypatch.delenv("CALYPSO_HOUSEKEEPING_CPUS", raising=False)
+        assert affinity.housekeeping_cpus() is None
+
+    def test_parses_comma_list(self, monkeypatch):
+        monkeypatch.setenv("CALYPSO_HOUSEKEEPING_CPUS", "0, 2,")
+        assert affinity.housekeeping_cpus() == frozenset({0, 2})
+
+    def test_invalid_value_ignored(self, monkeypatch):
+        monkeypatch.setenv("CALYPSO_HOUSEKEEPING_CPUS", "zero")
+        assert affinity.housekeeping_cpus() is None
+
+    def test_pin_applies_affinity(self, monkeypatch):
+        calls = []
+
+        def fake_setaffinity(pid, cpus):
+            calls.append(cpus)
+
+        monkeypatch.setenv("CALYPSO_HOUSEKEEPING_CPUS", "1")
+        monkeypatch.setattr(os, "sched_setaffinity", fake_setaffinity, raising=False)
+        affinity.pin_housekeeping_thread()
+        assert calls == [frozenset({1})]
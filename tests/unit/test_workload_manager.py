@@ -0,0 +1,154 @@
+"""Unit tests for calypso.workloads.manager."""
+
+from __future__ import annotations
+
+import pytest
+
+from calypso.workloads.base import WorkloadBackend
+from calypso.workloads.exceptions import WorkloadAlreadyRunning
+from calypso.workloads.manager import WorkloadManager
+from calypso.workloads.models import (
+    BackendType,
+    WorkloadConfig,
+    WorkloadProgress,
+    WorkloadResult,
+    WorkloadState,
+)
+
+
+class _FakeBackend(WorkloadBackend):
+    def __init__(self) -> None:
+        self.running: dict[str, WorkloadConfig] = {}
+        self.configs: dict[str, WorkloadConfig] = {}
+        self._next = 0
+
+    def validate_target(self, bdf: str) -> bool:
+        return True
+
+    def start(self, config: WorkloadConfig) -> str:
+        self._next += 1
+        workload_id = f"wl{self._next}"
+        self.running[workload_id] = config
+        self.configs[workload_id] = config
+        return workload_id
+
+    def stop(self, workload_id: str) -> None:
+        self.running.pop(workload_id, None)
+
+    def get_result(self, workload_id: str) -> WorkloadResult:
+        state = WorkloadState.RUNNING if workload_id in self.running else WorkloadState.COMPLETED
+        return WorkloadResult(
+            workload_id=workload_id, config=self.configs[workload_id], state=state
+        )
+
+    def get_progress(self, workload_id: str) -> WorkloadProgress:
+        return WorkloadProgress(workload_id=workload_id)
+
+    def is_running(self, workload_id: str) -> bool:
+        return workload_id in self.running
+
+    @property
+    def backend_name(self) -> str:
+        return "fake"
+
+
+@pytest.fixture
+def manager():
+    mgr = WorkloadManager()
+    mgr._initialized = True
+    mgr._backends[BackendType.SPDK] = _FakeBackend()
+    return mgr
+
+
+def _config(bdf: str = "0000:01:00.0") -> WorkloadConfig:
+    return WorkloadConfig(backend=BackendType.SPDK, target_bdf=bdf)
+
+
+class TestWorkloadManager:
+    def test_duplicate_bdf_rejected_while_running(self, manager):
+        manager.start_workload(_config())
+        with pytest.raises(WorkloadAlreadyRunning):
+            manager.start_workload(_config())
+
+    def test_bdf_reusable_after_stop(self, manager):
+        first = manager.start_workload(_config())
+        manager.stop_workload(first.workload_id)
+        second = manager.start_workload(_config())
+        assert second.workload_id != first.workload_id
+
+    def test_stopping_stale_workload_keeps_new_bdf_owner(self, manager):
+        backend = manager._backends[BackendType.SPDK]
+        first = manager.start_workload(_config())
+        backend.running.clear()  # first finishes on its own
+        manager.start_workload(_config())
+        manager.stop_workload(first.workload_id)
+        with pytest.raises(WorkloadAlreadyRunning):
+            manager.start_workload(_config())
+
+    def test_bdf_reserved_while_backend_starts(self, manager):
+        backend = manager._backends[BackendType.SPDK]
+        real_start = backend.start
+        errors = []
+
+        def start_and_race(config):
+            try:
+                manager.start_workload(_config())
+            except WorkloadAlreadyRunning as exc:
+                errors.append(exc)
+            return real_start(config)
+
+        backend.start = start_and_race
+        manager.start_workload(_config())
+        assert len(errors) == 1
+
+    def test_failed_start_releases_bdf(self, manager):
+        backend = manager._backends[BackendType.SPDK]
+        real_start = backend.start
+
+        def failing_start(config):
+            raise RuntimeError("spawn failed")
+
+        backend.start = failing_start
+        with pytest.raises(RuntimeError):
+            manager.start_workload(_config())
+        backend.start = real_start
+        assert manager.start_workload(_config()).workload_id == "wl1"
+
+    def test_list_workloads(self, manager):
+        manager.start_workload(_config("0000:01:00.0"))
+        manager.start_workload(_config("0000:02:00.0"))
+        ids = {s.workload_id for s in manager.list_workloads()}
+        assert ids == {"wl1", "wl2"}
+
+    def test_list_workloads_does_not_take_lock(self, manager):
+        manager.start_workload(_config())
+        with manager._lock:
+            assert [s.workload_id for s in manager.list_workloads()] == ["wl1"]
+
+    def test_finished_status_is_cached(self, manager):
+        wl_id = manager.start_workload(_config()).workload_id
+        assert manager.get_status(wl_id).state == WorkloadState.RUNNING
+        manager.stop_workload(wl_id)
+        first = manager.get_status(wl_id)
+        assert first.state == WorkloadState.COMPLETED
+        manager._backends[BackendType.SPDK].configs.clear()
+        assert manager.get_status(wl_id) is first
+        assert manager.list_workloads() == [first]
+
+
+    def test_stop_replaces_cached_failed_status(self, manager):
+        backend = manager._backends[BackendType.SPDK]
+        wl_id = manager.start_workload(_config()).workload_id
+        real_get_result = backend.get_result
+
+        def result_as(state):
+            return lambda workload_id: real_get_result(workload_id).model_copy(
+                update={"state": state}
+            )
+
+        # A poll sees the signalled process exit before stop() settles the state
+        backend.get_result = result_as(WorkloadState.FAILED)
+        assert manager.get_status(wl_id).state == WorkloadState.FAILED
+        backend.get_result = result_as(WorkloadState.STOPPED)
+        assert manager.stop_workload(wl_id).state == WorkloadState.STOPPED
+        assert manager.get_status(wl_id).state == WorkloadState.STOPPED
@@ -0,0 +1,31 @@
+"""Unit tests for calypso.workloads.models."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from calypso.workloads.models import BackendType, WorkloadConfig
+
+
+class TestWorkloadConfig:
+    @pytest.mark.parametrize("bdf", ["0000:01:00.0", "ABCD:ef:1F.7"])
+    def test_valid_bdf(self, bdf):
+        assert WorkloadConfig(backend=BackendType.SPDK, target_bdf=bdf).target_bdf == bdf
+
+    @pytest.mark.parametrize(
+        "bdf", ["", "01:00.0", "0000:01:00.8", "0000-01:00.0", "000g:01:00.0", "0000:01:00.00"]
+    )
+    def test_invalid_bdf(self, bdf):
+        with pytest.raises(ValidationError, match="Invalid PCIe BDF"):
+            WorkloadConfig(backend=BackendType.SPDK, target_bdf=bdf)
+
+    @pytest.mark.parametrize("mask", ["0x", "xFF", "0xFG", "FF"])
+    def test_invalid_core_mask(self, mask):
+        with pytest.raises(ValidationError, match="Invalid core mask"):
+            WorkloadConfig(backend=BackendType.SPDK, target_bdf="0000:01:00.0", core_mask=mask)
+
+    def test_frozen(self):
+        config = WorkloadConfig(backend=BackendType.SPDK, target_bdf="0000:01:00.0")
+        with pytest.raises(ValidationError):
+            config.queue_depth = 1
@@ -0,0 +1,38 @@
+"""Unit tests for workload backend probing and IDs in calypso.workloads."""
+
+from __future__ import annotations
+
+import os
+import shutil
+
+from calypso import workloads
+from calypso.workloads.base import new_workload_id
+
+
+class TestAvailableBackends:
+    def setup_method(self):
+        workloads.flush_backend_cache()
+
+    def teardown_method(self):
+        workloads.flush_backend_cache()
+
+    def test_result_is_cached(self, monkeypatch):
+        monkeypatch.setattr(shutil, "which", lambda name: "/usr/bin/" + name)
+        first = workloads.available_backends()
+        monkeypatch.setattr(shutil, "which", lambda name: None)
+        assert workloads.available_backends() is first
+        assert "spdk" in first
+
+    def test_flush_cache_reprobes(self, monkeypatch):
+        monkeypatch.setattr(shutil, "which", lambda name: "/usr/bin/" + name)
+        assert "spdk" in workloads.available_backends()
+        monkeypatch.setattr(shutil, "which", lambda name: None)
+        assert "spdk" not in workloads.available_backends(flush_cache=True)
+        assert workloads.is_spdk_available() is False
+
+
+class TestNewWorkloadId:
+    def test_ids_unique_and_prefixed(self):
+        ids = {new_workload_id() for _ in range(100)}
+        assert len(ids) == 100
+        assert all(wid.startswith(f"wl_{os.getpid():x}_") for wid in ids)